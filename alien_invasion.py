@@ -1,48 +1,41 @@
+import argparse
+
+from src.startup_profiler import startup_profiler
+
+# Parsed before the other imports, so that --profile-startup can time them.
+parser = argparse.ArgumentParser(description="Alien Invasion")
+parser.add_argument("--profile-startup", nargs="?", const="", default=None, metavar="JSON",
+                    help="print where launch time goes, and write it to JSON if a path is given")
+args = parser.parse_args()
+if args.profile_startup is not None:
+    startup_profiler.start()
+
 import logging
 import pygame
-from pygame.sprite import Group
 
 import src.game_functions as gf
 from src.entities.ui.elements.button import Button as btn
-from src.entities.ui.elements.scoreboard import Scoreboard
 from src.resources.texture_atlas import TextureAtlas
-from src.game_functions import generate_heart
-from src.game_stats import GameStats
-from src.health import Health
+from src.resources.texture_cache import texture_cache
 from src.input import Input
+from src import settings
 from src.settings import SCREEN_HEIGHT, SCREEN_WIDTH, Settings
-from src.ship import Ship
 from src.log_manager import LogManager
-from src.region import Region, RegionManager
+from src.region import RegionManager, init_regions
+from src.simulation import Simulation
+from src.timestep import FixedTimestep, RenderInterpolator
+from src.bullet import alien_bullet_pool, ship_bullet_pool
 from src.recorder import Recorder
+from src.recording.snapshots import SnapshotRecorder
 from src.ai_manager_combined import AIManager
 # NOTE: legacy implementations preserved in `src/ai_manager.py` and `src/ai_manager_new.py`.
 
 
-def init_regions(screen: pygame.Surface) -> RegionManager:
-    size: tuple[int, int] = screen.get_size()
-
-    return RegionManager(size,
-        Region("Starfield Stage - 1", "starfield/1.png", 0, size),
-        Region("Starfield Stage - 2", "starfield/2.png", 200, size),
-        Region("Starfield Stage - 3", "starfield/3.png", 400, size),
-        Region("Starfield Stage - 4", "starfield/4.png", 600, size),
-        Region("Starfield Stage - 5", "starfield/5.png", 800, size),
-        Region("Verdant Expanse Stage - 1", "verdant expanse/1.png", 1100, size),
-        Region("Verdant Expanse Stage - 2", "verdant expanse/2.png", 1400, size),
-        Region("Verdant Expanse Stage - 3", "verdant expanse/3.png", 1700, size),
-        Region("Verdant Expanse Stage - 4", "verdant expanse/4.png", 2000, size),
-        Region("Verdant Expanse Stage - 5", "verdant expanse/5.png", 2300, size),
-        Region("Violet Void Stage - 1", "violet void/1.png", 2700, size),
-        Region("Violet Void Stage - 2", "violet void/2.png", 3100, size),
-        Region("Violet Void Stage - 3", "violet void/3.png", 3500, size),
-        Region("Violet Void Stage - 4", "violet void/4.png", 3900, size),
-        Region("Violet Void Stage - 5", "violet void/5.png", 4300, size)
-    )
-
 def run_game():
-    LogManager.init()
-    pygame.init()
+    with startup_profiler.phase("LogManager.init"):
+        LogManager.init()
+    with startup_profiler.phase("pygame.init"):
+        pygame.init()
 
     logger = logging.getLogger(__name__)
 
@@ -52,37 +45,44 @@ def run_game():
     input = Input()
 
     # AI manager: will auto-train in background and provide predictions/acts
-    ai_manager = AIManager(models_dir="models", trainer_cmd=["python", "tools/train_imitation.py"], auto_train_interval=120)
+    with startup_profiler.phase("AIManager"):
+        ai_manager = AIManager(
+            models_dir="models", trainer_cmd=["python", "tools/train_imitation.py"], auto_train_interval=120
+        )
     ai_manager._idle_frames = 0
     import atexit
     atexit.register(lambda: ai_manager.stop())
+    atexit.register(lambda: logger.info(f"{ship_bullet_pool.report()}; {alien_bullet_pool.report()}"))
+    atexit.register(lambda: logger.info(texture_cache.report()))
 
-    screen: pygame.Surface = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    with startup_profiler.phase("pygame.display.set_mode"):
+        screen: pygame.Surface = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-    TextureAtlas.initialize()
+    # Sounds decode in the background while the atlases load.
+    with startup_profiler.phase("gf.load_sounds"):
+        gf.load_sounds()
+    with startup_profiler.phase("TextureAtlas.initialize"):
+        TextureAtlas.initialize()
     logger.info("Initializing region manager")
-    region_manager: RegionManager = init_regions(screen)
+    with startup_profiler.phase("init_regions"):
+        region_manager: RegionManager = init_regions(screen)
 
     pygame.display.set_caption("Alien Invasion")
 
     clock = pygame.time.Clock()
-    alien_spawn_timer = pygame.time.get_ticks()
 
-    # Create an instance to store game statistics and create scoreboard.
-    stats = GameStats()
-    sb = Scoreboard(screen, stats)
-
-    health = Health()
-    health.reset()
+    # The simulation owns the game statistics, scoreboard, health, ship and a group for each game sprite.
+    with startup_profiler.phase("Simulation"):
+        sim = Simulation(ai_settings, input, region_manager, start_ms=pygame.time.get_ticks())
+    stats, sb, health, ship = sim.stats, sim.sb, sim.health, sim.ship
+    bullets, aliens, cargoes = sim.bullets, sim.aliens, sim.cargoes
+    alien_bullets, hearts, shields = sim.alien_bullets, sim.hearts, sim.shields
+    sprite_groups = (bullets, alien_bullets, aliens, cargoes, hearts, shields)
 
-    # Make a ship, and a group for each game sprite.
-    ship = Ship(input)
-    bullets = Group()
-    aliens = Group()
-    cargoes = Group()
-    alien_bullets = Group()
-    hearts = Group()
-    shields = Group()
+    # Real frame time is simulated in fixed steps; drawing is interpolated between the last two.
+    timestep = FixedTimestep(sim.frame_ms)
+    interpolator = RenderInterpolator()
+    frame_ms = sim.frame_ms
 
     play_button = btn(
         "start",
@@ -108,21 +108,39 @@ def run_game():
         lambda: stats.credits_active,
     )
 
-    alien_spawn_counter = 0
-
-    gf.load_animations(screen)
-    gf.load_credits()
+    with startup_profiler.phase("gf.load_animations"):
+        gf.load_animations(screen)
+    with startup_profiler.phase("gf.load_renderer"):
+        gf.load_renderer(screen)
+    with startup_profiler.phase("gf.load_credits"):
+        gf.load_credits()
 
     logger.info("Game started")
 
-    # Initialize recorder (will create data/gameplay_log.csv)
+    # Initialize recorder (will create data/recording/)
     try:
-        recorder = Recorder("data/gameplay_log.csv")
+        with startup_profiler.phase("Recorder"):
+            recorder = Recorder(settings.RECORDING_PATH)
         logger.info("Recorder initialized")
     except Exception:
         recorder = None
         logger.exception("Failed to initialize Recorder")
 
+    snapshots = None
+    if settings.SNAPSHOTS_ENABLED:
+        try:
+            with startup_profiler.phase("SnapshotRecorder"):
+                snapshots = SnapshotRecorder(settings.SNAPSHOT_PATH)
+        except Exception:
+            logger.exception("Failed to initialize SnapshotRecorder")
+
+    if startup_profiler.running:
+        startup_profiler.finish()
+        print(startup_profiler.report())
+        if args.profile_startup:
+            startup_profiler.write_json(args.profile_startup)
+            logger.info(f"Startup profile written to {args.profile_startup}")
+
     # Start the main loop for the game.
     idle_timeout_seconds = 2.0
     last_active_time = pygame.time.get_ticks()
@@ -212,6 +230,11 @@ def run_game():
         except Exception:
             # Never let recorder break the game loop
             logger.exception("Recorder failed during record()")
+        try:
+            if snapshots is not None and stats.game_active:
+                snapshots.record(ship, sprite_groups)
+        except Exception:
+            logger.exception("SnapshotRecorder failed during record()")
 
         # (AI toggle handled earlier immediately after input.update())
 
@@ -264,9 +287,20 @@ def run_game():
                     )
                 except Exception:
                     pass
+        else:
+            pygame.event.set_grab(False)
 
-            # Update game sprites (ship.update will read movement flags set by AI)
-            gf.update_game_sprites(
+        # Update game sprites, background and spawn timers for the time the last frame took
+        # (ship.update will read movement flags set by AI).
+        steps = timestep.advance(frame_ms)
+        for step in range(steps):
+            if step == steps - 1:
+                interpolator.snapshot(ship, sprite_groups)
+            sim.step()
+
+        with interpolator.apply(timestep.alpha, ship, sprite_groups):
+            gf.update_screen(
+                region_manager,
                 ai_settings,
                 screen,
                 stats,
@@ -274,69 +308,21 @@ def run_game():
                 ship,
                 aliens,
                 bullets,
+                play_button,
+                credits_button,
+                back_button,
                 cargoes,
                 alien_bullets,
                 health,
                 hearts,
                 shields,
+                # AI status at bottom-left
+                status_text=f"AI: {'ON' if ai_manager.ai_enabled else 'OFF'}",
+                # Animations and the shield timer run on simulated time, like the sprites.
+                elapsed_ms=steps * timestep.step_ms,
             )
-        else:
-            pygame.event.set_grab(False)
-
-        gf.update_screen(
-            region_manager,
-            ai_settings,
-            screen,
-            stats,
-            sb,
-            ship,
-            aliens,
-            bullets,
-            play_button,
-            credits_button,
-            back_button,
-            cargoes,
-            alien_bullets,
-            health,
-            hearts,
-            shields,
-        )
 
-        # Draw AI status at bottom-left
-        try:
-            from src import settings as _settings
-            font = _settings.FONT
-            status_text = f"AI: {'ON' if ai_manager.ai_enabled else 'OFF'}"
-            surf = font.render(status_text, True, (255, 255, 255))
-            screen.blit(surf, (10, screen.get_height() - surf.get_height() - 10))
-            pygame.display.update()
-        except Exception:
-            pass
-
-        clock.tick(ai_settings.fps)
-
-        # Aliens fire timer
-        current_time = pygame.time.get_ticks()
-
-        if region_manager.can_spawn_objects():
-            if current_time - alien_spawn_timer > 100:
-                gf.alien_fire(ai_settings, stats, screen, aliens, alien_bullets, ship)
-
-                generate_heart(stats, screen, hearts)
-                gf.generate_shields(screen, ai_settings, stats, shields)
-
-                if alien_spawn_counter % 10 == 0:
-                    gf.spawn_random_alien(ai_settings, screen, aliens)
-
-                alien_spawn_counter += 1
-                alien_spawn_timer = current_time
-        else:
-            bullets.empty()
-            aliens.empty()
-            alien_bullets.empty()
-            cargoes.empty()
-            hearts.empty()
-            shields.empty()
+        frame_ms = clock.tick(ai_settings.fps)
 
 
 run_game()
@@ -10,6 +10,9 @@ AIManager that:
    and recorder-compatible.
  - Falls back to the heuristic firing behavior if no models are found or
    if model prediction errors occur.
+ - Loads the ML stack (joblib/sklearn) only when the AI is first enabled,
+   on a background thread; until `model_state` is READY the heuristic
+   firing is used, so launching the game never waits for sklearn.
 
 The AI emulates input by writing into the provided `input` object:
 `previous_key_states`, `current_key_states`, `previous_mouse_button_states`,
@@ -27,13 +30,23 @@ from typing import Optional
 import atexit
 import sys
 import math
+from enum import StrEnum
 
-import joblib
+import numpy as np
 import pygame
 
 from . import settings
 
 
+class ModelState(StrEnum):
+    """Where the firing models are in their (deferred) loading."""
+
+    NOT_LOADED = "not_loaded"  # nothing requested yet
+    LOADING = "loading"  # loading on the background thread
+    READY = "ready"  # at least one model loaded
+    UNAVAILABLE = "unavailable"  # no model could be loaded; heuristic only
+
+
 class AIManager:
     """Unified AI manager.
 
@@ -45,6 +58,9 @@ class AIManager:
         self.models_dir = Path(models_dir)
         self.models: dict = {}
         self.models_ok = True
+        self.model_state = ModelState.NOT_LOADED
+        self._model_thread = None
+        self._model_lock = threading.Lock()
         self._model_error_count = 0
         self._model_error_threshold = 8
 
@@ -58,8 +74,7 @@ class AIManager:
         self.ai_enabled = False
         self._auto_enabled = False
 
-        # load any models present
-        self.load_models()
+        # Models are loaded on first enable, see request_models().
 
         # start trainer thread only if a trainer command was provided
         if self.trainer_cmd:
@@ -73,21 +88,56 @@ class AIManager:
 
     # --------------------- model loading / trainer ---------------------
     def load_models(self):
-        for name in ("logreg", "rf", "knn"):
-            path = self.models_dir / f"{name}.joblib"
-            if path.exists():
-                try:
-                    self.models[name] = joblib.load(path)
-                except Exception:
-                    self.models[name] = None
-            else:
-                self.models[name] = None
+        """Load any models present. Blocks: unpickling the pipelines imports sklearn."""
+        with self._model_lock:
+            models = {}
+            try:
+                import joblib
+            except Exception:
+                joblib = None
+            for name in ("logreg", "rf", "knn"):
+                path = self.models_dir / f"{name}.joblib"
+                models[name] = None
+                if joblib is not None and path.exists():
+                    try:
+                        models[name] = joblib.load(path)
+                    except Exception:
+                        models[name] = None
+
+            # Swap the whole dict so act() never sees a half-loaded set.
+            self.models = models
+            loaded = any(model is not None for model in models.values())
+            self.model_state = ModelState.READY if loaded else ModelState.UNAVAILABLE
+
+    def request_models(self):
+        """Start loading the models on a background thread, once."""
+        if self.model_state is not ModelState.NOT_LOADED:
+            return
+        self.model_state = ModelState.LOADING
+        try:
+            self._model_thread = threading.Thread(target=self.load_models, name="ai-models", daemon=True)
+            self._model_thread.start()
+        except Exception:
+            self._model_thread = None
+            self.model_state = ModelState.UNAVAILABLE
+
+    def wait_for_models(self, timeout: Optional[float] = None) -> bool:
+        """Block until a requested load finished; returns True if models are ready."""
+        if self._model_thread is not None:
+            self._model_thread.join(timeout)
+        return self.model_state is ModelState.READY
+
+    @property
+    def models_ready(self) -> bool:
+        return self.model_state is ModelState.READY
 
     def _trainer_loop(self):
         while not self._stop_trainer:
             try:
                 subprocess.run(self.trainer_cmd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                self.load_models()
+                # Pick up retrained models, but don't load sklearn for a player who never used the AI.
+                if self.model_state is not ModelState.NOT_LOADED:
+                    self.load_models()
             except Exception:
                 pass
             time.sleep(self.auto_train_interval)
@@ -103,6 +153,8 @@ class AIManager:
     def set_enabled(self, value: bool, auto: bool = False):
         self.ai_enabled = bool(value)
         self._auto_enabled = bool(auto)
+        if self.ai_enabled:
+            self.request_models()
 
     def was_auto_enabled(self) -> bool:
         return bool(self._auto_enabled)
@@ -169,8 +221,6 @@ class AIManager:
             if model is None:
                 return False
 
-            import numpy as np
-
             X = np.array(feat, dtype=float).reshape(1, -1)
             try:
                 p = model.predict(X)
@@ -369,7 +419,7 @@ class AIManager:
                 pass
 
             # Decide whether to fire using ML if available, otherwise use heuristic
-            use_ml = any(self.models.get(n) is not None for n in ("logreg", "rf", "knn")) and self.models_ok
+            use_ml = self.models_ready and self.models_ok
             should_fire_ml = False
             if use_ml:
                 try:
@@ -1,15 +1,35 @@
 import pygame
 import math
+import numpy as np
 from abc import ABC, abstractmethod
 from random import randint
-from pygame.sprite import Sprite
-
+from pygame.sprite import Group, Sprite
+
+from src.entity_store import (
+    TYPE_ALIEN_L1,
+    TYPE_ALIEN_L2,
+    TYPE_CARGO_ALIEN,
+    StoreBacked,
+    StoreField,
+    clamp_coords,
+    round_coords,
+)
+from src.resources.rotation_cache import rotation_cache
 from src.resources.texture_atlas import TextureAtlas
+from src.resources.texture_cache import texture_cache
 
 
-class Alien(ABC, Sprite):
+class Alien(StoreBacked, ABC, Sprite):
     """An abstract class to create aliens."""
 
+    # Kept in the EntityStore while the alien is in an EntityGroup.
+    x = StoreField()
+    y = StoreField()
+    vx = StoreField()
+    vy = StoreField()
+    angle = StoreField()
+    health = StoreField()
+
     def __init__(self, ai_settings, screen, health):
         """Initialize the alien and set its starting position."""
         super(Alien, self).__init__()
@@ -45,7 +65,11 @@ class Alien(ABC, Sprite):
         return None
 
     def update(self, ship):
-        """Move the alien."""
+        """Move the alien.
+
+        Reference implementation of the steering step; aliens in an EntityGroup are moved
+        all at once by `steer_aliens`, which must stay in sync with this method.
+        """
 
         # Calculate the distance between the alien and the ship.
         delta_x = ship.rect.centerx - self.rect.centerx
@@ -77,15 +101,20 @@ class Alien(ABC, Sprite):
         self.rect.y = self.y
 
         # Rotate the alien to face the ship.
-        self.image = pygame.transform.rotate(self.original_image, self.angle + 90)
+        self.image = rotation_cache.get(self.texture, self.original_image, self.angle + 90).surface
 
         # Keep the alien within the screen bounds.
         screen_rect = self.screen.get_rect()
         self.rect.clamp_ip(screen_rect)
 
-    def blit(self):
-        """Draw the alien at its current location."""
-        self.screen.blit(self.image, self.rect)
+    def blit(self) -> pygame.Rect:
+        """Draw the alien at its current location; return the rect of the (rotated) image drawn."""
+        return self.screen.blit(self.image, self.rect)
+
+    @property
+    @abstractmethod
+    def texture(self) -> str:
+        """Atlas path of the alien's texture, also its key in the rotation cache."""
 
     @abstractmethod
     def get_image(self):
@@ -95,6 +124,9 @@ class Alien(ABC, Sprite):
 class CargoAlien(Alien):
     """A class to represent a single cargo alien."""
 
+    type_id = TYPE_CARGO_ALIEN
+    texture = "alien/alien_cargo.png"
+
     def __init__(self, ai_settings, screen):
         super().__init__(ai_settings, screen, ai_settings.alien_l1_health)
 
@@ -106,29 +138,86 @@ class CargoAlien(Alien):
         self.rect.y -= self.ai_settings.cargo_speed_facto
 
     def get_image(self):
-        image = TextureAtlas.get_sprite_texture("alien/alien_cargo.png")
-        image_size = image.get_size()
-        return pygame.transform.scale(image, (image_size[0] * 0.2, image_size[1] * 0.2))
+        width, height = TextureAtlas.get_sprite_texture(self.texture).get_size()
+        return texture_cache.get(self.texture, (width * 0.2, height * 0.2))
 
 
 class AlienL1(Alien):
     """A class to represent a single alien."""
 
+    type_id = TYPE_ALIEN_L1
+    texture = "alien/alien_l1.png"
+
     def __init__(self, ai_settings, screen):
         super().__init__(ai_settings, screen, ai_settings.alien_l1_health)
 
     def get_image(self):
-        image = TextureAtlas.get_sprite_texture("alien/alien_l1.png")
-        return pygame.transform.rotate(image, 180)
+        return texture_cache.get(self.texture, rotation=180)
 
 
 class AlienL2(Alien):
     """A class to represent a single alien."""
 
+    type_id = TYPE_ALIEN_L2
+    texture = "alien/alien_l2.png"
+
     def __init__(self, ai_settings, screen):
         super().__init__(ai_settings, screen, ai_settings.alien_l2_health)
 
     def get_image(self):
-        image = TextureAtlas.get_sprite_texture("alien/alien_l2.png")
-        image = pygame.transform.scale(image, (60, 57))
-        return pygame.transform.rotate(image, 180)
+        return texture_cache.get(self.texture, (60, 57), rotation=180)
+
+
+def steer_aliens(aliens: Group, ship, ai_settings) -> None:
+    """Batched Alien.update: turn every alien towards the ship and move it in one NumPy pass."""
+    store = getattr(aliens, "store", None)
+    if store is None:
+        aliens.update(ship)
+        return
+
+    slots = store.slots()
+    if not len(slots):
+        return
+
+    try:
+        speed = float(ai_settings.alien_speed_factor)
+    except Exception:
+        speed = 0.0
+    dt = getattr(ai_settings, "delta_time", 1.0)
+
+    width = store.width[slots]
+    height = store.height[slots]
+
+    # Target angle of movement from each alien's rect center to the ship.
+    delta_x = ship.rect.centerx - (store.left[slots] + width // 2)
+    delta_y = ship.rect.centery - (store.top[slots] + height // 2)
+    target_angle = np.arctan2(delta_y, delta_x)
+    target_angle_deg = -np.degrees(target_angle)
+
+    # Smoothly adjust the angles.
+    angle = store.angle[slots]
+    angle_diff = np.mod(target_angle_deg - angle, 360)
+    angle_diff = np.where(angle_diff > 180, angle_diff - 360, angle_diff)
+    angle = angle + angle_diff * 0.1
+    store.angle[slots] = angle
+
+    # Per-second velocity and frame-scaled displacement.
+    vx = np.cos(target_angle) * speed
+    vy = np.sin(target_angle) * speed
+    store.vx[slots] = vx
+    store.vy[slots] = vy
+    x = store.x[slots] + vx * dt
+    y = store.y[slots] + vy * dt
+    store.x[slots] = x
+    store.y[slots] = y
+
+    # Keep the aliens within the screen bounds.
+    left = clamp_coords(round_coords(x), width, ai_settings.screen_width)
+    top = clamp_coords(round_coords(y), height, ai_settings.screen_height)
+    store.sync_rects(slots, left, top)
+
+    # Rotate the aliens to face the ship.
+    sprites = store.sprites
+    for slot, rotation in zip(slots.tolist(), (angle + 90).tolist()):
+        alien = sprites[slot]
+        alien.image = rotation_cache.get(alien.texture, alien.original_image, rotation).surface
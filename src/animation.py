@@ -1,42 +1,77 @@
-import time
+from dataclasses import dataclass
+
 import pygame
 from src.settings import Settings
 from src.resources.texture_atlas import TextureAtlas
+from src.resources.texture_cache import texture_cache
 
 settings = Settings()
 
+# Shortest frame duration: one frame per rendered game frame.
+MIN_FRAME_TIME: float = 1000.0 / settings.fps
+
+
+@dataclass
+class AnimationInstance:
+    """One playing copy of an animation."""
+
+    x: int
+    y: int
+    elapsed: float = 0.0  # game time since start, in milliseconds
+
 
 class Animation:
-    def __init__(self, frame_path, frame_count, screen, latency=0.001, divider=4, visibility=True, alpha=100):
+    """A frame sequence loaded from the animations atlas, played back on game time.
+
+    Nothing here blocks or presents: `play()` starts a new one-shot instance at the current position (any number of
+    them can run at once, e.g. one per explosion), `update()` advances every instance by the elapsed game time and
+    `draw()` blits the current frame of each. An animation created with `loop=True` also loops at `set_position()` while
+    it is visible.
+    """
+
+    def __init__(
+        self, frame_path, frame_count, screen, latency=0.001, divider=4, visibility=True, alpha=100, loop=False
+    ):
         self.settings = Settings()
         self.animation_frames = []
         self.animation_rects = []
         self.screen = screen
 
         self.animation_visibility = visibility
+        self.loop = loop
 
         self.animation_position_x = 0
         self.animation_position_y = 0
 
-        self.animation_latency = latency
+        # Time each frame stays on screen, in milliseconds of game time.
+        self.frame_time = max(latency * 1000, MIN_FRAME_TIME)
 
         # Time based animations variables
         self.timer_status = False
-        self.animation_duration = 0
-        self.animation_started_time = 0
+        self.animation_duration = 0  # seconds
+        self.animation_elapsed = 0  # milliseconds
         self.terminate_sound = None
 
+        # Running one-shot instances and the looping playback clock.
+        self.instances: list[AnimationInstance] = []
+        self.loop_elapsed = 0.0
+
         temp_path = frame_path
         for i in range(1, frame_count + 1):
             temp_path = temp_path + f"/f{i}.png"
-            loaded_frame = TextureAtlas.get_animation_frame(temp_path)
-            loaded_frame = pygame.transform.scale(loaded_frame, (loaded_frame.get_width() / divider,
-                                                                 loaded_frame.get_height() / divider))
-            loaded_frame.set_alpha(alpha)
+            width, height = TextureAtlas.get_animation_frame(temp_path).get_size()
+            loaded_frame = texture_cache.get(
+                temp_path, (width / divider, height / divider), alpha=alpha, animation=True
+            )
             self.animation_frames.append(loaded_frame)
             self.animation_rects.append((loaded_frame.get_rect()))
             temp_path = frame_path  # reset to actual path.
 
+    @property
+    def duration(self) -> float:
+        """Length of one pass through all frames, in milliseconds."""
+        return self.frame_time * len(self.animation_frames)
+
     def set_position(self, x, y):
         self.animation_position_x = x
         self.animation_position_y = y
@@ -46,23 +81,38 @@ class Animation:
         if timer:
             self.timer_status = True
             self.animation_duration = duration
-            self.animation_started_time = time.time()
+            self.animation_elapsed = 0
             self.terminate_sound = terminate_sound
 
     def play(self):
+        """Start a new one-shot instance at the current position."""
+        self.instances.append(AnimationInstance(self.animation_position_x, self.animation_position_y))
+
+    def update(self, dt):
+        """Advance every instance (and the visibility timer) by `dt` milliseconds of game time."""
+        for instance in self.instances:
+            instance.elapsed += dt
+        self.instances = [instance for instance in self.instances if instance.elapsed < self.duration]
+
         if self.animation_visibility:
+            if self.loop:
+                self.loop_elapsed = (self.loop_elapsed + dt) % self.duration
             if self.timer_status:
-                elapsed_play_time = time.time() - self.animation_started_time
-                if elapsed_play_time >= self.animation_duration:
+                self.animation_elapsed += dt
+                if self.animation_elapsed >= self.animation_duration * 1000:
+                    self.timer_status = False
                     self.set_visibility(False)
                     if self.terminate_sound:
                         self.terminate_sound.play()
-            i = 0
-            for frame in self.animation_frames:
-                current_rect = self.animation_rects[i]
-                current_rect.x = self.animation_position_x
-                current_rect.y = self.animation_position_y
-                self.screen.blit(frame, current_rect)
-                i += 1
-                pygame.display.update(self.animation_rects)
-                time.sleep(self.animation_latency)  # TODO: Find a better and faster solution.
+
+    def draw(self):
+        """Blit the current frame of every instance, and of the loop while visible; return the rects drawn to."""
+        rects = [self.__blit_frame(instance.elapsed, instance.x, instance.y) for instance in self.instances]
+
+        if self.loop and self.animation_visibility:
+            rects.append(self.__blit_frame(self.loop_elapsed, self.animation_position_x, self.animation_position_y))
+        return rects
+
+    def __blit_frame(self, elapsed, x, y):
+        index = min(int(elapsed // self.frame_time), len(self.animation_frames) - 1)
+        return self.screen.blit(self.animation_frames[index], (x, y))
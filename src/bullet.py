@@ -1,47 +1,79 @@
+import logging
 import math
 from abc import ABC, abstractmethod
 
 import pygame
 from pygame.sprite import Sprite
 
+from src.entity_store import TYPE_ALIEN_BULLET, TYPE_SHIP_BULLET, StoreBacked, StoreField
+from src.resources.rotation_cache import rotation_cache
 from src.resources.texture_atlas import TextureAtlas
 
 from . import settings
 
+# Scaled bullet image shared by every bullet, see bullet_texture().
+_texture: pygame.Surface | None = None
 
-class Bullet(ABC, Sprite):
-    """An abstract class to create bullets."""
+
+def bullet_texture() -> pygame.Surface:
+    """Return the scaled bullet image, scaling it only once."""
+    global _texture
+    if _texture is not None:
+        return _texture
+
+    image = TextureAtlas.get_sprite_texture("bullet/golden_bullet.png")
+    # Fallback for headless/tests: create a simple surface if atlas not loaded
+    loaded = image is not None
+    if not loaded:
+        image = pygame.Surface((4, 8), pygame.SRCALPHA)
+        image.fill((255, 255, 0))
+
+    # Ensure integer sizes >= 1
+    width, height = image.get_size()
+    image = pygame.transform.scale(image, (max(1, int(width * 0.03)), max(1, int(height * 0.03))))
+
+    # Don't keep the fallback, so the real texture is used once the atlas is loaded.
+    if loaded:
+        _texture = image
+    return image
+
+
+class Bullet(StoreBacked, ABC, Sprite):
+    """An abstract class to create bullets.
+
+    A bullet created without a source is not fired yet; `BulletPool` keeps those around and
+    fires them with `fire()`.
+    """
+
+    # Kept in the EntityStore while the bullet is in an EntityGroup.
+    x = StoreField()
+    y = StoreField()
+    vx = StoreField()
+    vy = StoreField()
+    angle = StoreField()
 
     def __init__(self, target, source, color, speed_factor):
         super(Bullet, self).__init__()
         self.screen: pygame.Surface = pygame.display.get_surface()
 
-        # Load and scale bullet image
-        self.image: pygame.Surface = TextureAtlas.get_sprite_texture("bullet/golden_bullet.png")
-        # Fallback for headless/tests: create a simple surface if atlas not loaded
-        if self.image is None:
-            try:
-                self.image = pygame.Surface((4, 8), pygame.SRCALPHA)
-                self.image.fill((255, 255, 0))
-            except Exception:
-                # Last-resort: create a tiny surface without alpha
-                self.image = pygame.Surface((4, 8))
-                self.image.fill((255, 255, 0))
-
-        # Safely compute image size and scale (ensure integer sizes >= 1)
-        try:
-            self.image_size: tuple[int, int] = self.image.get_size()
-            target_w = max(1, int(self.image_size[0] * 0.03))
-            target_h = max(1, int(self.image_size[1] * 0.03))
-            self.image = pygame.transform.scale(self.image, (target_w, target_h))
-        except Exception:
-            # If scaling fails, keep the original image
-            try:
-                self.image_size = self.image.get_size()
-            except Exception:
-                self.image_size = (4, 8)
+        self.image: pygame.Surface = bullet_texture()
         self.rect = self.image.get_rect()
 
+        self.color = color
+        self.speed_factor = speed_factor
+
+        # Pool the bullet returns to once it left all its groups.
+        self.pool: BulletPool | None = None
+        self.in_pool: bool = False
+
+        if source is not None:
+            self.fire(source, target)
+
+    def fire(self, source, target):
+        """Place the bullet at its source and aim it."""
+        self.image = bullet_texture()
+        self.rect.size = self.image.get_size()
+
         # Set angle and initial position
         self.angle, self.rect.centerx, self.rect.centery = self.set_angle(source, target)
 
@@ -49,26 +81,50 @@ class Bullet(ABC, Sprite):
         self.x = float(self.rect.x)
         self.y = float(self.rect.y)
 
-        self.color = color
-        self.speed_factor = speed_factor
+        self.orient()
+
+    def remove_internal(self, group):
+        super().remove_internal(group)
+        # Culled off-screen or the group was emptied.
+        if self.pool is not None and not self.alive():
+            self.pool.release(self)
+
+    def kill(self):
+        super().kill()
+        # Killed on hit.
+        if self.pool is not None:
+            self.pool.release(self)
+
+    def orient(self):
+        """Derive the per-frame velocity and the rotated image from the bullet's angle.
+
+        A bullet's angle never changes after it is fired, so this runs once per bullet.
+        """
+        self.vx = -math.sin(self.angle) * self.speed_factor
+        self.vy = -math.cos(self.angle) * self.speed_factor
+
+        width, height = self.image.get_size()
+        self.rotated_image, self.rotated_offset = rotation_cache.get(
+            f"bullet/golden_bullet.png@{width}x{height}", self.image, math.degrees(self.angle),
+        )
 
     def update(self):
         """Move the bullet with ship's or alien's angle"""
 
         # Update the decimal position of the bullet.
 
-        self.x -= math.sin(self.angle) * self.speed_factor * settings.DELTA_TIME
-        self.y -= math.cos(self.angle) * self.speed_factor * settings.DELTA_TIME
+        self.x += self.vx * settings.DELTA_TIME
+        self.y += self.vy * settings.DELTA_TIME
 
         # Update the rect position
         self.rect.x = self.x
         self.rect.y = self.y
 
-    def draw(self):
+    def draw(self) -> pygame.Rect:
         """Draw the bullet to the screen."""
-        rotated_image = pygame.transform.rotate(self.image, math.degrees(self.angle))
-        rotated_rec = rotated_image.get_rect(center=(self.rect.centerx, self.rect.centery))
-        self.screen.blit(rotated_image, rotated_rec)
+        center_x, center_y = self.rect.center
+        offset_x, offset_y = self.rotated_offset
+        return self.screen.blit(self.rotated_image, (center_x + offset_x, center_y + offset_y))
 
     @abstractmethod
     def set_angle(self, source, target):
@@ -79,7 +135,9 @@ class Bullet(ABC, Sprite):
 class ShipBullet(Bullet):
     """A class to manage bullets fired from the ship."""
 
-    def __init__(self, ship):
+    type_id = TYPE_SHIP_BULLET
+
+    def __init__(self, ship=None):
         super().__init__(None, ship, settings.BULLET_COLOR, settings.BULLET_SPEED_FACTOR)
 
     def set_angle(self, source, target):
@@ -116,6 +174,7 @@ class ShipBullet(Bullet):
             self.rect.centery = int(y)
             self.x = float(self.rect.x)
             self.y = float(self.rect.y)
+            self.orient()
         except Exception:
             # If override fails, keep existing values
             pass
@@ -124,7 +183,9 @@ class ShipBullet(Bullet):
 class AlienBullet(Bullet):
     """A class to manage bullets fired from the aliens."""
 
-    def __init__(self, alien, ship):
+    type_id = TYPE_ALIEN_BULLET
+
+    def __init__(self, alien=None, ship=None):
         super().__init__(ship, alien, settings.BULLET_COLOR, settings.BULLET_SPEED_FACTOR)
 
     def set_angle(self, source, target):
@@ -137,3 +198,67 @@ class AlienBullet(Bullet):
         y = source.rect.centery
 
         return angle, x, y
+
+
+class BulletPool:
+    """Recycles bullets of one class instead of creating a new sprite per shot.
+
+    `acquire()` fires a free bullet (allocating one only when the pool is empty) and the
+    bullet comes back by itself as soon as it is removed from its last group.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, bullet_class: type[Bullet]) -> None:
+        self.bullet_class: type[Bullet] = bullet_class
+        self.__free: list[Bullet] = []
+
+        self.size: int = 0  # Bullets created by the pool
+        self.preallocated: int = 0
+        self.in_use: int = 0
+        self.high_water: int = 0  # Most bullets in use at once
+
+    def __allocate(self) -> Bullet:
+        bullet = self.bullet_class()
+        bullet.pool = self
+        self.size += 1
+        return bullet
+
+    def preallocate(self, count: int) -> None:
+        """Create free bullets until the pool holds at least `count`."""
+        while self.size < count:
+            bullet = self.__allocate()
+            bullet.in_pool = True
+            self.__free.append(bullet)
+        self.preallocated = max(self.preallocated, count)
+
+    def acquire(self, source, target=None) -> Bullet:
+        """Return a bullet fired from `source` (at `target`, for alien bullets)."""
+        if self.__free:
+            bullet = self.__free.pop()
+            bullet.in_pool = False
+        else:
+            bullet = self.__allocate()
+            if self.size > self.preallocated:
+                self.__logger.info(f"{self.bullet_class.__name__} pool grew to {self.size} bullets")
+
+        bullet.fire(source, target)
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return bullet
+
+    def release(self, bullet: Bullet) -> None:
+        """Return a bullet to the pool; the bullet must not be in any group."""
+        if bullet.in_pool:
+            return
+        bullet.in_pool = True
+        self.__free.append(bullet)
+        self.in_use -= 1
+
+    def report(self) -> str:
+        return (f"{self.bullet_class.__name__} pool: {self.size} bullets ({self.preallocated} preallocated), "
+                f"high-water mark {self.high_water}")
+
+
+ship_bullet_pool = BulletPool(ShipBullet)
+alien_bullet_pool = BulletPool(AlienBullet)
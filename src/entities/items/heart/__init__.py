@@ -5,7 +5,8 @@ import secrets
 import pygame
 
 from src import settings
-from src.resources.texture_atlas import TextureAtlas
+from src.entity_store import TYPE_HEART
+from src.resources.texture_cache import texture_cache
 
 GENERATE_HEART_CHANCE: int = 10
 
@@ -13,21 +14,27 @@ GENERATE_HEART_CHANCE: int = 10
 class Heart(pygame.sprite.Sprite):
     """A class to represent a heart that falls down the screen in the game."""
 
+    type_id: int = TYPE_HEART
+
     def __init__(self, screen: pygame.Surface) -> None:
         """Initialize the heart's image, rect, and position."""
         super().__init__()
         self.screen: pygame.Surface = screen
         self.speed_factor: float = settings.HEART_SPEED_FACTOR
 
-        self.image: pygame.Surface = pygame.transform.scale(TextureAtlas.get_sprite_texture("heart/full_heart.png"), (25, 25))
+        self.image: pygame.Surface = texture_cache.get("heart/full_heart.png", (25, 25))
         self.rect: pygame.Rect = self.image.get_rect()
         self.rect.centerx = secrets.randbelow(self.screen.get_rect().right + 1)
         self.rect.top = 0
 
+    @property
+    def vy(self) -> float:
+        return self.speed_factor
+
     def update(self) -> None:
         """Update the heart's position to move it down the screen."""
         self.rect.y += int(self.speed_factor * settings.DELTA_TIME)
 
-    def draw(self) -> None:
+    def draw(self) -> pygame.Rect:
         """Draw the heart onto the screen."""
-        self.screen.blit(self.image, self.rect)
+        return self.screen.blit(self.image, self.rect)
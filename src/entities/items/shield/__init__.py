@@ -5,7 +5,8 @@ import secrets
 import pygame
 
 from src import settings
-from src.resources.texture_atlas import TextureAtlas
+from src.entity_store import TYPE_SHIELD
+from src.resources.texture_cache import texture_cache
 
 GENERATE_SHIELD_CHANCE: int = 10
 SHIELD_TIME: int = 10
@@ -14,22 +15,22 @@ SHIELD_TIME: int = 10
 class Shield(pygame.sprite.Sprite):
     """A shield power-up that spawns randomly and moves downward."""
 
+    type_id: int = TYPE_SHIELD
+    vy: float = settings.HEART_SPEED_FACTOR
+
     def __init__(self) -> None:
         """Initialize the shield with a random position."""
         super().__init__()
         self.screen: pygame.Surface = pygame.display.get_surface()
-        self.image: pygame.Surface = pygame.transform.scale(
-            TextureAtlas.get_sprite_texture("shield/shield.png"),
-            (25, 25),
-        )
+        self.image: pygame.Surface = texture_cache.get("shield/shield.png", (25, 25))
         self.rect: pygame.Rect = self.image.get_rect()
         self.rect.centerx = secrets.randbelow(settings.SCREEN_WIDTH - self.rect.width)
         self.rect.top = 0
 
     def update(self) -> None:
         """Move the shield downward."""
-        self.rect.y += int(settings.HEART_SPEED_FACTOR * settings.DELTA_TIME)
+        self.rect.y += int(self.vy * settings.DELTA_TIME)
 
-    def draw(self) -> None:
+    def draw(self) -> pygame.Rect:
         """Draw the shield on the screen."""
-        self.screen.blit(self.image, self.rect)
+        return self.screen.blit(self.image, self.rect)
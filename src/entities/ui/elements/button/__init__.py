@@ -80,10 +80,13 @@ class Button:
         self.text_surf: pygame.Surface = settings.FONT.render(self.text, True, BtnColors.TEXT_COLOR)
         self.text_rect: pygame.Rect = self.text_surf.get_rect(center=self.top_rect.center)
 
-    def draw(self) -> None:
+    def draw(self) -> pygame.Rect:
         """Draw the button on the screen with its current state.
 
         Adjusts the button's position based on its elevation and renders both the shadow and button face.
+
+        Returns:
+            pygame.Rect: The screen area the button was drawn to.
         """
         # Adjust the top rectangle's vertical position based on elevation
         self.top_rect.y = self.original_y_pos - self.state.elevation
@@ -104,6 +107,8 @@ class Button:
         # Render the button text on top of the button face
         self.screen.blit(self.text_surf, self.text_rect)
 
+        return self.bottom_rect.union(self.top_rect)
+
     def check_click(self) -> None:
         """Handle mouse hover and click interactions for the button.
 
@@ -130,11 +135,15 @@ class Button:
             self.top_color = pygame.Color(BtnColors.TOP_COLOR)
             self.state.set_pressed(False)
 
-    def update(self) -> None:
+    def update(self) -> pygame.Rect | None:
         """Update the button state and render it if it should be visible.
 
         Checks for user interaction and redraws the button accordingly.
+
+        Returns:
+            pygame.Rect | None: The screen area drawn to, or None if the button is hidden.
         """
         if self.show_fn():
             self.check_click()
-            self.draw()
+            return self.draw()
+        return None
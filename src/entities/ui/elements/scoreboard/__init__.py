@@ -42,6 +42,6 @@ class Scoreboard(pygame.sprite.Sprite):
         self.image: pygame.Surface = self.score_image
         self.rect: pygame.Rect = self.score_rect
 
-    def show(self) -> None:
+    def show(self) -> pygame.Rect:
         """Draw the score on screen."""
-        self.screen.blit(self.image, self.rect)
+        return self.screen.blit(self.image, self.rect)
@@ -0,0 +1,281 @@
+"""Struct-of-arrays storage for the sprites that move in bulk (aliens and bullets).
+
+Aliens and bullets used to keep their float position, velocity, angle and health as plain
+Python attributes, so every frame walked them one by one. While a sprite is in an
+`EntityGroup` those values live in contiguous NumPy arrays owned by the group's
+`EntityStore` instead, and the bulk helpers at the bottom of this module update a whole
+group in a few array operations. The sprites themselves stay regular
+`pygame.sprite.Sprite` objects (image + rect): they are thin views over their slot, so
+drawing, collisions and existing attribute access (`alien.x`, `bullet.angle`, ...) keep
+working unchanged. The helpers fall back to the per-sprite path for plain `Group`s.
+"""
+
+from random import randint
+
+import numpy as np
+from pygame.sprite import Group, Sprite
+
+# Entity type ids, stored in EntityStore.type_id.
+TYPE_NONE: int = 0
+TYPE_ALIEN_L1: int = 1
+TYPE_ALIEN_L2: int = 2
+TYPE_CARGO_ALIEN: int = 3
+TYPE_SHIP_BULLET: int = 4
+TYPE_ALIEN_BULLET: int = 5
+# Sprites kept outside a store, typed for world snapshots (see src/recording/snapshots.py).
+TYPE_SHIP: int = 6
+TYPE_HEART: int = 7
+TYPE_SHIELD: int = 8
+
+DEFAULT_CAPACITY: int = 64
+
+# Per-entity arrays: (name, dtype).
+ARRAYS: tuple[tuple[str, type], ...] = (
+    ("x", np.float64),
+    ("y", np.float64),
+    ("vx", np.float64),
+    ("vy", np.float64),
+    ("angle", np.float64),
+    ("health", np.int32),
+    ("type_id", np.int8),
+    # Mirror of the sprite's rect, kept current by sync_rects().
+    ("left", np.int32),
+    ("top", np.int32),
+    ("width", np.int32),
+    ("height", np.int32),
+    ("alive", np.bool_),
+)
+
+_rng = np.random.default_rng()
+
+
+class StoreField:
+    """Sprite attribute that lives in the owning EntityStore while the sprite is in an EntityGroup."""
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, sprite, owner=None):
+        if sprite is None:
+            return self
+        store = sprite._store
+        if store is None:
+            try:
+                return sprite.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+        return getattr(store, self.name)[sprite._slot].item()
+
+    def __set__(self, sprite, value) -> None:
+        store = sprite._store
+        if store is None:
+            sprite.__dict__[self.name] = value
+        else:
+            getattr(store, self.name)[sprite._slot] = value
+
+
+class StoreBacked:
+    """Mixin for sprites whose StoreFields can be moved into an EntityStore."""
+
+    type_id: int = TYPE_NONE
+    store_fields: tuple[str, ...] = ()
+
+    _store: "EntityStore | None" = None
+    _slot: int = -1
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.store_fields = tuple(name for name in dir(cls) if isinstance(getattr(cls, name, None), StoreField))
+
+
+class EntityStore:
+    """Contiguous per-entity arrays with a free list of slots."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.capacity: int = 0
+        for name, dtype in ARRAYS:
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self.sprites: list[Sprite | None] = []
+        self.__free: list[int] = []
+        self.__grow(max(1, capacity))
+
+    def __len__(self) -> int:
+        return self.capacity - len(self.__free)
+
+    def __grow(self, capacity: int) -> None:
+        for name, dtype in ARRAYS:
+            array = np.zeros(capacity, dtype=dtype)
+            array[:self.capacity] = getattr(self, name)
+            setattr(self, name, array)
+        self.sprites.extend([None] * (capacity - self.capacity))
+        # Keep the free list sorted so the lowest slots are reused first.
+        self.__free = list(range(capacity - 1, self.capacity - 1, -1)) + self.__free
+        self.capacity = capacity
+
+    def attach(self, sprite: StoreBacked) -> None:
+        """Move the sprite's StoreFields into a free slot."""
+        if not self.__free:
+            self.__grow(self.capacity * 2)
+
+        slot = self.__free.pop()
+        for name in sprite.store_fields:
+            getattr(self, name)[slot] = sprite.__dict__.pop(name, 0)
+        self.type_id[slot] = sprite.type_id
+        self.left[slot], self.top[slot], self.width[slot], self.height[slot] = sprite.rect
+        self.alive[slot] = True
+        self.sprites[slot] = sprite
+
+        sprite._store = self
+        sprite._slot = slot
+
+    def detach(self, sprite: StoreBacked) -> None:
+        """Copy the sprite's StoreFields back onto the sprite and free its slot."""
+        slot = sprite._slot
+        for name in sprite.store_fields:
+            sprite.__dict__[name] = getattr(self, name)[slot].item()
+        self.alive[slot] = False
+        self.type_id[slot] = TYPE_NONE
+        self.sprites[slot] = None
+        self.__free.append(slot)
+
+        sprite._store = None
+        sprite._slot = -1
+
+    def slots(self) -> np.ndarray:
+        """Return the indices of all live slots."""
+        return np.flatnonzero(self.alive)
+
+    def sync_rects(self, slots: np.ndarray, left: np.ndarray, top: np.ndarray) -> None:
+        """Write rect positions back to the sprites in `slots`."""
+        self.left[slots] = left
+        self.top[slots] = top
+        sprites = self.sprites
+        for slot, x, y in zip(slots.tolist(), left.tolist(), top.tolist()):
+            sprites[slot].rect.topleft = (x, y)
+
+
+class EntityGroup(Group):
+    """A sprite group that keeps its StoreBacked members' state in an EntityStore."""
+
+    def __init__(self, *sprites, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.store: EntityStore = EntityStore(capacity)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+        if isinstance(sprite, StoreBacked) and sprite._store is None:
+            self.store.attach(sprite)
+
+    def remove_internal(self, sprite) -> None:
+        super().remove_internal(sprite)
+        if isinstance(sprite, StoreBacked) and sprite._store is self.store:
+            self.store.detach(sprite)
+
+
+def round_coords(values: np.ndarray) -> np.ndarray:
+    """Round half away from zero, the way pygame.Rect stores float coordinates."""
+    return np.copysign(np.floor(np.abs(values) + 0.5), values).astype(np.int64)
+
+
+def clamp_coords(pos: np.ndarray, size: np.ndarray, limit: int) -> np.ndarray:
+    """Vectorized pygame.Rect.clamp_ip along one axis of a (0, 0, limit) area."""
+    return np.where(size >= limit, limit // 2 - size // 2, np.clip(pos, 0, np.maximum(limit - size, 0)))
+
+
+def move_bullets(bullets: Group, dt: float) -> None:
+    """Advance every bullet by its velocity."""
+    store = getattr(bullets, "store", None)
+    if store is None:
+        bullets.update()
+        return
+
+    slots = store.slots()
+    if not len(slots):
+        return
+
+    store.x[slots] += store.vx[slots] * dt
+    store.y[slots] += store.vy[slots] * dt
+    store.sync_rects(slots, round_coords(store.x[slots]), round_coords(store.y[slots]))
+
+
+def remove_offscreen_bullets(bullets: Group, screen_width: int, screen_height: int) -> None:
+    """Remove bullets whose rect left the screen."""
+    store = getattr(bullets, "store", None)
+    if store is None:
+        for bullet in bullets.copy():
+            if (
+                bullet.rect.bottom <= 0
+                or bullet.rect.top >= screen_height
+                or bullet.rect.left < 0
+                or bullet.rect.right > screen_width
+            ):
+                bullets.remove(bullet)
+        return
+
+    slots = store.slots()
+    if not len(slots):
+        return
+
+    left = store.left[slots]
+    top = store.top[slots]
+    offscreen = (
+        (top + store.height[slots] <= 0)
+        | (top >= screen_height)
+        | (left < 0)
+        | (left + store.width[slots] > screen_width)
+    )
+    if offscreen.any():
+        bullets.remove(*[store.sprites[slot] for slot in slots[offscreen].tolist()])
+
+
+def remove_offscreen_aliens(aliens: Group, screen_width: int, screen_height: int) -> None:
+    """Remove aliens whose rect is completely outside the screen."""
+    store = getattr(aliens, "store", None)
+    if store is None:
+        for alien in aliens.copy():
+            if (
+                alien.rect.right < 0
+                or alien.rect.left > screen_width
+                or alien.rect.bottom < 0
+                or alien.rect.top > screen_height
+            ):
+                aliens.remove(alien)
+        return
+
+    slots = store.slots()
+    if not len(slots):
+        return
+
+    left = store.left[slots]
+    top = store.top[slots]
+    offscreen = (
+        (left + store.width[slots] < 0)
+        | (left > screen_width)
+        | (top + store.height[slots] < 0)
+        | (top > screen_height)
+    )
+    if offscreen.any():
+        aliens.remove(*[store.sprites[slot] for slot in slots[offscreen].tolist()])
+
+
+def roll_fire(aliens: Group, fire_chances: dict[int, int]) -> list[Sprite]:
+    """Return the aliens that fire this tick; `fire_chances` maps type id to a chance out of 1000."""
+    store = getattr(aliens, "store", None)
+    if store is None:
+        return [
+            alien for alien in aliens.sprites()
+            if getattr(alien, "type_id", TYPE_NONE) in fire_chances
+            and randint(1, 1000) <= fire_chances[alien.type_id]
+        ]
+
+    slots = store.slots()
+    if not len(slots):
+        return []
+
+    chances = np.zeros(len(slots), dtype=np.int32)
+    types = store.type_id[slots]
+    for type_id, chance in fire_chances.items():
+        chances[types == type_id] = chance
+
+    firing = _rng.integers(1, 1001, size=len(slots)) <= chances
+    return [store.sprites[slot] for slot in slots[firing].tolist()]
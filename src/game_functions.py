@@ -12,16 +12,25 @@ from src.entities.items.shield import GENERATE_SHIELD_CHANCE, Shield
 
 from . import settings
 from .game_stats import GameStats
+from .resources.sound_bank import SoundBank
 from .resources.texture_atlas import TextureAtlas
 
-pygame.mixer.init()
-
-sound_fire = pygame.mixer.Sound(settings.SOUNDS_DIR / "fire.ogg")
-sound_explosion = pygame.mixer.Sound(settings.SOUNDS_DIR / "explosion.ogg")
-sound_life = pygame.mixer.Sound(settings.SOUNDS_DIR / "life_pickup.flac")
-sound_damage = pygame.mixer.Sound(settings.SOUNDS_DIR / "damage.wav")
-sound_shield_fill = pygame.mixer.Sound(settings.SOUNDS_DIR / "shield_fill.wav")
-sound_shield_empty = pygame.mixer.Sound(settings.SOUNDS_DIR / "shield_empty.wav")
+# Decoded in the background once load_sounds() is called; until then playing them does nothing.
+sounds = SoundBank({
+    "fire": settings.SOUNDS_DIR / "fire.ogg",
+    "explosion": settings.SOUNDS_DIR / "explosion.ogg",
+    "life": settings.SOUNDS_DIR / "life_pickup.flac",
+    "damage": settings.SOUNDS_DIR / "damage.wav",
+    "shield_fill": settings.SOUNDS_DIR / "shield_fill.wav",
+    "shield_empty": settings.SOUNDS_DIR / "shield_empty.wav",
+}, settings.SOUNDS_ENABLED)
+
+sound_fire = sounds.sound("fire")
+sound_explosion = sounds.sound("explosion")
+sound_life = sounds.sound("life")
+sound_damage = sounds.sound("damage")
+sound_shield_fill = sounds.sound("shield_fill")
+sound_shield_empty = sounds.sound("shield_empty")
 
 text_lines = []
 text_rects = []
@@ -39,7 +48,7 @@ def load_animations(screen: pygame.Surface) -> None:
     # animation frames
     fire_explosion_animation = Animation("explosion4", 15, screen, settings.DEFAULT_ANIMATION_LATENCY,4)
 
-    shield_animation = Animation("shield3", 11, screen, 0, 2.6, False, 30)
+    shield_animation = Animation("shield3", 11, screen, 0, 2.6, False, 30, loop=True)
 
     animations.append(fire_explosion_animation)
     animations.append(shield_animation)
@@ -546,24 +555,35 @@ from time import sleep
 import pygame
 import math
 
-from src.alien import AlienL1, AlienL2, CargoAlien
+from src import entity_store, spatial_hash
+from src.alien import AlienL1, AlienL2, CargoAlien, steer_aliens
 from src.animation import Animation
-from src.bullet import AlienBullet, ShipBullet
+from src.bullet import alien_bullet_pool, ship_bullet_pool
 from src.entities.items.heart import GENERATE_HEART_CHANCE, Heart
 from src.entities.items.shield import GENERATE_SHIELD_CHANCE, Shield
+from src.renderer import Renderer
 
 from . import settings
 from .game_stats import GameStats
+from .resources.sound_bank import SoundBank
 from .resources.texture_atlas import TextureAtlas
 
-pygame.mixer.init()
-
-sound_fire = pygame.mixer.Sound(settings.SOUNDS_DIR / "fire.ogg")
-sound_explosion = pygame.mixer.Sound(settings.SOUNDS_DIR / "explosion.ogg")
-sound_life = pygame.mixer.Sound(settings.SOUNDS_DIR / "life_pickup.flac")
-sound_damage = pygame.mixer.Sound(settings.SOUNDS_DIR / "damage.wav")
-sound_shield_fill = pygame.mixer.Sound(settings.SOUNDS_DIR / "shield_fill.wav")
-sound_shield_empty = pygame.mixer.Sound(settings.SOUNDS_DIR / "shield_empty.wav")
+# Decoded in the background once load_sounds() is called; until then playing them does nothing.
+sounds = SoundBank({
+    "fire": settings.SOUNDS_DIR / "fire.ogg",
+    "explosion": settings.SOUNDS_DIR / "explosion.ogg",
+    "life": settings.SOUNDS_DIR / "life_pickup.flac",
+    "damage": settings.SOUNDS_DIR / "damage.wav",
+    "shield_fill": settings.SOUNDS_DIR / "shield_fill.wav",
+    "shield_empty": settings.SOUNDS_DIR / "shield_empty.wav",
+}, settings.SOUNDS_ENABLED)
+
+sound_fire = sounds.sound("fire")
+sound_explosion = sounds.sound("explosion")
+sound_life = sounds.sound("life")
+sound_damage = sounds.sound("damage")
+sound_shield_fill = sounds.sound("shield_fill")
+sound_shield_empty = sounds.sound("shield_empty")
 
 text_lines = []
 text_rects = []
@@ -581,12 +601,25 @@ def load_animations(screen: pygame.Surface) -> None:
     # animation frames
     fire_explosion_animation = Animation("explosion4", 15, screen, settings.DEFAULT_ANIMATION_LATENCY,4)
 
-    shield_animation = Animation("shield3", 11, screen, 0, 2.6, False, 30)
+    shield_animation = Animation("shield3", 11, screen, 0, 2.6, False, 30, loop=True)
 
     animations.append(fire_explosion_animation)
     animations.append(shield_animation)
 
 
+# Presents the frames drawn by update_screen.
+renderer: Renderer | None = None
+
+
+def load_renderer(screen: pygame.Surface) -> None:
+    global renderer
+    renderer = Renderer(screen)
+
+
+def load_sounds() -> None:
+    sounds.load()
+
+
 def load_credits():
     global text_lines, text_rects
     credit = """
@@ -737,55 +770,77 @@ def update_screen(
     health,
     hearts,
     shields,
+    status_text=None,
+    elapsed_ms=None,
 ):
-    """Update image on the screen and flip to the new screen."""
-    region_manager.update(screen, stats.score, ai_settings.delta_time)
+    """Update image on the screen and present it once.
+
+    `status_text`, if given, is drawn in the bottom-left corner. `elapsed_ms` is the game time simulated since the
+    last call (the fixed steps run for this frame), which animations advance by; by default one frame at `fps`.
+    """
+    if renderer is None:
+        load_renderer(screen)
+    renderer.draw_background(region_manager)
+    mark = renderer.mark
 
     # Redraw all bullets behind ship and aliens.
     for bullet in bullets.sprites():
         # TODO: There is an interesting bug in here!
         try:
-            bullet.draw()
+            mark(bullet.draw())
         except:
             # print("HERE")
             pass
 
     for bullet in alien_bullets.sprites():
-        bullet.draw()
+        mark(bullet.draw())
 
     for heart in hearts.sprites():
-        heart.draw()
+        mark(heart.draw())
 
     for shield in shields.sprites():
-        shield.draw()
+        mark(shield.draw())
 
-    ship.bltime()
-    aliens.draw(screen)
-    cargoes.draw(screen)
-    health.draw()
+    mark(ship.bltime())
+    # The rotated images are larger than the aliens' rects, so mark what was blitted.
+    for alien in aliens.sprites():
+        mark(alien.blit())
+    for cargo in cargoes.sprites():
+        mark(cargo.blit())
+    mark(health.draw())
 
     # Draw the score information.
-    sb.show()
+    mark(sb.show())
 
     # Draw the play button.
-    play_button.update()
-    credits_button.update()
+    mark(play_button.update())
+    mark(credits_button.update())
 
     if stats.credits_active:
-        back_button.update()
+        mark(back_button.update())
         i = 0
         for line in text_lines:
-            screen.blit(line, text_rects[i])
+            mark(screen.blit(line, text_rects[i]))
             i += 1
 
     if stats.game_active:
         crosshair = TextureAtlas.get_sprite_texture("misc/crosshair.png")
-        screen.blit(crosshair, pygame.mouse.get_pos())
+        mark(screen.blit(crosshair, pygame.mouse.get_pos()))
 
-    animations[1].set_position(ship.rect.x, ship.rect.y)
-    animations[1].play()
+    # Advance every playing animation by the simulated game time and draw it.
+    if elapsed_ms is None:
+        elapsed_ms = 1000 / ai_settings.fps
+    if animations:
+        animations[1].set_position(ship.rect.x, ship.rect.y)
+    for animation in animations:
+        animation.update(elapsed_ms)
+        mark(*animation.draw())
 
-    pygame.display.flip()
+    if status_text is not None:
+        surf = settings.FONT.render(status_text, True, (255, 255, 255))
+        mark(screen.blit(surf, (10, screen.get_height() - surf.get_height() - 10)))
+
+    renderer.present()
 
 
 def fire_bullet(ship, bullets, angle: float | None = None) -> None:
@@ -812,7 +867,7 @@ def fire_bullet(ship, bullets, angle: float | None = None) -> None:
     # Create a new bullet and add it to the bullets group.
     print(f"fire_bullet called: bullets={len(bullets)} allowed={settings.BULLETS_ALLOWED} angle={angle} ship_angle={getattr(ship, 'angle', None)}")
     if len(bullets) < settings.BULLETS_ALLOWED:
-        new_bullet = ShipBullet(ship)
+        new_bullet = ship_bullet_pool.acquire(ship)
 
         if angle is not None:
             # Use the bullet's override method which centralizes angle/position logic
@@ -832,6 +887,7 @@ def fire_bullet(ship, bullets, angle: float | None = None) -> None:
                     new_bullet.rect.centery = int(y)
                     new_bullet.x = float(new_bullet.rect.x)
                     new_bullet.y = float(new_bullet.rect.y)
+                    new_bullet.orient()
                 except Exception:
                     pass
 
@@ -859,21 +915,12 @@ def update_bullets(
     health,
 ):
     """Update position of bullets and get rid of old bullets."""
-    bullets.update()
-    alien_bullets.update()
+    entity_store.move_bullets(bullets, settings.DELTA_TIME)
+    entity_store.move_bullets(alien_bullets, settings.DELTA_TIME)
 
     # Get rid of bullets that have disappeared
-    all_bullets = bullets.copy()
-    all_bullets.add(alien_bullets.copy())
-
-    for bullet in all_bullets:
-        if (
-            bullet.rect.bottom <= 0
-            or bullet.rect.top >= ai_settings.screen_height
-            or bullet.rect.left < 0
-            or bullet.rect.right > ai_settings.screen_width
-        ):
-            bullets.remove(bullet)
+    entity_store.remove_offscreen_bullets(bullets, ai_settings.screen_width, ai_settings.screen_height)
+    entity_store.remove_offscreen_bullets(alien_bullets, ai_settings.screen_width, ai_settings.screen_height)
 
     check_bullet_alien_collisions(
         ai_settings,
@@ -894,17 +941,19 @@ def check_bullet_alien_collisions(ai_settings, screen, stats, sb, ship, aliens,
     # Remove any bullets and aliens that have collided.
     # Check for any bullets that have hit aliens.
     # If so, get rid of the bullet and the alien.
-    collisions_1 = pygame.sprite.groupcollide(bullets, aliens, True, False)
-    collisions_2 = pygame.sprite.groupcollide(bullets, cargoes, True, True)
-    collisions_3 = pygame.sprite.groupcollide(aliens, cargoes, False, True)
+    collisions_1 = spatial_hash.groupcollide(bullets, aliens, True, False)
+    collisions_2 = spatial_hash.groupcollide(bullets, cargoes, True, True)
+    collisions_3 = spatial_hash.groupcollide(aliens, cargoes, False, True)
 
     # if we hit alien
     if collisions_1:
         for aliens_hit in collisions_1.values():
             for alien in aliens_hit:
                 alien.health -= 1
-                animations[0].set_position(alien.rect.x, alien.rect.y)
-                animations[0].play()
+                # Headless runs (see src.simulation) never load animations.
+                if animations:
+                    animations[0].set_position(alien.rect.x, alien.rect.y)
+                    animations[0].play()
                 if alien.health <= 0:
                     aliens.remove(alien)
 
@@ -1008,7 +1057,7 @@ def ship_hit(ai_settings, stats, screen, ship, aliens, bullets, cargoes):
 
 def update_aliens(ai_settings, stats, ship, aliens, cargoes, health):
     """Check if the fleet is at the edge, and then update the position of all aliens in the fleet."""
-    aliens.update(ship)
+    steer_aliens(aliens, ship, ai_settings)
     cargoes.update()
 
     check_collideany_ship_alien = pygame.sprite.spritecollideany(ship, aliens)
@@ -1028,15 +1077,12 @@ def update_aliens(ai_settings, stats, ship, aliens, cargoes, health):
 
 def alien_fire(ai_settings, stats, screen, aliens, alien_bullets, ship):
     if stats.game_active:
-        for alien in aliens.sprites():
-            if type(alien) is AlienL1:
-                if randint(1, 1000) <= ai_settings.alien_fire_chance:
-                    bullet = AlienBullet(alien, ship)
-                    alien_bullets.add(bullet)
-            elif type(alien) is AlienL2:
-                if randint(1, 1000) <= ai_settings.alien_l2_fire_chance:
-                    bullet = AlienBullet(alien, ship)
-                    alien_bullets.add(bullet)
+        fire_chances = {
+            AlienL1.type_id: ai_settings.alien_fire_chance,
+            AlienL2.type_id: ai_settings.alien_l2_fire_chance,
+        }
+        for alien in entity_store.roll_fire(aliens, fire_chances):
+            alien_bullets.add(alien_bullet_pool.acquire(alien, ship))
 
 
 def generate_heart(
@@ -1078,7 +1124,8 @@ def update_shields(ship, shields, health):
     if check_collideany_ship_shields:
         health.activate_shield()  # freezing health bar.
         sound_shield_fill.play()
-        animations[1].set_visibility(True, True, 10, sound_shield_empty)
+        if animations:
+            animations[1].set_visibility(True, True, 10, sound_shield_empty)
         shields.remove(check_collideany_ship_shields)
 
     for shield in shields.copy():
@@ -1088,11 +1135,4 @@ def update_shields(ship, shields, health):
 
 def remove_offscreen_aliens(aliens, screen_width, screen_height):
     """"""
-    for alien in aliens.copy():
-        if (
-            alien.rect.right < 0
-            or alien.rect.left > screen_width
-            or alien.rect.bottom < 0
-            or alien.rect.top > screen_height
-        ):
-            aliens.remove(alien)
+    entity_store.remove_offscreen_aliens(aliens, screen_width, screen_height)
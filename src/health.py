@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 import pygame
 
 from src.entities.items.shield import SHIELD_TIME
-from src.resources.texture_atlas import TextureAtlas
+from src.resources.texture_cache import texture_cache
 
 from .game_stats import GameStats
 
@@ -50,19 +50,15 @@ class Health:
         self.freeze_flag = True
         self.freeze_time = time.time()
 
-    def draw(self) -> None:
-        """Draw health bar in the top-left corner."""
+    def draw(self) -> pygame.Rect:
+        """Draw health bar in the top-left corner and return the area drawn to."""
         heart_size: tuple[int, int] = (20, 20)
-        full_heart: pygame.Surface = pygame.transform.scale(
-            TextureAtlas.get_sprite_texture("heart/full_heart.png"),
-            heart_size,
-        )
-        empty_heart: pygame.Surface = pygame.transform.scale(
-            TextureAtlas.get_sprite_texture("heart/empty_heart.png"),
-            heart_size,
-        )
+        full_heart: pygame.Surface = texture_cache.get("heart/full_heart.png", heart_size)
+        empty_heart: pygame.Surface = texture_cache.get("heart/empty_heart.png", heart_size)
 
         rect: pygame.Rect = self.screen.get_rect(topleft=(20, 20))
+        drawn: pygame.Rect = pygame.Rect(rect.topleft, (0, 0))
         for i in range(MAX_HEARTS):
-            self.screen.blit(full_heart if i < self.current_hearts else empty_heart, rect)
+            drawn.union_ip(self.screen.blit(full_heart if i < self.current_hearts else empty_heart, rect))
             rect.x += 25
+        return drawn
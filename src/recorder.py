@@ -1,88 +1,105 @@
-import csv
 import atexit
+import logging
 import math
 from pathlib import Path
 from typing import Optional
 
 import pygame
 
+from . import settings
+from .recording.policies import RecordingPolicy, make_policy
+from .recording.storage import RECORD_DTYPE, CsvWriter, SegmentWriter, record_dtype
+from .recording.writer_thread import BackgroundWriter
+
 
 class Recorder:
-    """Simple recorder to log gameplay frames and player actions to CSV and console.
+    """Recorder to log gameplay frames and player actions for training.
+
+    Rows go into preallocated NumPy arrays written as compressed segments of a recording directory, one session per
+    recorder (see `src/recording/storage.py`); a path ending in ".csv" writes the CSV format instead. With
+    `background` the files are written on a writer thread (see `src/recording/writer_thread.py`). `policy` picks the
+    frames that are written (see `src/recording/policies.py`; by default settings.RECORDER_POLICY). With `echo`
+    every written row is also printed.
 
     Usage:
-        recorder = Recorder("data/gameplay_log.csv")
+        recorder = Recorder(settings.RECORDING_PATH)
         recorder.record(stats, ship, aliens, bullets, health, input)
     """
 
-    DEFAULT_FIELDS = [
-        "timestamp_ms",
-        "score",
-        "ships_left",
-        "health",
-        "ship_x",
-        "ship_y",
-        "ship_angle",
-        "moving_left",
-        "moving_right",
-        "moving_up",
-        "moving_down",
-        "mouse_x",
-        "mouse_y",
-        "mouse_fire",
-        "bullets_count",
-        "aliens_count",
-        "nearest_alien_dx",
-        "nearest_alien_dy",
-        "nearest_alien_distance",
-        # New fields: nearest alien velocity components (units/sec). These are
-        # optional and will be None when no aliens present.
-        "nearest_alien_vx",
-        "nearest_alien_vy",
-    ]
-
-    def __init__(self, filepath: str | Path, fieldnames: Optional[list[str]] = None):
+    # Column order of the recording schema. The nearest alien fields are NaN (an empty CSV cell) when no
+    # aliens are present; nearest_alien_vx/vy are its velocity (units/sec).
+    DEFAULT_FIELDS = list(RECORD_DTYPE.names)
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        filepath: str | Path,
+        fieldnames: Optional[list[str]] = None,
+        echo: bool = settings.RECORDER_ECHO,
+        segment_bytes: int = settings.RECORDER_SEGMENT_BYTES,
+        compression: str = settings.RECORDER_COMPRESSION,
+        background: bool = settings.RECORDER_BACKGROUND,
+        policy: RecordingPolicy | None = None,
+    ):
         self.filepath = Path(filepath)
-        self.filepath.parent.mkdir(parents=True, exist_ok=True)
         self.fieldnames = fieldnames or Recorder.DEFAULT_FIELDS
-
-        # Open CSV file and write header if new
-        self._f = open(self.filepath, "a", newline="", encoding="utf-8")
-        self._writer = csv.DictWriter(self._f, fieldnames=self.fieldnames)
-        # If file is empty, write header
-        try:
-            if self._f.tell() == 0:
-                self._writer.writeheader()
-        except Exception:
-            # On some streams tell() may fail; ignore
-            pass
-
-        # Ensure file is closed on exit
+        self.echo = echo
+        self.policy = policy or make_policy()
+        self._closed = False
+
+        # Positions of the recorded fields in the full row, when only some are recorded
+        self._columns = None if self.fieldnames == Recorder.DEFAULT_FIELDS \
+            else [Recorder.DEFAULT_FIELDS.index(name) for name in record_dtype(self.fieldnames).names]
+
+        if self.filepath.suffix == ".csv":
+            self._writer = CsvWriter(self.filepath, self.fieldnames)
+        else:
+            session_info = {"policy": self.policy.describe(), "frame_ms": 1000 / settings.FPS}
+            self._writer = SegmentWriter(self.filepath, record_dtype(self.fieldnames), segment_bytes, compression,
+                                         session_info)
+        if background:
+            self._writer = BackgroundWriter(self._writer)
+
+        # Ensure buffered rows are written on exit
         atexit.register(self.close)
 
+    @property
+    def rows_written(self) -> int:
+        return self._writer.rows_written
+
     def close(self):
+        if self._closed:
+            return
+        self._closed = True
         try:
-            if not self._f.closed:
-                self._f.flush()
-                self._f.close()
+            self._writer.close()
         except Exception:
-            pass
+            self.__logger.exception(f"Failed to close recording {self.filepath}")
+        if isinstance(self._writer, BackgroundWriter):
+            self.__logger.info(self._writer.report())
 
     def record(self, stats, ship, aliens, bullets, health, input):
         """Record a snapshot row built from provided game objects."""
-        row = self._build_row(stats, ship, aliens, bullets, health, input)
-        # Write to CSV
-        try:
-            self._writer.writerow(row)
-            self._f.flush()
-        except Exception:
-            # Best-effort: ignore write errors
-            pass
-
-        # Also print to console (for variety / inspection)
-        print(self._format_row_for_console(row))
-
-    def _build_row(self, stats, ship, aliens, bullets, health, input):
+        for values in self.policy.select(self._build_values(stats, ship, aliens, bullets, health, input)):
+            if self._columns is not None:
+                values = tuple(values[column] for column in self._columns)
+            try:
+                self._writer.append(values)
+            except Exception:
+                # Best-effort: ignore write errors
+                pass
+
+            if self.echo:
+                print(self._format_row_for_console(dict(zip(self.fieldnames, values))))
+
+    def _build_row(self, stats, ship, aliens, bullets, health, input) -> dict:
+        values = self._build_values(stats, ship, aliens, bullets, health, input)
+        row = dict(zip(Recorder.DEFAULT_FIELDS, values))
+        return {name: row[name] for name in self.fieldnames}
+
+    def _build_values(self, stats, ship, aliens, bullets, health, input) -> tuple:
+        """The row's values in `DEFAULT_FIELDS` order."""
         ts = pygame.time.get_ticks()
 
         ship_x = int(ship.center[0]) if hasattr(ship, "center") else int(getattr(ship.rect, "centerx", 0))
@@ -144,36 +161,30 @@ class Recorder:
         except Exception:
             nearest_dx = nearest_dy = nearest_dist = None
 
-        row = {
-            "timestamp_ms": ts,
-            "score": getattr(stats, "score", 0),
-            "ships_left": getattr(stats, "ships_left", getattr(stats, "ships_left", 0)),
-            "health": getattr(health, "current_hearts", getattr(health, "current_hearts", 0)),
-            "ship_x": ship_x,
-            "ship_y": ship_y,
-            "ship_angle": ship_angle,
-            "moving_left": bool(getattr(ship, "moving_left", False)),
-            "moving_right": bool(getattr(ship, "moving_right", False)),
-            "moving_up": bool(getattr(ship, "moving_up", False)),
-            "moving_down": bool(getattr(ship, "moving_down", False)),
-            "mouse_x": mouse_pos[0] if mouse_pos is not None else None,
-            "mouse_y": mouse_pos[1] if mouse_pos is not None else None,
-            "mouse_fire": int(mouse_fire),
-            "bullets_count": bullets_count,
-            "aliens_count": aliens_count,
-            "nearest_alien_dx": nearest_dx,
-            "nearest_alien_dy": nearest_dy,
-            "nearest_alien_distance": nearest_dist,
-            "nearest_alien_vx": nearest_vx,
-            "nearest_alien_vy": nearest_vy,
-        }
-
-        # Ensure all fields present
-        for k in self.fieldnames:
-            if k not in row:
-                row[k] = None
-
-        return row
+        nan = math.nan
+        return (
+            ts,
+            getattr(stats, "score", 0),
+            getattr(stats, "ships_left", 0),
+            getattr(health, "current_hearts", 0),
+            ship_x,
+            ship_y,
+            ship_angle,
+            bool(getattr(ship, "moving_left", False)),
+            bool(getattr(ship, "moving_right", False)),
+            bool(getattr(ship, "moving_up", False)),
+            bool(getattr(ship, "moving_down", False)),
+            mouse_pos[0],
+            mouse_pos[1],
+            int(mouse_fire),
+            bullets_count,
+            aliens_count,
+            nan if nearest_dx is None else nearest_dx,
+            nan if nearest_dy is None else nearest_dy,
+            nan if nearest_dist is None else nearest_dist,
+            nan if nearest_vx is None else nearest_vx,
+            nan if nearest_vy is None else nearest_vy,
+        )
 
     def _format_row_for_console(self, row: dict) -> str:
         # Compact one-line representation
@@ -182,6 +193,6 @@ class Recorder:
         parts.append(f"angle={round(row.get('ship_angle',0),2)}")
         parts.append(f"fire={row.get('mouse_fire')}")
         parts.append(f"aliens={row.get('aliens_count')}")
-        if row.get('nearest_alien_distance') is not None:
+        if not math.isnan(row.get('nearest_alien_distance', math.nan)):
             parts.append(f"nearest_alien_dist={int(row.get('nearest_alien_distance'))}")
         return " | ".join(parts)
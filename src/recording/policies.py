@@ -0,0 +1,230 @@
+"""Which frames the recorder keeps, and how training rebuilds the frames it skipped.
+
+Consecutive rows are mostly identical, so a `RecordingPolicy` decides per frame which rows to write:
+
+    every_frame  every frame
+    every_nth    every `n`th frame
+    on_change    a frame when a field moved more than its tolerance since the last written row, and at least every
+                 `max_interval_ms`
+    events       bursts of frames around events: `before` frames ahead of and `after` frames following each shot,
+                 hit (lost a heart or a ship) or pickup (gained a heart); nothing in between
+
+No policy loses the training label: every_nth and events keep every frame that fires, on_change keeps the frames
+where firing starts or stops and densifying holds it in between. `policy.describe()` is stored with the session in
+the recording's manifest; `policy_from_description()` rebuilds the policy and its `densify()` turns the rows it kept
+back into a frame every `frame_ms`; `iter_dense_segments()` does that for a recording.
+"""
+
+import math
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+from .. import settings
+from .storage import RECORD_DTYPE, read_manifest, read_segment
+
+_FIELDS = RECORD_DTYPE.names
+_TIMESTAMP = _FIELDS.index("timestamp_ms")
+_FIRE = _FIELDS.index("mouse_fire")
+_HEALTH = _FIELDS.index("health")
+_SHIPS_LEFT = _FIELDS.index("ships_left")
+
+# Interpolated between kept rows when densifying; everything else holds its last value.
+LINEAR_FIELDS = (
+    "ship_x", "ship_y", "mouse_x", "mouse_y",
+    "nearest_alien_dx", "nearest_alien_dy", "nearest_alien_distance", "nearest_alien_vx", "nearest_alien_vy",
+)
+# Interpolated along the shorter way around the circle
+ANGLE_FIELDS = ("ship_angle",)
+
+
+class RecordingPolicy:
+    """Keeps every frame."""
+
+    name = "every_frame"
+
+    def select(self, values: tuple) -> tuple[tuple, ...]:
+        """The rows to write for this frame's row `values` (in `RECORD_DTYPE` order)."""
+        return (values,)
+
+    def describe(self) -> dict:
+        return {"name": self.name}
+
+    def densify(self, rows: np.ndarray, frame_ms: float) -> np.ndarray:
+        """A row for every frame, rebuilt from the rows this policy kept."""
+        return rows
+
+
+class EveryNth(RecordingPolicy):
+    """Keeps every `n`th frame, and every frame that fires."""
+
+    name = "every_nth"
+
+    def __init__(self, n: int = settings.RECORDER_EVERY_NTH) -> None:
+        self.n: int = n
+        self.__frame: int = 0
+
+    def select(self, values: tuple) -> tuple[tuple, ...]:
+        self.__frame += 1
+        if self.__frame >= self.n or values[_FIRE]:
+            self.__frame = 0
+            return (values,)
+        return ()
+
+    def describe(self) -> dict:
+        return {"name": self.name, "n": self.n}
+
+    def densify(self, rows: np.ndarray, frame_ms: float) -> np.ndarray:
+        # Fire is kept on every frame it happens, so the skipped frames did not fire.
+        return densify(rows, frame_ms, max_gap_ms=math.inf, interpolate=True, fire_events=True)
+
+
+class OnChange(RecordingPolicy):
+    """Keeps a frame when any field changed by more than its tolerance (0 for fields without one, and always 0 for
+    mouse_fire) since the last kept frame, and at least one frame every `max_interval_ms`."""
+
+    name = "on_change"
+
+    def __init__(self, tolerances: dict[str, float] | None = None,
+                 max_interval_ms: int = settings.RECORDER_CHANGE_MAX_INTERVAL_MS) -> None:
+        self.tolerances: dict[str, float] = dict(settings.RECORDER_CHANGE_TOLERANCES if tolerances is None
+                                                 else tolerances)
+        self.max_interval_ms: int = max_interval_ms
+        self.__checks: list[tuple[int, float]] = [
+            (index, 0 if index == _FIRE else self.tolerances.get(name, 0))
+            for index, name in enumerate(_FIELDS) if index != _TIMESTAMP
+        ]
+        self.__last: tuple | None = None
+
+    def select(self, values: tuple) -> tuple[tuple, ...]:
+        last = self.__last
+        if (last is None or values[_TIMESTAMP] - last[_TIMESTAMP] >= self.max_interval_ms
+                or self.__changed(last, values)):
+            self.__last = values
+            return (values,)
+        return ()
+
+    def describe(self) -> dict:
+        return {"name": self.name, "tolerances": self.tolerances, "max_interval_ms": self.max_interval_ms}
+
+    def densify(self, rows: np.ndarray, frame_ms: float) -> np.ndarray:
+        # Holding the last kept row is within the tolerances until the next one.
+        return densify(rows, frame_ms, max_gap_ms=self.max_interval_ms + frame_ms, interpolate=False)
+
+    def __changed(self, last: tuple, values: tuple) -> bool:
+        for index, tolerance in self.__checks:
+            old, new = last[index], values[index]
+            if old == new or abs(new - old) <= tolerance:
+                continue
+            if old != old and new != new:  # Both NaN (no alien)
+                continue
+            return True
+        return False
+
+
+class EventBurst(RecordingPolicy):
+    """Keeps `before` frames ahead of and `after` frames following every shot, hit or pickup."""
+
+    name = "events"
+
+    def __init__(self, before: int = settings.RECORDER_BURST_FRAMES[0],
+                 after: int = settings.RECORDER_BURST_FRAMES[1]) -> None:
+        self.before: int = before
+        self.after: int = after
+        self.__history: deque = deque(maxlen=before)
+        self.__remaining: int = 0
+        self.__last: tuple | None = None
+
+    def select(self, values: tuple) -> tuple[tuple, ...]:
+        last, self.__last = self.__last, values
+        event = values[_FIRE] or last is not None and (
+            values[_HEALTH] != last[_HEALTH] or values[_SHIPS_LEFT] < last[_SHIPS_LEFT]
+        )
+
+        if event:
+            rows = (*self.__history, values)
+            self.__history.clear()
+            self.__remaining = self.after
+            return rows
+        if self.__remaining:
+            self.__remaining -= 1
+            return (values,)
+        self.__history.append(values)
+        return ()
+
+    def describe(self) -> dict:
+        return {"name": self.name, "before": self.before, "after": self.after}
+
+    def densify(self, rows: np.ndarray, frame_ms: float) -> np.ndarray:
+        # Only fill the bursts; frame times jitter, so allow a few frames between kept rows.
+        return densify(rows, frame_ms, max_gap_ms=4 * frame_ms, interpolate=True, fire_events=True)
+
+
+POLICIES = {policy.name: policy for policy in (RecordingPolicy, EveryNth, OnChange, EventBurst)}
+
+
+def make_policy(name: str = settings.RECORDER_POLICY) -> RecordingPolicy:
+    """The policy called `name`, with the settings' parameters."""
+    return POLICIES[name]()
+
+
+def policy_from_description(description: dict) -> RecordingPolicy:
+    """Rebuild the policy a session was recorded with from `describe()`."""
+    parameters = dict(description)
+    return POLICIES[parameters.pop("name")](**parameters)
+
+
+def iter_dense_segments(directory: Path | str, segments: list[dict] | None = None) -> Iterator[np.ndarray]:
+    """Like `iter_segments()`, with the frames skipped by each session's policy rebuilt."""
+    manifest = read_manifest(directory)
+    for segment in manifest["segments"] if segments is None else segments:
+        session = manifest["sessions"][segment["session"]]
+        policy = policy_from_description(session.get("policy", {"name": RecordingPolicy.name}))
+        yield policy.densify(read_segment(directory, segment), session.get("frame_ms", 1000 / settings.FPS))
+
+
+def densify(rows: np.ndarray, frame_ms: float, max_gap_ms: float, interpolate: bool,
+            fire_events: bool = False) -> np.ndarray:
+    """Rebuild a frame every `frame_ms` from the kept `rows` (sorted by timestamp).
+
+    Every frame takes the last kept row at or before it; frames more than `max_gap_ms` after it are left out. With
+    `interpolate`, `LINEAR_FIELDS` and `ANGLE_FIELDS` move towards the next kept row (holding where either is
+    missing). With `fire_events`, mouse_fire is set only on the frame nearest to each kept row that fired.
+    """
+    if len(rows) < 2:
+        return rows.copy()
+
+    timestamps = rows["timestamp_ms"].astype(np.float64)
+    times = np.arange(timestamps[0], timestamps[-1] + frame_ms / 2, frame_ms)
+    previous = np.searchsorted(timestamps, times, side="right") - 1
+    keep = times - timestamps[previous] <= max_gap_ms
+    times, previous = times[keep], previous[keep]
+
+    dense = rows[previous]
+    dense["timestamp_ms"] = np.round(times).astype(np.int64)
+
+    if interpolate:
+        following = np.minimum(previous + 1, len(rows) - 1)
+        span = timestamps[following] - timestamps[previous]
+        fraction = np.divide(times - timestamps[previous], span, out=np.zeros_like(times), where=span > 0)
+        for name in LINEAR_FIELDS + ANGLE_FIELDS:
+            if name not in rows.dtype.names:
+                continue
+            start = rows[name][previous].astype(np.float64)
+            change = rows[name][following].astype(np.float64) - start
+            if name in ANGLE_FIELDS:
+                change = (change + math.pi) % (2 * math.pi) - math.pi
+            value = np.where(np.isnan(change), start, start + change * fraction)
+            dense[name] = np.round(value) if dense[name].dtype.kind in "iu" else value
+
+    if fire_events and "mouse_fire" in rows.dtype.names:
+        dense["mouse_fire"] = 0
+        fired = timestamps[rows["mouse_fire"] > 0]
+        after = np.searchsorted(times, fired).clip(0, len(times) - 1)
+        before = (after - 1).clip(0)
+        nearest = np.where(np.abs(times[after] - fired) < np.abs(fired - times[before]), after, before)
+        dense["mouse_fire"][nearest] = 1
+
+    return dense
@@ -0,0 +1,253 @@
+"""Full world-state snapshots: every entity's type, position, velocity and angle, every frame.
+
+A frame is a variable number of `ENTITY_DTYPE` records: the ship, then every sprite of the given groups. Frames are
+packed into flat arrays, per segment of a snapshot recording (a recording directory, see `storage.py`):
+
+    timestamps  int64, one per frame
+    offsets     int64, one per frame plus one; frame i is entities[offsets[i]:offsets[i + 1]]
+    entities    ENTITY_DTYPE, all frames' entities one after another
+
+Positions are sprite rect centers and angles are in radians (aliens turn in degrees). Sprites in an `EntityGroup`
+have their velocities and angles copied out of its `EntityStore` with a few array operations per group, so recording
+stays cheap during play; the few sprites of plain groups (hearts, shields) are read one by one.
+
+`iter_frames()` yields each frame as a view into its segment's arrays; `iter_snapshot_segments()` yields whole
+segments for vectorized work.
+"""
+
+import atexit
+import io
+import logging
+import math
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import pygame
+from pygame.sprite import Group
+
+from .. import settings
+from ..entity_store import TYPE_ALIEN_L1, TYPE_ALIEN_L2, TYPE_CARGO_ALIEN, TYPE_NONE
+from .storage import SessionWriter, open_segment, read_manifest
+from .writer_thread import BackgroundWriter
+
+SNAPSHOT_SCHEMA_VERSION = 1
+
+ENTITY_DTYPE = np.dtype([
+    ("type", np.int8),  # entity_store TYPE_* id
+    ("x", np.float32),
+    ("y", np.float32),
+    ("vx", np.float32),
+    ("vy", np.float32),
+    ("angle", np.float32),
+])
+
+# Whether a type's angle is kept in degrees (the aliens), by type id
+_IN_DEGREES = np.zeros(128, dtype=np.bool_)
+_IN_DEGREES[[TYPE_ALIEN_L1, TYPE_ALIEN_L2, TYPE_CARGO_ALIEN]] = True
+
+
+class SnapshotSegment(NamedTuple):
+    timestamps: np.ndarray
+    offsets: np.ndarray
+    entities: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def frame(self, index: int) -> np.ndarray:
+        """The entities of frame `index`, as a view."""
+        return self.entities[self.offsets[index]:self.offsets[index + 1]]
+
+
+class SnapshotWriter(SessionWriter):
+    """Packs frames into a preallocated entity array and writes it out as a compressed segment when it is full.
+
+    `segment_bytes` caps the uncompressed size of a segment's entities. `append()` takes a frame as
+    `(timestamp_ms, entities)`, so the writer also works behind a `BackgroundWriter`.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        segment_bytes: int = 1024 * 1024,
+        compression: str = "gzip",
+        session_info: dict | None = None,
+    ) -> None:
+        super().__init__(directory, ENTITY_DTYPE, compression, session_info, SNAPSHOT_SCHEMA_VERSION)
+        self.segment_entities: int = max(1, segment_bytes // ENTITY_DTYPE.itemsize)
+
+        self.rows_written: int = 0
+        self.__entities: np.ndarray = np.zeros(self.segment_entities, dtype=ENTITY_DTYPE)
+        self.__count: int = 0
+        self.__timestamps: list[int] = []
+        self.__offsets: list[int] = [0]
+
+    def append(self, frame: tuple[int, np.ndarray]) -> None:
+        """Store one frame."""
+        timestamp_ms, entities = frame
+        end = self.__count + len(entities)
+        if end > len(self.__entities):
+            self.flush()
+            end = len(entities)
+            if end > len(self.__entities):
+                # A frame larger than a segment gets a segment of its own.
+                self.__entities = np.zeros(end, dtype=ENTITY_DTYPE)
+
+        self.__entities[self.__count:end] = entities
+        self.__count = end
+        self.__timestamps.append(timestamp_ms)
+        self.__offsets.append(end)
+
+    def flush(self) -> None:
+        """Write the buffered frames as a segment."""
+        if not self.__timestamps:
+            return
+
+        timestamps = np.array(self.__timestamps, dtype=np.int64)
+        offsets = np.array(self.__offsets, dtype=np.int64)
+        entities = self.__entities[:self.__count]
+
+        def save(stream) -> None:
+            # np.savez needs a seekable file.
+            buffer = io.BytesIO()
+            np.savez(buffer, timestamps=timestamps, offsets=offsets, entities=entities)
+            stream.write(buffer.getbuffer())
+
+        self._write_segment("snapshots", ".npz", save, {
+            "rows": len(timestamps),
+            "entities": self.__count,
+            "first_timestamp_ms": int(timestamps[0]),
+            "last_timestamp_ms": int(timestamps[-1]),
+        })
+
+        self.rows_written += len(timestamps)
+        if len(self.__entities) > self.segment_entities:
+            self.__entities = np.zeros(self.segment_entities, dtype=ENTITY_DTYPE)
+        self.__count = 0
+        self.__timestamps = []
+        self.__offsets = [0]
+
+    def close(self) -> None:
+        self.flush()
+
+
+class SnapshotRecorder:
+    """Records a snapshot of the ship and every sprite of the game's groups each frame.
+
+    Usage:
+        snapshots = SnapshotRecorder(settings.SNAPSHOT_PATH)
+        snapshots.record(ship, (bullets, alien_bullets, aliens, cargoes, hearts, shields))
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, directory: Path | str, segment_bytes: int = settings.RECORDER_SEGMENT_BYTES,
+                 compression: str = settings.RECORDER_COMPRESSION, background: bool = settings.RECORDER_BACKGROUND):
+        self.directory = Path(directory)
+        self._writer = SnapshotWriter(self.directory, segment_bytes, compression,
+                                      {"frame_ms": 1000 / settings.FPS})
+        if background:
+            self._writer = BackgroundWriter(self._writer, name="Snapshots")
+        self._closed = False
+
+        # Ensure buffered frames are written on exit
+        atexit.register(self.close)
+
+    @property
+    def frames_written(self) -> int:
+        return self._writer.rows_written
+
+    def record(self, ship, groups: Iterable[Group]) -> None:
+        """Record the current frame."""
+        entities = capture(ship, groups)
+        self._writer.append((pygame.time.get_ticks(), entities))
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._writer.close()
+        except Exception:
+            self.__logger.exception(f"Failed to close snapshots {self.directory}")
+        if isinstance(self._writer, BackgroundWriter):
+            self.__logger.info(self._writer.report())
+
+
+def capture(ship, groups: Iterable[Group]) -> np.ndarray:
+    """The entities of one frame: the ship (if any), then the sprites of `groups`."""
+    # Filled in place: concatenating structured arrays costs more than copying them.
+    sources = [] if ship is None else [[ship]]
+    for group in groups:
+        store = getattr(group, "store", None)
+        sources.append(group.sprites() if store is None else store)
+
+    entities = np.empty(sum(len(source) for source in sources), dtype=ENTITY_DTYPE)
+    start = 0
+    for source in sources:
+        end = start + len(source)
+        if end > start:
+            if isinstance(source, list):
+                _capture_sprites(source, entities[start:end])
+            else:
+                _capture_store(source, entities[start:end])
+        start = end
+    return entities
+
+
+def _capture_store(store, entities: np.ndarray) -> None:
+    slots = store.slots()
+    types = store.type_id[slots]
+    entities["type"] = types
+    # Rect centers, not the store's x/y: the rect is where the sprite is drawn and collides (clamped to the screen,
+    # or placed and moved on its own, like a cargo alien's).
+    sprites = store.sprites
+    centers = np.fromiter((sprites[slot].rect.center for slot in slots.tolist()),
+                          dtype=np.dtype((np.float32, 2)), count=len(slots))
+    entities["x"] = centers[:, 0]
+    entities["y"] = centers[:, 1]
+    entities["vx"] = store.vx[slots]
+    entities["vy"] = store.vy[slots]
+    angle = store.angle[slots]
+    degrees = _IN_DEGREES[types]
+    entities["angle"] = np.where(degrees, np.radians(angle), angle) if degrees.any() else angle
+
+
+def _capture_sprites(sprites: list, entities: np.ndarray) -> None:
+    for index, sprite in enumerate(sprites):
+        type_id = getattr(sprite, "type_id", TYPE_NONE)
+        center = getattr(sprite, "center", None) or sprite.rect.center
+        vx, vy = getattr(sprite, "vx", 0.0), getattr(sprite, "vy", 0.0)
+        if hasattr(sprite, "moving_right"):
+            # The ship moves by its movement flags.
+            vx = (sprite.moving_right - sprite.moving_left) * settings.SHIP_SPEED_FACTOR_X
+            vy = (sprite.moving_down - sprite.moving_up) * settings.SHIP_SPEED_FACTOR_Y
+        angle = float(getattr(sprite, "angle", 0.0))
+        if _IN_DEGREES[type_id]:
+            angle = math.radians(angle)
+        entities[index] = (type_id, center[0], center[1], vx, vy, angle)
+
+
+def read_snapshot_segment(directory: Path | str, segment: dict) -> SnapshotSegment:
+    """The frames of one segment (a manifest entry)."""
+    with open_segment(directory, segment) as stream:
+        data = np.load(io.BytesIO(stream.read()))
+        return SnapshotSegment(data["timestamps"], data["offsets"], data["entities"])
+
+
+def iter_snapshot_segments(directory: Path | str, segments: list[dict] | None = None) -> Iterator[SnapshotSegment]:
+    """Yield `segments` (by default all of the recording), one at a time."""
+    if segments is None:
+        segments = read_manifest(directory)["segments"]
+    for segment in segments:
+        yield read_snapshot_segment(directory, segment)
+
+
+def iter_frames(directory: Path | str, segments: list[dict] | None = None) -> Iterator[tuple[int, np.ndarray]]:
+    """Yield `(timestamp_ms, entities)` for every frame of `segments` (by default all of the recording)."""
+    for snapshot in iter_snapshot_segments(directory, segments):
+        offsets = snapshot.offsets.tolist()
+        for index, timestamp in enumerate(snapshot.timestamps.tolist()):
+            yield timestamp, snapshot.entities[offsets[index]:offsets[index + 1]]
@@ -0,0 +1,306 @@
+"""Columnar storage of gameplay recordings.
+
+Rows have a fixed schema (`RECORD_DTYPE`) and are appended into a preallocated NumPy structured array; when it holds
+`segment_bytes` of rows it is written out, compressed, as one segment. Every run of the game (every `SegmentWriter`)
+is a session with its own segments. A recording is a directory:
+
+    manifest.json                           schema version, dtype, sessions (with how they were recorded) and an
+                                            index of every segment
+    <session>/segment_00000.npy.gz          the rows of a segment, an .npy file compressed with gzip (or lzma, .xz)
+
+The manifest lists each segment's session, file, row count, first and last timestamp and per-field min, max and
+mean, so tools pick the segments they need with `select_segments()` and stream them with `iter_segments()`.
+`read_recording()` reads them into one array and `export_csv()` turns them into the CSV the recorder used to write.
+`CsvWriter` still writes that CSV directly, for tools that want it live.
+"""
+
+import csv
+import gzip
+import json
+import lzma
+import math
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import IO
+
+import numpy as np
+
+SCHEMA_VERSION = 1
+
+RECORD_DTYPE = np.dtype([
+    ("timestamp_ms", np.int64),
+    ("score", np.int32),
+    ("ships_left", np.int16),
+    ("health", np.int16),
+    ("ship_x", np.int16),
+    ("ship_y", np.int16),
+    ("ship_angle", np.float32),
+    ("moving_left", np.bool_),
+    ("moving_right", np.bool_),
+    ("moving_up", np.bool_),
+    ("moving_down", np.bool_),
+    ("mouse_x", np.int16),
+    ("mouse_y", np.int16),
+    ("mouse_fire", np.uint8),
+    ("bullets_count", np.int16),
+    ("aliens_count", np.int16),
+    # NaN when there is no alien.
+    ("nearest_alien_dx", np.float32),
+    ("nearest_alien_dy", np.float32),
+    ("nearest_alien_distance", np.float32),
+    ("nearest_alien_vx", np.float32),
+    ("nearest_alien_vy", np.float32),
+])
+
+MANIFEST = "manifest.json"
+
+# Segment compression: file suffix and opener
+COMPRESSION = {
+    "gzip": (".gz", gzip.open),
+    "lzma": (".xz", lzma.open),
+}
+
+
+def record_dtype(fieldnames: list[str] | None = None) -> np.dtype:
+    """The schema, or the part of it holding `fieldnames` (in that order)."""
+    if fieldnames is None:
+        return RECORD_DTYPE
+    unknown = [name for name in fieldnames if name not in RECORD_DTYPE.names]
+    if unknown:
+        raise ValueError(f"Fields not in the recording schema: {unknown}")
+    return np.dtype([(name, RECORD_DTYPE[name]) for name in fieldnames])
+
+
+def _dtype_descr(dtype: np.dtype) -> list[list[str]]:
+    return [[name, dtype[name].str] for name in dtype.names]
+
+
+class SessionWriter:
+    """Adds a session of compressed segment files to a recording directory and keeps its manifest.
+
+    Each writer records a new session; writing to an existing recording adds the session to it, and the `dtype` of
+    its data must match. `session_info` is stored with the session.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        dtype: np.dtype,
+        compression: str = "gzip",
+        session_info: dict | None = None,
+        schema_version: int = SCHEMA_VERSION,
+    ) -> None:
+        self.directory: Path = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dtype: np.dtype = dtype
+        self.suffix, self.__open = COMPRESSION[compression]
+        self.segments_written: int = 0
+
+        manifest_path = self.directory / MANIFEST
+        if manifest_path.exists():
+            self.__manifest: dict = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if self.__manifest["dtype"] != _dtype_descr(dtype):
+                raise ValueError(f"{self.directory} holds a recording with a different schema")
+        else:
+            self.__manifest = {"schema_version": schema_version, "dtype": _dtype_descr(dtype), "sessions": {},
+                               "segments": []}
+
+        # The session is added to the recording with its first segment.
+        self.session: str = self.__new_session()
+        self.__session_info: dict = {"started": time.strftime("%Y-%m-%dT%H:%M:%S"), **(session_info or {})}
+
+    def _write_segment(self, name: str, extension: str, save: Callable[[IO[bytes]], None], entry: dict) -> None:
+        """Write the next segment file `name` through `save(stream)` and index it in the manifest with `entry`."""
+        if not self.segments_written:
+            (self.directory / self.session).mkdir()
+            self.__manifest["sessions"][self.session] = self.__session_info
+
+        file = f"{self.session}/{name}_{self.segments_written:05d}{extension}{self.suffix}"
+        temp_path = self.directory / f"{file}.tmp"
+        with self.__open(temp_path, "wb") as stream:
+            save(stream)
+        os.replace(temp_path, self.directory / file)
+
+        self.__manifest["segments"].append({
+            "session": self.session,
+            "file": file,
+            "bytes": (self.directory / file).stat().st_size,
+            **entry,
+        })
+        self.__write_manifest()
+        self.segments_written += 1
+
+    def __new_session(self) -> str:
+        name = time.strftime("%Y%m%d-%H%M%S")
+        session, number = name, 1
+        while session in self.__manifest["sessions"] or (self.directory / session).exists():
+            number += 1
+            session = f"{name}-{number}"
+        return session
+
+    def __write_manifest(self) -> None:
+        path = self.directory / MANIFEST
+        path.with_suffix(".tmp").write_text(json.dumps(self.__manifest, indent=1), encoding="utf-8")
+        os.replace(path.with_suffix(".tmp"), path)
+
+
+class SegmentWriter(SessionWriter):
+    """Appends rows to a preallocated structured array and writes it out as a compressed segment when it is full.
+
+    `segment_bytes` caps the uncompressed size of a segment.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        dtype: np.dtype = RECORD_DTYPE,
+        segment_bytes: int = 1024 * 1024,
+        compression: str = "gzip",
+        session_info: dict | None = None,
+    ) -> None:
+        super().__init__(directory, dtype, compression, session_info)
+        self.segment_rows: int = max(1, segment_bytes // dtype.itemsize)
+
+        self.rows_written: int = 0
+        self.__buffer: np.ndarray = np.zeros(self.segment_rows, dtype=dtype)
+        self.__count: int = 0
+
+    def append(self, values: tuple) -> None:
+        """Store one row (values in schema order)."""
+        self.__buffer[self.__count] = values
+        self.__count += 1
+        if self.__count == self.segment_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered rows as a segment."""
+        if self.__count == 0:
+            return
+
+        rows = self.__buffer[:self.__count]
+        timestamps = rows["timestamp_ms"] if "timestamp_ms" in self.dtype.names else None
+        self._write_segment("segment", ".npy", lambda stream: np.save(stream, rows), {
+            "rows": int(self.__count),
+            "first_timestamp_ms": int(timestamps[0]) if timestamps is not None else None,
+            "last_timestamp_ms": int(timestamps[-1]) if timestamps is not None else None,
+            "stats": summary_stats(rows),
+        })
+
+        self.rows_written += self.__count
+        self.__count = 0
+
+    def close(self) -> None:
+        self.flush()
+
+
+def summary_stats(rows: np.ndarray) -> dict[str, dict[str, float]]:
+    """Min, max and mean of every field of `rows`, ignoring missing (NaN) values; fields with none are left out."""
+    stats = {}
+    for name in rows.dtype.names:
+        column = rows[name]
+        if column.dtype.kind == "f":
+            column = column[~np.isnan(column)]
+        if not len(column):
+            continue
+        column = column.astype(np.float64)
+        stats[name] = {"min": float(column.min()), "max": float(column.max()), "mean": round(float(column.mean()), 4)}
+    return stats
+
+
+class CsvWriter:
+    """Writes rows to a CSV file with a header, appending to an existing one unless `append` is False."""
+
+    def __init__(self, path: Path | str, fieldnames: list[str], append: bool = True) -> None:
+        self.path: Path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fieldnames: list[str] = fieldnames
+        self.rows_written: int = 0
+
+        self.__file = open(self.path, "a" if append else "w", newline="", encoding="utf-8")
+        self.__writer = csv.writer(self.__file)
+        if self.__file.tell() == 0:
+            self.__writer.writerow(fieldnames)
+
+    def append(self, values: tuple) -> None:
+        self.__writer.writerow(_csv_values(values))
+        self.rows_written += 1
+
+    def flush(self) -> None:
+        self.__file.flush()
+
+    def close(self) -> None:
+        if not self.__file.closed:
+            self.__file.close()
+
+
+def _csv_values(values) -> list:
+    # Missing values (NaN) are written as empty cells.
+    return ["" if isinstance(value, float) and math.isnan(value) else value for value in values]
+
+
+def read_manifest(directory: Path | str) -> dict:
+    return json.loads((Path(directory) / MANIFEST).read_text(encoding="utf-8"))
+
+
+def select_segments(
+    directory: Path | str,
+    sessions: Iterable[str] | None = None,
+    last_sessions: int | None = None,
+    where: Callable[[dict], bool] | None = None,
+) -> list[dict]:
+    """Manifest entries of the segments in `sessions` (or in the `last_sessions` most recent ones) for which
+    `where(entry)` holds, oldest first."""
+    manifest = read_manifest(directory)
+    selected = set(manifest["sessions"]) if sessions is None else set(sessions)
+    if last_sessions is not None:
+        selected &= set(sorted(manifest["sessions"])[-last_sessions:] if last_sessions else [])
+    return [segment for segment in manifest["segments"]
+            if segment["session"] in selected and (where is None or where(segment))]
+
+
+def read_segment(directory: Path | str, segment: dict) -> np.ndarray:
+    """The rows of one segment (a manifest entry)."""
+    with open_segment(directory, segment) as stream:
+        return np.load(stream)
+
+
+def open_segment(directory: Path | str, segment: dict) -> IO[bytes]:
+    """The decompressed contents of a segment file (a manifest entry)."""
+    path = Path(directory) / segment["file"]
+    opener = next(opener for suffix, opener in COMPRESSION.values() if path.name.endswith(suffix))
+    return opener(path, "rb")
+
+
+def iter_segments(directory: Path | str, segments: list[dict] | None = None) -> Iterator[np.ndarray]:
+    """Yield the rows of `segments` (by default all of the recording), one segment at a time."""
+    if segments is None:
+        segments = read_manifest(directory)["segments"]
+    for segment in segments:
+        yield read_segment(directory, segment)
+
+
+def read_recording(directory: Path | str, segments: list[dict] | None = None) -> np.ndarray:
+    """The rows of `segments` (by default all of the recording) as one structured array."""
+    parts = list(iter_segments(directory, segments))
+    if not parts:
+        manifest = read_manifest(directory)
+        return np.zeros(0, dtype=np.dtype([(name, code) for name, code in manifest["dtype"]]))
+    return np.concatenate(parts)
+
+
+def export_csv(directory: Path | str, csv_path: Path | str, segments: list[dict] | None = None) -> int:
+    """Write `segments` (by default all of the recording) as CSV (the recorder's old output format), replacing
+    `csv_path`; returns the number of rows."""
+    writer = None
+    try:
+        for rows in iter_segments(directory, segments):
+            if writer is None:
+                writer = CsvWriter(csv_path, list(rows.dtype.names), append=False)
+            for values in rows.tolist():
+                writer.append(values)
+        return writer.rows_written if writer is not None else 0
+    finally:
+        if writer is not None:
+            writer.close()
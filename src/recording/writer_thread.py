@@ -0,0 +1,171 @@
+"""Hands recorded rows to a writer thread, so disk I/O never happens on the game thread.
+
+`BackgroundWriter` wraps a row writer (`SegmentWriter`, `CsvWriter`) with a bounded ring buffer. `append()` only stores
+the row; a daemon thread takes everything queued at once and passes it to the wrapped writer. When the ring is full
+the `OverflowPolicy` decides what is lost:
+
+    block        wait for the writer thread, at most `block_timeout` seconds, then drop the row
+    drop_oldest  overwrite the oldest queued row
+    sample       keep only every `sample_every`th row once the ring is half full, drop new rows when it is full
+
+`close()` drains the ring, closes the wrapped writer and stops the thread.
+"""
+
+import logging
+import threading
+from enum import StrEnum
+
+from .. import settings
+
+
+class OverflowPolicy(StrEnum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    SAMPLE = "sample"
+
+
+class BackgroundWriter:
+    """Queues rows in a ring buffer and writes them on a background thread."""
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        writer,
+        capacity: int = settings.RECORDER_QUEUE_ROWS,
+        policy: OverflowPolicy = OverflowPolicy(settings.RECORDER_OVERFLOW_POLICY),
+        block_timeout: float = settings.RECORDER_BLOCK_TIMEOUT,
+        sample_every: int = 4,
+        name: str = "Recorder",
+    ) -> None:
+        self.writer = writer
+        self.name: str = name
+        self.capacity: int = capacity
+        self.policy: OverflowPolicy = OverflowPolicy(policy)
+        self.block_timeout: float = block_timeout
+        self.sample_every: int = sample_every
+
+        # Rows accepted into the ring, handed to the writer, and lost to overflow (or to a failing writer)
+        self.queued: int = 0
+        self.written: int = 0
+        self.dropped: int = 0
+
+        self.__ring: list = [None] * capacity
+        self.__head: int = 0
+        self.__size: int = 0
+        self.__sampled: int = 0
+        self.__closed: bool = False
+        self.__failed: bool = False
+        self.__busy: bool = False
+        self.__condition = threading.Condition()
+        self.__thread = threading.Thread(target=self.__run, name=f"{name.lower()}-writer", daemon=True)
+        self.__thread.start()
+
+    @property
+    def rows_written(self) -> int:
+        return self.written
+
+    @property
+    def pending(self) -> int:
+        """Rows queued but not written yet."""
+        return self.__size
+
+    def append(self, values: tuple) -> None:
+        """Queue one row; returns at once unless the policy is "block" and the ring is full."""
+        with self.__condition:
+            if self.__closed:
+                self.dropped += 1
+                return
+
+            if self.__size == self.capacity:
+                if self.policy is OverflowPolicy.DROP_OLDEST:
+                    self.__ring[self.__head] = None
+                    self.__head = (self.__head + 1) % self.capacity
+                    self.__size -= 1
+                    self.dropped += 1
+                else:
+                    if self.policy is OverflowPolicy.BLOCK:
+                        self.__condition.wait_for(lambda: self.__size < self.capacity, self.block_timeout)
+                    if self.__size == self.capacity:
+                        self.dropped += 1
+                        return
+            elif self.policy is OverflowPolicy.SAMPLE and self.__size >= self.capacity // 2:
+                self.__sampled += 1
+                if self.__sampled % self.sample_every:
+                    self.dropped += 1
+                    return
+
+            self.__ring[(self.__head + self.__size) % self.capacity] = values
+            self.__size += 1
+            self.queued += 1
+            if self.__size == 1:
+                self.__condition.notify_all()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every queued row has been handed to the writer; False on timeout."""
+        with self.__condition:
+            return self.__condition.wait_for(lambda: not self.__size and not self.__busy, timeout)
+
+    def close(self) -> None:
+        """Write out everything queued, close the writer and stop the thread."""
+        with self.__condition:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__condition.notify_all()
+        self.__thread.join()
+
+    def report(self) -> str:
+        return f"{self.name}: {self.queued} rows queued, {self.written} written, {self.dropped} dropped"
+
+    def __run(self) -> None:
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(lambda: self.__size or self.__closed)
+                if not self.__size:
+                    break
+                batch = self.__take()
+                self.__busy = True
+                # Room for a blocked append()
+                self.__condition.notify_all()
+
+            written = self.__write(batch)
+            with self.__condition:
+                self.written += written
+                self.dropped += len(batch) - written
+                self.__busy = False
+                self.__condition.notify_all()
+
+        try:
+            self.writer.close()
+        except Exception:
+            self.__logger.exception("Failed to close the recording")
+
+    def __take(self) -> list:
+        end = self.__head + self.__size
+        if end <= self.capacity:
+            batch = self.__ring[self.__head:end]
+            self.__ring[self.__head:end] = [None] * self.__size
+        else:
+            end -= self.capacity
+            batch = self.__ring[self.__head:] + self.__ring[:end]
+            self.__ring[self.__head:] = [None] * (self.capacity - self.__head)
+            self.__ring[:end] = [None] * end
+        self.__head = end % self.capacity
+        self.__size = 0
+        return batch
+
+    def __write(self, batch: list) -> int:
+        """Hand `batch` to the writer; returns how many rows it took."""
+        if self.__failed:
+            return 0
+        written = 0
+        try:
+            for values in batch:
+                self.writer.append(values)
+                written += 1
+        except Exception:
+            # Keep the game running; the rest of the recording is lost.
+            self.__failed = True
+            self.__logger.exception("Recording writer failed, dropping further rows")
+        return written
@@ -1,14 +1,34 @@
 import pygame
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cache
 
 from . import settings
+from .resources.asset_pack import AssetPack, folder_fingerprint, open_asset_pack
 from .settings import ASSETS_DIR
 
 
 DIR = ASSETS_DIR / "background"
 
 
+def background_fingerprint(size: tuple[int, int]) -> str:
+    """Hash of the background images and the size they are scaled to."""
+    return folder_fingerprint(DIR, f"{size[0]}x{size[1]}")
+
+
+@cache
+def packed_backgrounds(size: tuple[int, int]) -> AssetPack | None:
+    """The asset pack, if it holds the current backgrounds scaled to `size`."""
+    pack = open_asset_pack()
+    if pack is None:
+        return None
+    section = pack.meta.get("backgrounds")
+    if section is None or section["key"] != background_fingerprint(size):
+        return None
+    return pack
+
+
 @dataclass
 class Region:
     """Represents a region in the game.
@@ -17,6 +37,9 @@ class Region:
             background_name (str): Background path in the background directory.
             min_score (int): Minimum score this region require.
             size (tuple[int, int]): Region background size
+
+        The background is loaded the first time it is used, or ahead of time on a worker
+        thread with `prefetch`, and can be dropped again with `unload`.
     """
 
     region_name: str
@@ -25,26 +48,85 @@ class Region:
     size: tuple[int, int]
 
     logger: logging.Logger = field(init=False)
-    background: pygame.Surface = field(init=False)
 
     def __post_init__(self):
         self.logger = logging.getLogger(__name__)
+        self.__background: pygame.Surface | None = None
+        self.__pending: Future | None = None
+
+    @property
+    def background(self) -> pygame.Surface:
+        """The scaled background, loaded now if it isn't yet."""
+        if self.__background is None:
+            if self.__pending is not None:
+                image: pygame.Surface = self.__pending.result()
+                self.__pending = None
+            else:
+                image = self.__decode()
+            # Converting needs the display format, so it's done here and not on the worker.
+            self.__background = image.convert()
+        return self.__background
+
+    @property
+    def loaded(self) -> bool:
+        return self.__background is not None
+
+    @property
+    def pending(self) -> Future | None:
+        """The prefetch decoding the background, until the background is first used."""
+        return self.__pending
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the loaded background, 0 if it isn't loaded."""
+        if self.__background is None:
+            return 0
+        return self.__background.get_height() * self.__background.get_pitch()
+
+    def prefetch(self, executor: ThreadPoolExecutor) -> None:
+        """Start decoding the background on the executor unless it's loaded or loading."""
+        if self.__background is None and self.__pending is None:
+            self.__pending = executor.submit(self.__decode)
+
+    def unload(self) -> None:
+        """Drop the background; it's loaded again the next time it's used."""
+        self.__background = None
+        if self.__pending is not None:
+            self.__pending.cancel()
+            self.__pending = None
+
+    def __decode(self) -> pygame.Surface:
+        pack = packed_backgrounds(self.size)
+        if pack is not None and f"background/{self.background_name}" in pack:
+            return pack.surface(f"background/{self.background_name}")
 
         try:
-            image: pygame.Surface = pygame.image.load(DIR / self.background_name).convert()
-            self.background = pygame.transform.scale(image, self.size)
+            image: pygame.Surface = pygame.image.load(DIR / self.background_name)
         except FileNotFoundError:
             self.logger.error(f"Background image not found: {DIR / self.background_name}'")
-            self.background = pygame.transform.scale(pygame.image.load(DIR / "starfield/1.png").convert(), self.size)
+            image = pygame.image.load(DIR / "starfield/1.png")
+        return pygame.transform.scale(image, self.size)
 
 
 class RegionManager:
     """A class to manage regions."""
 
-    def __init__(self, screen_size: tuple[int, int],  *regions: Region) -> None:
+    def __init__(
+        self,
+        screen_size: tuple[int, int],
+        *regions: Region,
+        prefetch_margin: int = settings.REGION_PREFETCH_SCORE_MARGIN,
+        memory_budget: int = settings.REGION_MEMORY_BUDGET,
+    ) -> None:
         self.regions: list[Region] = sorted(regions, key=lambda r: r.min_score)  # Sort regions by their minimum score required
         self.current_region_index: int = 0
 
+        # Background loading: only the current and next region are kept, the next one is
+        # loaded in the background once the score gets within prefetch_margin of it.
+        self.prefetch_margin: int = prefetch_margin
+        self.memory_budget: int = memory_budget
+        self.__executor: ThreadPoolExecutor | None = None
+
         self.__last_region_index: int = len(self.regions) - 1
         self.__y: float = -self.regions[self.current_region_index].background.get_height()  # Background scroll y
 
@@ -62,10 +144,44 @@ class RegionManager:
     def can_spawn_objects(self) -> bool:
         return not (self.__fading and self.__to_draw[1][1])
 
+    @property
+    def scroll_y(self) -> float:
+        """Current background scroll position."""
+        return self.__y
+
+    @property
+    def fading(self) -> bool:
+        """True while the fade overlay into a new region is drawn."""
+        return self.__fading and self.__to_draw[1][1]
+
+    @property
+    def backgrounds(self) -> tuple[pygame.Surface, pygame.Surface]:
+        """The two backgrounds currently scrolling, bottom one first."""
+        return self.__to_draw[0][0], self.__to_draw[1][0]
+
+    def draw_background(self, screen: pygame.Surface, y: float, area: pygame.Rect | None = None) -> None:
+        """Draw both scrolling backgrounds at scroll position y, without the fade overlay.
+            Args:
+                screen (pygame.Surface): Target surface.
+                y (float): Scroll position to draw at.
+                area (pygame.Rect | None): Only redraw this part of the screen.
+        """
+        bg_height: int = self.get_current_region().background.get_height()
+        clip: pygame.Rect = screen.get_clip()
+        if area is not None:
+            screen.set_clip(area)
+
+        screen.fill((0, 0, 0), area)
+        screen.blit(self.__to_draw[0][0], (0, bg_height + y))
+        screen.blit(self.__to_draw[1][0], (0, y))
+
+        screen.set_clip(clip)
+
     def reset(self) -> None:
         self.current_region_index = 0
         self.__y: float = -self.regions[self.current_region_index].background.get_height()
         self.__to_draw: list[tuple[pygame.Surface, bool]] = [(self.regions[self.current_region_index].background, False) for _ in range(2)]
+        self.__evict()
 
     def update_current_region(self, score: int) -> None:
         """Update current region index base on the player score and fade state.
@@ -76,6 +192,38 @@ class RegionManager:
             if score >= self.regions[self.current_region_index + 1].min_score and not self.__fading:
                 self.current_region_index += 1
                 self.__start_fade()
+                self.__evict()
+
+        next_index: int = self.current_region_index + 1
+        if (next_index <= self.__last_region_index
+                and score >= self.regions[next_index].min_score - self.prefetch_margin):
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="region-prefetch")
+            self.regions[next_index].prefetch(self.__executor)
+
+    def resident_bytes(self) -> int:
+        """Memory used by the loaded backgrounds."""
+        return sum(region.nbytes for region in self.regions)
+
+    def __evict(self) -> None:
+        """Unload backgrounds, oldest regions first, until they fit in the memory budget.
+
+        Backgrounds still being drawn (the region fading or scrolling out) are kept: unloading them wouldn't free
+        their memory until they are off the screen.
+        """
+        keep: set[int] = {self.current_region_index, self.current_region_index + 1}
+        self.get_current_region().background  # Count the new region's background, which is used right away
+        drawn: set[int] = {id(background) for background, _ in self.__to_draw}
+        keep.update(index for index, region in enumerate(self.regions)
+                    if region.loaded and id(region.background) in drawn)
+        resident: int = self.resident_bytes()
+        for index, region in enumerate(self.regions):
+            if resident <= self.memory_budget:
+                break
+            if index in keep or not region.loaded:
+                continue
+            resident -= region.nbytes
+            region.unload()
 
     def get_current_region(self) -> Region:
         """Returns the current region.
@@ -85,21 +233,31 @@ class RegionManager:
         return self.regions[self.current_region_index]
 
     def update(self, screen: pygame.Surface, score: int, dt: float) -> None:
+        self.step(score, dt)
+        self.draw(screen)
+
+    def step(self, score: int, dt: float) -> None:
+        """Advance region, scroll and fade state without drawing anything.
+            Args:
+                score (int): Player score.
+                dt (float): Frame delta time.
+        """
         self.update_current_region(score)
         current_region_height: int = self.get_current_region().background.get_height()
 
-        self.__draw(screen, current_region_height, dt)
+        if self.__fading and self.__to_draw[1][1]:
+            self.__update_fade(dt)
         self.__update_y(current_region_height, dt)
 
-    def __draw(self, screen: pygame.Surface, bg_height: int, dt: float) -> None:
-        screen.fill((0, 0, 0))
-        screen.blit(self.__to_draw[0][0], (0, bg_height + self.__y))
-        screen.blit(self.__to_draw[1][0], (0, self.__y))
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw the backgrounds and the fade overlay as they are, without advancing them.
+            Args:
+                screen (pygame.Surface): Target surface.
+        """
+        self.draw_background(screen, self.__y)
 
         # Draw fade overlay
         if self.__fading and self.__to_draw[1][1]:
-            self.__update_fade(dt)
-
             # Overlay
             self.__fade_surface.set_alpha(self.__fade_alpha)
             screen.blit(self.__fade_surface, (0, 0))
@@ -121,7 +279,10 @@ class RegionManager:
             fade_flag: bool = False if next_bg == self.__to_draw[1][0] else True
 
             # Shift backgrounds
+            scrolled_out: pygame.Surface = self.__to_draw[0][0]
             self.__to_draw = [self.__to_draw[1], (next_bg, fade_flag)]
+            if all(scrolled_out is not background for background, _ in self.__to_draw):
+                self.__evict()
 
             self.__y = -bg_height
         self.__y += 0.7 * dt
@@ -142,3 +303,25 @@ class RegionManager:
         elif self.__fade_alpha <= 0:
             self.__fade_alpha = 0
             self.__fading = False
+
+
+def init_regions(screen: pygame.Surface) -> RegionManager:
+    size: tuple[int, int] = screen.get_size()
+
+    return RegionManager(size,
+        Region("Starfield Stage - 1", "starfield/1.png", 0, size),
+        Region("Starfield Stage - 2", "starfield/2.png", 200, size),
+        Region("Starfield Stage - 3", "starfield/3.png", 400, size),
+        Region("Starfield Stage - 4", "starfield/4.png", 600, size),
+        Region("Starfield Stage - 5", "starfield/5.png", 800, size),
+        Region("Verdant Expanse Stage - 1", "verdant expanse/1.png", 1100, size),
+        Region("Verdant Expanse Stage - 2", "verdant expanse/2.png", 1400, size),
+        Region("Verdant Expanse Stage - 3", "verdant expanse/3.png", 1700, size),
+        Region("Verdant Expanse Stage - 4", "verdant expanse/4.png", 2000, size),
+        Region("Verdant Expanse Stage - 5", "verdant expanse/5.png", 2300, size),
+        Region("Violet Void Stage - 1", "violet void/1.png", 2700, size),
+        Region("Violet Void Stage - 2", "violet void/2.png", 3100, size),
+        Region("Violet Void Stage - 3", "violet void/3.png", 3500, size),
+        Region("Violet Void Stage - 4", "violet void/4.png", 3900, size),
+        Region("Violet Void Stage - 5", "violet void/5.png", 4300, size)
+    )
@@ -0,0 +1,122 @@
+"""Presents each frame, either in full or as dirty rectangles.
+
+In `RenderMode.FULL` every frame redraws the scrolling background and flips the whole
+1200x800 screen, exactly like the game always did. In `RenderMode.DIRTY` the renderer
+keeps the rects everything was drawn to (`mark()`), erases last frame's rects by
+redrawing the background underneath them and presents only last frame's plus this
+frame's rects with a single `pygame.display.update()`.
+
+A scrolling background changes every pixel every frame, so dirty rects only pay off when
+the background holds still. How it moves is its own strategy (`BackgroundMode`):
+
+- `SCROLL` keeps the smooth scroll and therefore presents full frames.
+- `QUANTIZED` scrolls in steps of `scroll_step` pixels: the background is only redrawn
+  (and a full frame presented) when it drifted that far from where it was last drawn.
+- `FROZEN` only redraws the background when it changes (new region, fade overlay).
+
+Region fades always present full frames.
+"""
+
+import logging
+from enum import StrEnum
+
+import pygame
+
+from . import settings
+from .region import RegionManager
+
+
+class RenderMode(StrEnum):
+    """How frames are presented."""
+
+    FULL = "full"
+    DIRTY = "dirty"
+
+
+class BackgroundMode(StrEnum):
+    """How the background scrolls in RenderMode.DIRTY."""
+
+    SCROLL = "scroll"
+    QUANTIZED = "quantized"
+    FROZEN = "frozen"
+
+
+class Renderer:
+    """Draws the background and presents the frame once."""
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        mode: RenderMode = RenderMode(settings.RENDER_MODE),
+        background_mode: BackgroundMode = BackgroundMode(settings.BACKGROUND_MODE),
+        scroll_step: int = settings.BACKGROUND_SCROLL_STEP,
+    ) -> None:
+        self.screen: pygame.Surface = screen
+        self.mode: RenderMode = RenderMode(mode)
+        self.background_mode: BackgroundMode = BackgroundMode(background_mode)
+        self.scroll_step: int = scroll_step
+
+        # Frames presented in full vs. as dirty rects.
+        self.full_frames: int = 0
+        self.dirty_frames: int = 0
+
+        self.__full_frame: bool = True
+        self.__rects: list[pygame.Rect] = []
+        self.__previous_rects: list[pygame.Rect] = []
+
+        # Scroll position and backgrounds the screen currently shows.
+        self.__drawn_y: float | None = None
+        self.__drawn_backgrounds: tuple[pygame.Surface, pygame.Surface] | None = None
+
+        self.__logger.info(f"Render mode: {self.mode}, background: {self.background_mode}")
+
+    def draw_background(self, region_manager: RegionManager) -> None:
+        """Draw the background for a new frame."""
+        self.__rects = []
+
+        if self.mode is RenderMode.FULL or self.__needs_full_frame(region_manager):
+            self.__full_frame = True
+            self.__drawn_y = region_manager.scroll_y
+            self.__drawn_backgrounds = region_manager.backgrounds
+            region_manager.draw(self.screen)
+            return
+
+        # Erase last frame's sprites; the background itself stays where it was drawn.
+        self.__full_frame = False
+        for rect in self.__previous_rects:
+            region_manager.draw_background(self.screen, self.__drawn_y, rect)
+
+    def __needs_full_frame(self, region_manager: RegionManager) -> bool:
+        if self.__drawn_y is None or region_manager.fading:
+            return True
+        if region_manager.backgrounds != self.__drawn_backgrounds:
+            return True
+        if self.background_mode is BackgroundMode.SCROLL:
+            return True
+        if self.background_mode is BackgroundMode.QUANTIZED:
+            return abs(region_manager.scroll_y - self.__drawn_y) >= self.scroll_step
+        return False
+
+    def invalidate(self) -> None:
+        """Force a full redraw on the next frame."""
+        self.__drawn_y = None
+
+    def mark(self, *rects: pygame.Rect | None) -> None:
+        """Record screen areas drawn to this frame (None is ignored)."""
+        if self.mode is RenderMode.FULL:
+            return
+        self.__rects.extend(pygame.Rect(rect) for rect in rects if rect is not None)
+
+    def present(self) -> None:
+        """Show the frame: flip in full, or update last frame's and this frame's rects."""
+        if self.__full_frame:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(self.__previous_rects + self.__rects)
+            self.dirty_frames += 1
+
+        # Whatever was drawn this frame has to be erased next frame, even after a full frame.
+        self.__previous_rects = self.__rects
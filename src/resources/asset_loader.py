@@ -0,0 +1,80 @@
+import io
+import logging
+import os
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pygame
+
+from .. import settings
+
+
+class AssetLoader:
+    """Reads and decodes image files on a thread pool.
+
+    Every file is read as raw bytes and decoded with pygame.image.load from the buffer; the PNG decoder releases
+    the GIL, so files decode side by side. Converting to the display format (and blitting) stays with the caller
+    on the main thread. The time spent in each phase is summed in `timings`, seconds by phase name ("read" and
+    "decode" are summed over the worker threads, `wall` is the elapsed time of the loads).
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, workers: int = settings.ASSET_LOADER_WORKERS) -> None:
+        self.workers: int = max(1, workers or os.cpu_count() or 1)
+
+        self.files: int = 0
+        self.bytes: int = 0
+        self.wall: float = 0.0
+        self.timings: dict[str, float] = {}
+
+    def load_images(self, paths: Iterable[Path | str]) -> dict[Path, pygame.Surface]:
+        """Decode every file; the surfaces are not converted. Files that fail to load are logged and left out."""
+        paths = [Path(path) for path in paths]
+        start = time.perf_counter()
+
+        if self.workers == 1 or len(paths) < 2:
+            results = [self.__load(path) for path in paths]
+        else:
+            workers = min(self.workers, len(paths))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-loader") as executor:
+                results = list(executor.map(self.__load, paths))
+
+        images: dict[Path, pygame.Surface] = {}
+        for path, (image, size, read, decode) in zip(paths, results):
+            self.add_timing("read", read)
+            self.add_timing("decode", decode)
+            self.bytes += size
+            if image is not None:
+                images[path] = image
+
+        self.files += len(paths)
+        self.wall += time.perf_counter() - start
+        return images
+
+    def add_timing(self, phase: str, seconds: float) -> None:
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    def report(self) -> str:
+        phases = ", ".join(f"{phase} {seconds * 1000:.0f} ms" for phase, seconds in self.timings.items())
+        return (f"Loaded {self.files} files ({self.bytes / 2 ** 20:.1f} MiB) in {self.wall * 1000:.0f} ms "
+                f"on {self.workers} thread(s): {phases}")
+
+    def __load(self, path: Path) -> tuple[pygame.Surface | None, int, float, float]:
+        start = time.perf_counter()
+        try:
+            data = path.read_bytes()
+        except OSError as error:
+            self.__logger.error(f"Couldn't read {path}: {error}")
+            return None, 0, time.perf_counter() - start, 0.0
+        read = time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            image = pygame.image.load(io.BytesIO(data), path.name)
+        except pygame.error as error:
+            self.__logger.error(f"Couldn't decode {path}: {error}")
+            image = None
+        return image, len(data), read, time.perf_counter() - start
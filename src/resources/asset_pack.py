@@ -0,0 +1,132 @@
+"""A single file of pre-decoded pixels, mapped into memory at startup.
+
+`tools/build_asset_pack.py` bakes the packed sprite and animation atlas pages and the backgrounds, pre-scaled to the
+screen size, into one file:
+
+    magic (8 bytes) | header length (uint32, little endian) | JSON header | pixel data
+
+The pixel data starts at the first 64 byte boundary after the header. The header maps every entry name to the
+offset (from the start of the pixel data, also 64 byte aligned), size and pixel format of its raw pixels and
+carries free-form `meta` (the atlas mappings and fingerprints). Atlas pages are stored in the byte order of
+`convert_alpha()` surfaces, so `pygame.image.frombuffer` wraps them without decoding or copying and they blit as
+fast as converted ones.
+
+At runtime `open_asset_pack()` maps the file copy-on-write (a stray draw onto a surface can't crash or change the
+file) and keeps it open; a missing, disabled or unreadable pack returns None and the callers load the PNGs.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+
+import pygame
+
+from .. import settings
+
+MAGIC = b"AIPACK\x00\x01"
+ALIGNMENT = 64
+
+_logger = logging.getLogger(__name__)
+
+
+class AssetPack:
+    """A memory-mapped asset pack."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path: Path = Path(path)
+        with open(self.path, "rb") as file:
+            self.__mmap: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        try:
+            if self.__mmap[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{self.path} is not an asset pack")
+            (header_length,) = struct.unpack_from("<I", self.__mmap, len(MAGIC))
+            start = len(MAGIC) + 4
+            header = json.loads(self.__mmap[start:start + header_length].decode("utf-8"))
+            self.__data_start: int = _align(start + header_length)
+        except Exception:
+            self.__mmap.close()
+            raise
+
+        self.entries: dict[str, dict] = header["entries"]
+        self.meta: dict = header["meta"]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def surface(self, name: str) -> pygame.Surface:
+        """Wrap an entry's pixels as a surface; the pixels stay in the mapped file."""
+        entry = self.entries[name]
+        width, height = entry["size"]
+        offset = self.__data_start + entry["offset"]
+        pixels = memoryview(self.__mmap)[offset:offset + entry["length"]]
+        return pygame.image.frombuffer(pixels, (width, height), entry["format"])
+
+    @staticmethod
+    def write(path: Path | str, surfaces: dict[str, tuple[pygame.Surface, str]], meta: dict) -> None:
+        """Write a pack of `surfaces` (name -> (surface, pixel format)) and `meta`, replacing `path` atomically."""
+        path = Path(path)
+
+        entries: dict[str, dict] = {}
+        offset = 0
+        for name, (surface, pixel_format) in surfaces.items():
+            width, height = surface.get_size()
+            length = width * height * len(pixel_format)  # One byte per channel letter
+            entries[name] = {"offset": offset, "length": length, "size": [width, height], "format": pixel_format}
+            offset = _align(offset + length)
+        header = json.dumps({"entries": entries, "meta": meta}).encode("utf-8")
+        data_start = _align(len(MAGIC) + 4 + len(header))
+
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, "wb") as file:
+            file.write(MAGIC)
+            file.write(struct.pack("<I", len(header)))
+            file.write(header)
+            for name, (surface, pixel_format) in surfaces.items():
+                file.seek(data_start + entries[name]["offset"])
+                file.write(pygame.image.tobytes(surface, pixel_format))
+        os.replace(temp_path, path)
+
+
+def folder_fingerprint(folder: Path, salt: str) -> str:
+    """Hash of `salt` and every PNG's relative path, size and modification time under `folder`."""
+    digest = hashlib.sha1(salt.encode())
+    for root, dirs, files in sorted(os.walk(folder)):
+        for file in sorted(files):
+            if not file.endswith(".png"):
+                continue
+            path = Path(root) / file
+            stat = path.stat()
+            digest.update(f"{path.relative_to(folder).as_posix()}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()
+
+
+def _align(offset: int) -> int:
+    return offset + -offset % ALIGNMENT
+
+
+_pack: AssetPack | None = None
+_opened: bool = False
+
+
+def open_asset_pack() -> AssetPack | None:
+    """Return the game's asset pack, mapped on first use, or None to load from the asset directories."""
+    global _pack, _opened
+    if _opened:
+        return _pack
+    _opened = True
+
+    if not settings.ASSET_PACK_ENABLED or not settings.ASSET_PACK.exists():
+        return None
+    try:
+        _pack = AssetPack(settings.ASSET_PACK)
+    except (OSError, ValueError, KeyError) as error:
+        _logger.warning(f"Ignoring unreadable asset pack {settings.ASSET_PACK}: {error}")
+        return None
+
+    _logger.info(f"Mapped asset pack {settings.ASSET_PACK} ({len(_pack.entries)} entries)")
+    return _pack
@@ -0,0 +1,186 @@
+"""Rectangle packers used to lay out the texture atlases.
+
+A packer places named width x height rects on one or more pages of at most
+max_width x max_height pixels, leaving `padding` pixels between neighbours. A new page
+is started when a rect doesn't fit on the current one; a rect larger than a page gets a
+page of its own. Pages are cropped to the area actually used.
+
+- `ShelfPacker` fills rows left to right in the given order, each row as tall as its
+  tallest rect (the original atlas layout).
+- `SkylinePacker` keeps the outline of the filled area and puts each rect (tallest
+  first) where its top ends lowest, so short rects fill the gaps next to tall ones.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Placement:
+    """Where a rect went: page index and top-left corner."""
+
+    page: int
+    x: int
+    y: int
+
+
+@dataclass
+class PackResult:
+    """Placements by name and the (cropped) size of every page."""
+
+    placements: dict[str, Placement]
+    pages: list[tuple[int, int]]
+
+
+class AtlasPacker(ABC):
+    """Base class of the packers."""
+
+    name: str = ""
+
+    def __init__(self, max_width: int, max_height: int, padding: int = 2) -> None:
+        self.max_width: int = max_width
+        self.max_height: int = max_height
+        self.padding: int = padding
+
+    @abstractmethod
+    def pack(self, sizes: dict[str, tuple[int, int]]) -> PackResult:
+        """Place every rect of `sizes` (name -> (width, height))."""
+
+    def _fits_page(self, width: int, height: int) -> bool:
+        return width <= self.max_width and height <= self.max_height
+
+    @staticmethod
+    def _crop(placements: dict[str, Placement], sizes: dict[str, tuple[int, int]], page_count: int):
+        pages = [(0, 0)] * page_count
+        for name, placement in placements.items():
+            width, height = sizes[name]
+            page_width, page_height = pages[placement.page]
+            pages[placement.page] = (max(page_width, placement.x + width), max(page_height, placement.y + height))
+        return pages
+
+
+class ShelfPacker(AtlasPacker):
+    """Left-to-right rows in input order."""
+
+    name = "shelf"
+
+    def pack(self, sizes: dict[str, tuple[int, int]]) -> PackResult:
+        placements: dict[str, Placement] = {}
+        page, x, y, row_height = 0, 0, 0, 0
+        started = False
+
+        for name, (width, height) in sizes.items():
+            if not self._fits_page(width, height):
+                # Oversized: a page of its own.
+                page += started
+                placements[name] = Placement(page, 0, 0)
+                page, x, y, row_height, started = page + 1, 0, 0, 0, False
+                continue
+
+            if x + width > self.max_width:
+                x = 0
+                y += row_height + self.padding
+                row_height = 0
+            if y + height > self.max_height and started:
+                page += 1
+                x, y, row_height = 0, 0, 0
+
+            placements[name] = Placement(page, x, y)
+            started = True
+            x += width + self.padding
+            row_height = max(row_height, height)
+
+        page_count = page + started
+        return PackResult(placements, self._crop(placements, sizes, page_count))
+
+
+class SkylinePacker(AtlasPacker):
+    """Bottom-left skyline packing, tallest rects first."""
+
+    name = "skyline"
+
+    def pack(self, sizes: dict[str, tuple[int, int]]) -> PackResult:
+        placements: dict[str, Placement] = {}
+        page = 0
+        # Segments (x, y, width) of the current page's outline, left to right.
+        skyline: list[list[int]] = [[0, 0, self.max_width]]
+        started = False
+
+        for name in sorted(sizes, key=lambda n: (sizes[n][1], sizes[n][0]), reverse=True):
+            width, height = sizes[name]
+            if not self._fits_page(width, height):
+                # Oversized: a page of its own.
+                page += started
+                placements[name] = Placement(page, 0, 0)
+                page += 1
+                skyline, started = [[0, 0, self.max_width]], False
+                continue
+
+            position = self.__find(skyline, width, height)
+            if position is None:
+                page += 1
+                skyline = [[0, 0, self.max_width]]
+                position = self.__find(skyline, width, height)
+
+            index, x, y = position
+            placements[name] = Placement(page, x, y)
+            started = True
+            self.__add(skyline, index, x, y + height + self.padding, width + self.padding)
+
+        page_count = page + started
+        return PackResult(placements, self._crop(placements, sizes, page_count))
+
+    def __find(self, skyline: list[list[int]], width: int, height: int) -> tuple[int, int, int] | None:
+        """Return (segment index, x, y) of the lowest, then leftmost, spot for the rect."""
+        best: tuple[int, int, int] | None = None
+        best_key: tuple[int, int] | None = None
+        for index, (x, _, _) in enumerate(skyline):
+            if x + width > self.max_width:
+                break
+
+            # The rect (and its padding, unless at the page edge) rests on the highest segment below it.
+            needed = min(width + self.padding, self.max_width - x)
+            y, span, i = 0, 0, index
+            while span < needed:
+                y = max(y, skyline[i][1])
+                span += skyline[i][2]
+                i += 1
+            if y + height > self.max_height:
+                continue
+
+            key = (y + height, x)
+            if best_key is None or key < best_key:
+                best, best_key = (index, x, y), key
+        return best
+
+    @staticmethod
+    def __add(skyline: list[list[int]], index: int, x: int, top: int, width: int) -> None:
+        """Raise the outline to `top` over [x, x + width)."""
+        right = x + width
+        skyline.insert(index, [x, top, width])
+
+        # Cut the segments the new one covers.
+        i = index + 1
+        while i < len(skyline):
+            segment = skyline[i]
+            segment_right = segment[0] + segment[2]
+            if segment[0] >= right:
+                break
+            if segment_right <= right:
+                del skyline[i]
+                continue
+            segment[2] = segment_right - right
+            segment[0] = right
+            break
+
+        # Merge neighbours of equal height.
+        i = 0
+        while i < len(skyline) - 1:
+            if skyline[i][1] == skyline[i + 1][1]:
+                skyline[i][2] += skyline[i + 1][2]
+                del skyline[i + 1]
+            else:
+                i += 1
+
+
+PACKERS: dict[str, type[AtlasPacker]] = {packer.name: packer for packer in (ShelfPacker, SkylinePacker)}
@@ -0,0 +1,92 @@
+import logging
+from collections import OrderedDict
+from typing import NamedTuple
+
+import pygame
+
+from .. import settings
+
+
+class RotatedTexture(NamedTuple):
+    """A rotated surface and the offset of its top-left corner from the rotation center."""
+
+    surface: pygame.Surface
+    offset: tuple[int, int]
+
+
+class RotationCache:
+    """Memoizes rotated copies of shared textures.
+
+    Angles are quantized to buckets of `bucket_degrees`, so every sprite drawn from the same texture at roughly
+    the same heading reuses one surface instead of calling pygame.transform.rotate each frame. Entries are evicted
+    least recently used first once the cached surfaces exceed `max_bytes`.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, bucket_degrees: float = settings.ROTATION_CACHE_BUCKET_DEGREES,
+                 max_bytes: int = settings.ROTATION_CACHE_MAX_BYTES) -> None:
+        self.bucket_degrees: float = bucket_degrees
+        self.buckets: int = max(1, round(360 / bucket_degrees))
+        self.max_bytes: int = max_bytes
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.bytes: int = 0
+
+        self.__entries: OrderedDict[tuple[str, int], RotatedTexture] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def bucket(self, angle: float) -> int:
+        """Return the bucket index of an angle in degrees."""
+        return round(angle / self.bucket_degrees) % self.buckets
+
+    def get(self, key: str, texture: pygame.Surface, angle: float) -> RotatedTexture:
+        """Return `texture` rotated by `angle` degrees (counterclockwise, like pygame.transform.rotate).
+
+        `key` identifies the texture; every caller passing the same key must pass the same pixels.
+        """
+        bucket = self.bucket(angle)
+        entries = self.__entries
+        entry = entries.get((key, bucket))
+        if entry is not None:
+            entries.move_to_end((key, bucket))
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        surface = pygame.transform.rotate(texture, bucket * self.bucket_degrees)
+        width, height = surface.get_size()
+        entry = RotatedTexture(surface, (-(width // 2), -(height // 2)))
+
+        entries[(key, bucket)] = entry
+        self.bytes += self.__size(surface)
+        while self.bytes > self.max_bytes and len(entries) > 1:
+            _, evicted = entries.popitem(last=False)
+            self.bytes -= self.__size(evicted.surface)
+
+        return entry
+
+    def precompute(self, key: str, texture: pygame.Surface) -> None:
+        """Fill every bucket of a texture up front (as far as the memory cap allows)."""
+        for bucket in range(self.buckets):
+            self.get(key, texture, bucket * self.bucket_degrees)
+        self.__logger.info(f"Precomputed {self.buckets} rotations of {key} ({self.bytes / 1024:.0f} KiB cached)")
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.bytes = 0
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def __size(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+# Shared by every sprite that rotates an atlas texture.
+rotation_cache = RotationCache()
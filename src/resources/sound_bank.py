@@ -0,0 +1,87 @@
+import logging
+import threading
+from pathlib import Path
+
+import pygame
+
+
+class BankSound:
+    """A named sound of a bank; `play()` does nothing until the bank has decoded it."""
+
+    def __init__(self, bank: "SoundBank", name: str) -> None:
+        self.bank: SoundBank = bank
+        self.name: str = name
+
+    def play(self) -> None:
+        self.bank.play(self.name)
+
+
+class SoundBank:
+    """Sound effects decoded on a background thread.
+
+    Nothing is touched until `load()`: it starts a daemon thread that initializes the mixer and decodes every
+    sound. Playing a sound that isn't decoded yet (or at all, if loading was never started, the bank is disabled
+    or there is no audio device) silently does nothing, so the game never waits for audio.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, files: dict[str, Path], enabled: bool = True) -> None:
+        self.files: dict[str, Path] = files
+        self.enabled: bool = enabled
+
+        self.__sounds: dict[str, pygame.mixer.Sound] = {}
+        self.__thread: threading.Thread | None = None
+
+    def sound(self, name: str) -> BankSound:
+        """Return a playable handle of a sound, usable before it is decoded."""
+        if name not in self.files:
+            raise KeyError(f"Unknown sound: {name}")
+        return BankSound(self, name)
+
+    def load(self) -> None:
+        """Start decoding the sounds in the background; does nothing if disabled or already started."""
+        if not self.enabled or self.__thread is not None:
+            return
+        self.__thread = threading.Thread(target=self.__decode, name="sound-bank", daemon=True)
+        self.__thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until decoding is done; returns False on timeout. Meant for tools and tests."""
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            return not self.__thread.is_alive()
+        return True
+
+    def disable(self) -> None:
+        """Mute the bank, e.g. for headless simulation."""
+        self.enabled = False
+
+    def ready(self, name: str) -> bool:
+        return name in self.__sounds
+
+    def play(self, name: str) -> None:
+        if not self.enabled:
+            return
+        sound = self.__sounds.get(name)
+        if sound is not None:
+            sound.play()
+
+    def __decode(self) -> None:
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+        except pygame.error as e:
+            self.__logger.warning(f"No audio, sounds are disabled: {e}")
+            self.enabled = False
+            return
+
+        for name, path in self.files.items():
+            if not self.enabled:
+                return
+            try:
+                # pygame only reports a missing file as such for a str path.
+                self.__sounds[name] = pygame.mixer.Sound(str(path))
+            except (pygame.error, OSError) as e:
+                self.__logger.error(f"Couldn't load sound {path}: {e}")
+        self.__logger.info(f"Decoded {len(self.__sounds)} of {len(self.files)} sounds")
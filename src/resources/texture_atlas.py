@@ -1,22 +1,88 @@
 import pygame
+import json
 import logging
 import os
+import time
 
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 
 from .. import settings
+from .asset_loader import AssetLoader
+from .asset_pack import AssetPack, folder_fingerprint, open_asset_pack
+from .atlas_packer import PACKERS, AtlasPacker
+
+
+@dataclass(frozen=True)
+class TextureHandle:
+    """A texture resolved once: its atlas subsurface and where it lives in the atlas."""
+
+    path: str
+    surface: pygame.Surface
+    atlas: str  # "sprites" or "animations"
+    page: int
+    rect: tuple[int, int, int, int]  # x, y, width, height on the page
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.rect[2], self.rect[3]
+
+
+@dataclass(frozen=True)
+class AtlasReport:
+    """Memory use of one packed atlas."""
+
+    name: str
+    packer: str
+    textures: int
+    pages: tuple[tuple[int, int], ...]
+    used_pixels: int  # Pixels covered by textures
+
+    @property
+    def total_pixels(self) -> int:
+        return sum(width * height for width, height in self.pages)
+
+    @property
+    def occupancy(self) -> float:
+        return self.used_pixels / self.total_pixels if self.total_pixels else 0.0
+
+    @property
+    def bytes(self) -> int:
+        return self.total_pixels * 4
+
+    def __str__(self) -> str:
+        pages = ", ".join(f"{width}x{height}" for width, height in self.pages)
+        return (f"{self.name} atlas ({self.packer}): {self.textures} textures on {len(self.pages)} page(s) [{pages}], "
+                f"{self.bytes / 2 ** 20:.1f} MiB, {self.occupancy:.0%} occupied")
+
 
 class TextureAtlas:
     __sprites_folder: Path = settings.ASSETS_DIR / "sprites"
     __animations_folder: Path = settings.ASSETS_DIR / "animations"
-    __sprites_atlas_max_width = 2048
-    __animations_atlas_max_width = 8192
+    __sprites_atlas_max_size = 2048
+    __animations_atlas_max_size = settings.ATLAS_MAX_PAGE_SIZE
     __loaded: bool = False
 
+    # Mappings hold the page index and the texture's rect on that page.
     __sprites_atlas_mappings: dict[str, dict] = {}
-    __sprites_atlas_surface: pygame.Surface
+    __sprites_atlas_pages: list[pygame.Surface] = []
     __animations_atlas_mappings: dict[str, dict] = {}
-    __animations_atlas_surface: pygame.Surface
+    __animations_atlas_pages: list[pygame.Surface] = []
+
+    # Resolved textures by requested path (with and without ".png").
+    __sprite_handles: dict[str, TextureHandle] = {}
+    __animation_handles: dict[str, TextureHandle] = {}
+    hits: int = 0
+    misses: int = 0
+
+    # Fingerprints of the loaded atlases' source files, see __fingerprint().
+    __sprites_key: str = ""
+    __animations_key: str = ""
+
+    # Packed atlases are cached on disk, see __read_cache().
+    __cache_folder: Path = settings.CACHE_DIR / "atlas"
+    __cache_version: int = 2
 
     __logger = logging.getLogger(__name__)
 
@@ -28,152 +94,292 @@ class TextureAtlas:
         if TextureAtlas.__loaded:
             return
 
-        TextureAtlas.__init_sprites()
-        TextureAtlas.__init_animations()
+        # Atlases come from the asset pack, else the disk cache; PNGs are only decoded (in parallel) without either.
+        pack = open_asset_pack()
+        loader = AssetLoader()
+
+        key = TextureAtlas.__fingerprint(TextureAtlas.__sprites_folder, TextureAtlas.__sprites_atlas_max_size)
+        TextureAtlas.__sprites_key = key
+        cached = TextureAtlas.__read_pack(pack, "sprites", key) or TextureAtlas.__read_cache("sprites", key)
+        if cached is not None:
+            TextureAtlas.__sprites_atlas_pages, TextureAtlas.__sprites_atlas_mappings = cached
+        else:
+            TextureAtlas.__init_sprites(loader)
+            TextureAtlas.__write_cache("sprites", key, TextureAtlas.__sprites_atlas_pages,
+                                       TextureAtlas.__sprites_atlas_mappings)
+
+        key = TextureAtlas.__fingerprint(TextureAtlas.__animations_folder, TextureAtlas.__animations_atlas_max_size)
+        TextureAtlas.__animations_key = key
+        cached = TextureAtlas.__read_pack(pack, "animations", key) or TextureAtlas.__read_cache("animations", key)
+        if cached is not None:
+            TextureAtlas.__animations_atlas_pages, TextureAtlas.__animations_atlas_mappings = cached
+        else:
+            TextureAtlas.__init_animations(loader)
+            TextureAtlas.__write_cache("animations", key, TextureAtlas.__animations_atlas_pages,
+                                       TextureAtlas.__animations_atlas_mappings)
 
         TextureAtlas.__loaded = True
 
+        if loader.files:
+            TextureAtlas.__logger.info(loader.report())
+        for report in TextureAtlas.report():
+            TextureAtlas.__logger.info(report)
+
     @staticmethod
-    def __init_sprites():
-        TextureAtlas.__logger.info("Start loading sprite textures...")
+    def __fingerprint(folder: Path, max_size: int) -> str:
+        """Hash of every PNG's relative path, size and modification time (plus the packing parameters)."""
+        return folder_fingerprint(folder, f"{TextureAtlas.__cache_version}:{settings.ATLAS_PACKER}:{max_size}")
 
-        sprite_files = [os.path.join(root, file) for root, dirs, files in os.walk(TextureAtlas.__sprites_folder) for
-                        file in files if file.endswith(".png")]
+    @staticmethod
+    def __read_pack(pack: AssetPack | None, name: str, key: str) -> tuple[list[pygame.Surface], dict[str, dict]] | None:
+        """Return the atlas pages (wrapping the mapped pixels) and mappings from the asset pack, if it is current."""
+        if pack is None:
+            return None
 
-        sprites: list[tuple[str, pygame.Surface, int, int]] = []
-        for file in sprite_files:
-            image = pygame.image.load(file).convert_alpha()
-            width, height = image.get_size()
-            sprites.append((Path(file).relative_to(TextureAtlas.__sprites_folder).as_posix(), image, width, height))
+        section = pack.meta.get(name)
+        if section is None or section["key"] != key:
+            TextureAtlas.__logger.info(f"Asset pack has no current {name} atlas, "
+                                       "rebuild it with tools/build_asset_pack.py")
+            return None
 
-        # Arrange and measure sprites atlas size
-        x, y, = 0, 0
-        row_height = 0
+        TextureAtlas.__logger.info(f"Loaded {name} atlas from asset pack")
+        return [pack.surface(page) for page in section["pages"]], section["mappings"]
 
-        atlas_width = TextureAtlas.__sprites_atlas_max_width
-        atlas_height = 0
+    @staticmethod
+    def __read_cache(name: str, key: str) -> tuple[list[pygame.Surface], dict[str, dict]] | None:
+        """Return the cached atlas pages and mappings, or None if there is no cache for `key`."""
+        if not settings.TEXTURE_ATLAS_CACHE:
+            return None
 
-        padding = 2
+        header_path = TextureAtlas.__cache_folder / f"{name}.json"
+        try:
+            with open(header_path, encoding="utf-8") as file:
+                header = json.load(file)
+            if header.get("key") != key:
+                TextureAtlas.__logger.info(f"{name} atlas cache is stale, repacking")
+                return None
+            pages = []
+            for index, size in enumerate(header["pages"]):
+                pixels = (TextureAtlas.__cache_folder / f"{name}.{index}.rgba").read_bytes()
+                pages.append(pygame.image.frombytes(pixels, tuple(size), "RGBA").convert_alpha())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, pygame.error) as error:
+            TextureAtlas.__logger.warning(f"Ignoring unreadable {name} atlas cache: {error}")
+            return None
 
-        for path, image, w, h in sprites:
-            if x + w > atlas_width:
-                x = 0
-                y += row_height + padding
+        TextureAtlas.__logger.info(f"Loaded {name} atlas from cache")
+        return pages, header["mappings"]
 
-            TextureAtlas.__sprites_atlas_mappings[path] = {"x": x, "y": y, "width": w, "height": h}
+    @staticmethod
+    def __write_cache(name: str, key: str, pages: list[pygame.Surface], mappings: dict[str, dict]) -> None:
+        if not settings.TEXTURE_ATLAS_CACHE:
+            return
 
-            x += w + padding
-            row_height = max(row_height, h)
+        folder = TextureAtlas.__cache_folder
+        try:
+            folder.mkdir(parents=True, exist_ok=True)
+            # Drop the header first, so a header is only ever next to the pixels it describes.
+            header_path = folder / f"{name}.json"
+            header_path.unlink(missing_ok=True)
+
+            # Stored uncompressed: inflating the animations atlas takes about as long as decoding its PNGs.
+            for index, page in enumerate(pages):
+                pixels_path = folder / f"{name}.{index}.rgba"
+                pixels_path.with_suffix(".tmp").write_bytes(pygame.image.tobytes(page, "RGBA"))
+                os.replace(pixels_path.with_suffix(".tmp"), pixels_path)
+            for stale in folder.glob(f"{name}.*.rgba"):
+                if int(stale.name.split(".")[1]) >= len(pages):
+                    stale.unlink()
+
+            header = {"key": key, "pages": [page.get_size() for page in pages], "mappings": mappings}
+            header_path.with_suffix(".tmp").write_text(json.dumps(header), encoding="utf-8")
+            os.replace(header_path.with_suffix(".tmp"), header_path)
+        except OSError as error:
+            TextureAtlas.__logger.warning(f"Couldn't write {name} atlas cache: {error}")
 
-        atlas_height = y + row_height
+    @staticmethod
+    def __pack(images: dict[str, pygame.Surface], max_size: int) -> tuple[list[pygame.Surface], dict[str, dict]]:
+        """Lay the images out with the configured packer and blit them onto atlas pages."""
+        packer: AtlasPacker = PACKERS[settings.ATLAS_PACKER](max_size, max_size, padding=2)
+        result = packer.pack({name: image.get_size() for name, image in images.items()})
+
+        pages = [pygame.Surface(size, pygame.SRCALPHA) for size in result.pages]
+        mappings: dict[str, dict] = {}
+        for name, image in images.items():
+            placement = result.placements[name]
+            width, height = image.get_size()
+            mappings[name] = {"page": placement.page, "x": placement.x, "y": placement.y,
+                              "width": width, "height": height}
+            pages[placement.page].blit(image, (placement.x, placement.y))
 
-        # Create and fill the sprites atlas
-        TextureAtlas.__sprites_atlas_surface = pygame.Surface((atlas_width, atlas_height), pygame.SRCALPHA)
-        for name, image, _, _ in sprites:
-            x = TextureAtlas.__sprites_atlas_mappings.get(name).get("x")
-            y = TextureAtlas.__sprites_atlas_mappings.get(name).get("y")
-            TextureAtlas.__sprites_atlas_surface.blit(image, (x, y))
+        return pages, mappings
+
+    @staticmethod
+    def __load_images(loader: AssetLoader, files: list[str]) -> dict[Path, pygame.Surface]:
+        """Decode the files on the loader's threads, then convert them here on the main thread."""
+        images = loader.load_images(files)
+
+        start = time.perf_counter()
+        images = {path: image.convert_alpha() for path, image in images.items()}
+        loader.add_timing("convert", time.perf_counter() - start)
+        return images
+
+    @staticmethod
+    def __init_sprites(loader: AssetLoader):
+        TextureAtlas.__logger.info("Start loading sprite textures...")
+
+        sprite_files = [os.path.join(root, file) for root, dirs, files in os.walk(TextureAtlas.__sprites_folder) for
+                        file in files if file.endswith(".png")]
+
+        sprites: dict[str, pygame.Surface] = {}
+        for file, image in TextureAtlas.__load_images(loader, sprite_files).items():
+            sprites[file.relative_to(TextureAtlas.__sprites_folder).as_posix()] = image
+
+        start = time.perf_counter()
+        TextureAtlas.__sprites_atlas_pages, TextureAtlas.__sprites_atlas_mappings = TextureAtlas.__pack(
+            sprites, TextureAtlas.__sprites_atlas_max_size)
+        loader.add_timing("pack", time.perf_counter() - start)
 
         TextureAtlas.__logger.info("Sprite textures loading finished")
 
     @staticmethod
-    def __init_animations():
+    def __init_animations(loader: AssetLoader):
         TextureAtlas.__logger.info("Start loading animations...")
 
         animations_files = [os.path.join(root, file) for root, dirs, files in os.walk(TextureAtlas.__animations_folder)
                             for file in files if file.endswith(".png")]
 
-        grouped_animations: dict[str, list[tuple[str, pygame.Surface, int, int]]] = {}
-        for file in animations_files:
-            image = pygame.image.load(file).convert_alpha()
-            width, height = image.get_size()
-
-            file = Path(file).relative_to(TextureAtlas.__animations_folder).as_posix()
+        frames: dict[str, pygame.Surface] = {}
+        for file, image in TextureAtlas.__load_images(loader, animations_files).items():
+            file = file.relative_to(TextureAtlas.__animations_folder).as_posix()
             group = file.split("/")[0]
             frame = file.split("/")[1]
+            frames[f"{group}/{frame}"] = image
 
-            if group in grouped_animations.keys():
-                curr_group = grouped_animations.get(group)
-                curr_group.append((frame, image, width, height))
-                grouped_animations[group] = curr_group
-            else:
-                grouped_animations[group] = [(frame, image, width, height)]
-
-        # print(enumerate(grouped_animations))
+        start = time.perf_counter()
+        TextureAtlas.__animations_atlas_pages, TextureAtlas.__animations_atlas_mappings = TextureAtlas.__pack(
+            frames, TextureAtlas.__animations_atlas_max_size)
+        loader.add_timing("pack", time.perf_counter() - start)
 
-        # Arrange and measure animations atlas size
-        x, y = 0, 0
-        row_height = 0
+        TextureAtlas.__logger.info("Animation loading finished")
 
-        atlas_width = TextureAtlas.__animations_atlas_max_width
-        atlas_height = 0
+    @staticmethod
+    def pack_sections() -> dict[str, tuple[str, list[pygame.Surface], dict[str, dict]]]:
+        """The fingerprint, pages and mappings of both loaded atlases, for writing an asset pack."""
+        return {
+            "sprites": (TextureAtlas.__sprites_key, TextureAtlas.__sprites_atlas_pages,
+                        TextureAtlas.__sprites_atlas_mappings),
+            "animations": (TextureAtlas.__animations_key, TextureAtlas.__animations_atlas_pages,
+                           TextureAtlas.__animations_atlas_mappings),
+        }
 
-        padding = 2
+    @staticmethod
+    def report() -> list[AtlasReport]:
+        """Return the page layout and memory use of the sprites and animations atlases."""
+        reports = []
+        for name, pages, mappings in (
+            ("sprites", TextureAtlas.__sprites_atlas_pages, TextureAtlas.__sprites_atlas_mappings),
+            ("animations", TextureAtlas.__animations_atlas_pages, TextureAtlas.__animations_atlas_mappings),
+        ):
+            reports.append(AtlasReport(
+                name=name,
+                packer=settings.ATLAS_PACKER,
+                textures=len(mappings),
+                pages=tuple(page.get_size() for page in pages),
+                used_pixels=sum(mapping["width"] * mapping["height"] for mapping in mappings.values()),
+            ))
+        return reports
 
-        for index, (group, frames) in enumerate(grouped_animations.items()):
-            for frame in frames:
-                file, image, w, h = frame
+    @staticmethod
+    def __resolve(path: str, atlas: str, mappings: dict[str, dict], pages: list[pygame.Surface],
+                  handles: dict[str, TextureHandle]) -> TextureHandle | None:
+        """Build the handle of a texture the first time it is looked up."""
+        TextureAtlas.misses += 1
+        key = path if path.endswith(".png") else path + ".png"
+        texture_mappings = mappings.get(key)
+        if texture_mappings is None:
+            return None
 
-                if x + w > atlas_width:
-                    x = 0
-                    y += row_height + padding
+        handle = handles.get(key)
+        if handle is None:
+            rect = (texture_mappings["x"], texture_mappings["y"], texture_mappings["width"], texture_mappings["height"])
+            page = texture_mappings["page"]
+            handle = TextureHandle(key, pages[page].subsurface(rect), atlas, page, rect)
+            handles[key] = handle
+        handles[path] = handle
+        return handle
 
-                TextureAtlas.__animations_atlas_mappings[f"{group}/{file}"] = {"x": x, "y": y, "width": w, "height": h}
+    @staticmethod
+    def get_sprite_handle(path: str) -> TextureHandle | None:
+        """This method will return the handle of a sprite texture. Returns None, if sprite texture wasn't present."""
+        handle = TextureAtlas.__sprite_handles.get(path)
+        if handle is not None:
+            TextureAtlas.hits += 1
+            return handle
+
+        if not TextureAtlas.__loaded:
+            TextureAtlas.__logger.error("Sprite textures are not loaded")
+            return None
+        handle = TextureAtlas.__resolve(path, "sprites", TextureAtlas.__sprites_atlas_mappings,
+                                        TextureAtlas.__sprites_atlas_pages, TextureAtlas.__sprite_handles)
+        if handle is None:
+            TextureAtlas.__logger.error(f"Sprite {path} doesn't exist")
+        return handle
 
-                x += w + padding
-                row_height = max(row_height, h)
+    @staticmethod
+    def get_animation_handle(path: str) -> TextureHandle | None:
+        """This method will return the handle of an animation frame. Returns None, if animation frame wasn't present."""
+        handle = TextureAtlas.__animation_handles.get(path)
+        if handle is not None:
+            TextureAtlas.hits += 1
+            return handle
+
+        if not TextureAtlas.__loaded:
+            TextureAtlas.__logger.error("Animations are not loaded")
+            return None
+        handle = TextureAtlas.__resolve(path, "animations", TextureAtlas.__animations_atlas_mappings,
+                                        TextureAtlas.__animations_atlas_pages, TextureAtlas.__animation_handles)
+        if handle is None:
+            TextureAtlas.__logger.error(f"Animation frame {path} doesn't exist")
+        return handle
 
-        atlas_height = y + row_height
+    @staticmethod
+    def get_sprite_texture(path: str) -> pygame.Surface | None:
+        """This method will return a sprite texture. Returns None, if sprite texture wasn't present.
 
-        # Create and fill animations atlas
-        TextureAtlas.__animations_atlas_surface = pygame.Surface((atlas_width, atlas_height), pygame.SRCALPHA)
-        for index, (group, frames) in enumerate(grouped_animations.items()):
-            for frame in frames:
-                file, image, _, _ = frame
+        The same subsurface is returned on every call, don't draw on it.
+        """
+        handle = TextureAtlas.get_sprite_handle(path)
+        return handle.surface if handle is not None else None
 
-                x = TextureAtlas.__animations_atlas_mappings.get(f"{group}/{file}").get("x")
-                y = TextureAtlas.__animations_atlas_mappings.get(f"{group}/{file}").get("y")
-                TextureAtlas.__animations_atlas_surface.blit(image, (x, y))
+    @staticmethod
+    def get_animation_frame(path: str) -> pygame.Surface | None:
+        """This method will return an animation frame. Returns None, if animation frame wasn't present.
 
-        TextureAtlas.__logger.info("Animation loading finished")
+        The same subsurface is returned on every call, don't draw on it.
+        """
+        handle = TextureAtlas.get_animation_handle(path)
+        return handle.surface if handle is not None else None
 
     @staticmethod
-    def get_sprite_texture(path: str) -> pygame.Surface | None:
-        """This method will return a sprite texture. Returns None, if sprite texture wasn't present."""
-        if TextureAtlas.__loaded:
-            if not path.endswith(".png"):
-                path += ".png"
-            if path in TextureAtlas.__sprites_atlas_mappings.keys():
-                texture_mappings = TextureAtlas.__sprites_atlas_mappings.get(path)
-                return TextureAtlas.__sprites_atlas_surface.subsurface(pygame.Rect(texture_mappings.get("x"), texture_mappings.get("y"),
-                                                                                   texture_mappings.get("width"), texture_mappings.get("height")))
-            else:
-                TextureAtlas.__logger.error(f"Sprite {path} doesn't exist")
-                return None
-        else:
-            TextureAtlas.__logger.error("Sprite textures are not loaded")
-            return None
+    def preload(sprites: Iterable[str] = (), animation_frames: Iterable[str] = ()) -> None:
+        """Resolve the handles of many textures at once, e.g. everything drawn every frame."""
+        for path in sprites:
+            TextureAtlas.get_sprite_handle(path)
+        for path in animation_frames:
+            TextureAtlas.get_animation_handle(path)
 
     @staticmethod
-    def get_animation_frame(path: str) -> pygame.Surface | None:
-        """This method will return an animation frame. Returns None, if animation frame wasn't present."""
-        if TextureAtlas.__loaded:
-            if not path.endswith(".png"):
-                path += ".png"
-            if path in TextureAtlas.__animations_atlas_mappings.keys():
-                texture_mappings = TextureAtlas.__animations_atlas_mappings.get(path)
-                return TextureAtlas.__animations_atlas_surface.subsurface(pygame.Rect(texture_mappings.get("x"), texture_mappings.get("y"),
-                                                                                   texture_mappings.get("width"), texture_mappings.get("height")))
-            else:
-                TextureAtlas.__logger.error(f"Animation frame {path} doesn't exist")
-                return None
-        else:
-            TextureAtlas.__logger.error("Animations are not loaded")
-            return None
+    def hit_rate() -> float:
+        lookups = TextureAtlas.hits + TextureAtlas.misses
+        return TextureAtlas.hits / lookups if lookups else 0.0
 
     @staticmethod
     def save_to_file() -> None:
-        """This method will create two image files, one for sprites atlas, and another one for animations atlas. This
-        method is only for debugging purposes."""
-        pygame.image.save(TextureAtlas.__sprites_atlas_surface, "atlas-sprites.png")
-        pygame.image.save(TextureAtlas.__sprites_atlas_surface, "atlas-animations.png")
+        """This method will create an image file per atlas page, for the sprites atlas and for the animations atlas.
+        This method is only for debugging purposes."""
+        for index, page in enumerate(TextureAtlas.__sprites_atlas_pages):
+            pygame.image.save(page, f"atlas-sprites-{index}.png")
+        for index, page in enumerate(TextureAtlas.__animations_atlas_pages):
+            pygame.image.save(page, f"atlas-animations-{index}.png")
@@ -0,0 +1,111 @@
+import logging
+from collections import OrderedDict
+from typing import NamedTuple
+
+import pygame
+
+from .. import settings
+from .texture_atlas import TextureAtlas
+
+
+class VariantKey(NamedTuple):
+    """Identifies a derived texture: the atlas texture and what was done to it."""
+
+    path: str
+    size: tuple[int, int] | None
+    rotation: float
+    alpha: int | None
+    flip: tuple[bool, bool]
+    animation: bool
+
+
+class TextureVariantCache:
+    """Memoizes scaled, flipped, rotated and translucent copies of atlas textures.
+
+    A variant is built once (scale, then flip, then rotate, then alpha) and the same surface is handed to every
+    caller asking for it, so don't draw on it or change its alpha. Entries are evicted least recently used first
+    once the cached surfaces exceed `max_bytes`. Per-frame rotations of moving sprites go through the
+    `RotationCache` instead, which buckets the angles.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, max_bytes: int = settings.TEXTURE_CACHE_MAX_BYTES) -> None:
+        self.max_bytes: int = max_bytes
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.bytes: int = 0
+
+        self.__entries: OrderedDict[VariantKey, pygame.Surface] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, path: str, size: tuple[float, float] | None = None, rotation: float = 0,
+            alpha: int | None = None, flip: tuple[bool, bool] = (False, False),
+            animation: bool = False) -> pygame.Surface | None:
+        """Return the variant of an atlas texture (a sprite, or an animation frame if `animation`).
+
+        Returns None, like the atlas, if the texture isn't there.
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        key = VariantKey(path, size, rotation % 360, alpha, flip, animation)
+
+        entries = self.__entries
+        surface = entries.get(key)
+        if surface is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        texture = TextureAtlas.get_animation_frame(path) if animation else TextureAtlas.get_sprite_texture(path)
+        if texture is None:
+            return None
+
+        self.misses += 1
+        surface = self.__build(texture, key)
+        entries[key] = surface
+        self.bytes += self.__size(surface)
+        while self.bytes > self.max_bytes and len(entries) > 1:
+            _, evicted = entries.popitem(last=False)
+            self.bytes -= self.__size(evicted)
+
+        return surface
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.bytes = 0
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def report(self) -> str:
+        return (f"Texture variants: {len(self)} cached ({self.bytes / 1024:.0f} KiB), "
+                f"{self.hits} hits, {self.misses} misses ({self.hit_rate():.1%} hit rate)")
+
+    @staticmethod
+    def __build(texture: pygame.Surface, key: VariantKey) -> pygame.Surface:
+        surface = texture
+        if key.size is not None:
+            surface = pygame.transform.scale(surface, key.size)
+        if key.flip != (False, False):
+            surface = pygame.transform.flip(surface, *key.flip)
+        if key.rotation:
+            surface = pygame.transform.rotate(surface, key.rotation)
+        if surface is texture:
+            # Never hand out (or change the alpha of) the atlas subsurface itself.
+            surface = texture.copy()
+        if key.alpha is not None:
+            surface.set_alpha(key.alpha)
+        return surface
+
+    @staticmethod
+    def __size(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+# Shared by every sprite drawing a fixed variant of an atlas texture.
+texture_cache = TextureVariantCache()
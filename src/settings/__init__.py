@@ -11,6 +11,20 @@ type Color = tuple[int, int, int]
 BASE_DIR: Path = Path(__file__).parent.parent.parent
 ASSETS_DIR: Path = BASE_DIR / "data" / "assets"
 SOUNDS_DIR: Path = ASSETS_DIR / "sounds"
+# Generated files (packed texture atlases, ...); safe to delete.
+CACHE_DIR: Path = BASE_DIR / "cache"
+TEXTURE_ATLAS_CACHE: bool = True
+
+# Pre-decoded atlases and backgrounds, built by tools/build_asset_pack.py; without it the PNGs are loaded
+ASSET_PACK: Path = BASE_DIR / "data" / "assets.pack"
+ASSET_PACK_ENABLED: bool = True
+
+# Threads decoding image files at startup (0: one per CPU)
+ASSET_LOADER_WORKERS: int = 0
+
+# Texture atlas packing: "skyline" or "shelf", and the largest atlas page
+ATLAS_PACKER: str = "skyline"
+ATLAS_MAX_PAGE_SIZE: int = 4096
 
 FONT = pygame.font.Font(
     BASE_DIR / "data" / "assets" / "fonts" / "Silkscreen-Regular.ttf",
@@ -27,7 +41,10 @@ HEART_SPEED_FACTOR = 4
 
 # Clock
 FPS: float = 120.0
+# The game advances in fixed steps of one frame at FPS (see src.timestep), each moving sprites by DELTA_TIME.
 DELTA_TIME: float = (1000.0 / FPS) / 10
+MAX_STEPS_PER_FRAME: int = 8
+MAX_INTERPOLATION_DISTANCE: float = 32.0
 DEFAULT_ANIMATION_LATENCY: float = DELTA_TIME / 500
 
 # Screen settings
@@ -47,6 +64,8 @@ BULLET_HEIGHT: int = 15
 BULLET_COLOR: tuple[int, int, int] = (60, 60, 60)
 BULLETS_ALLOWED: int = 5
 ALIEN_BULLET_SPEED_FACTOR: float = 5.0
+SHIP_BULLET_POOL_SIZE: int = BULLETS_ALLOWED
+ALIEN_BULLET_POOL_SIZE: int = 64
 
 # Alien settings
 ALIEN_SPEED_FACTOR: float = 5.0
@@ -66,6 +85,21 @@ SCORE_SCALE: float = 1.5
 ALIEN_POINTS: int = 50
 CARGO_POINTS: int = 100
 
+# Rotation cache settings
+ROTATION_CACHE_BUCKET_DEGREES: float = 2.0
+ROTATION_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+
+# Sound settings: False keeps the game silent without touching the audio device
+SOUNDS_ENABLED: bool = True
+
+# Texture variant (scaled, flipped, translucent) cache settings
+TEXTURE_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+
+# Renderer settings: "full" or "dirty" presenting, background "scroll", "quantized" or "frozen"
+RENDER_MODE: str = "full"
+BACKGROUND_MODE: str = "quantized"
+BACKGROUND_SCROLL_STEP: int = 8
+
 # Screen background settings
 BG_SCREEN_X: int = 0
 BG_SCREEN_Y: int = 0
@@ -73,6 +107,45 @@ BG_SCREEN_2_X: int = 0
 BG_SCREEN_2_Y: int = -SCREEN_HEIGHT
 BG_SCREEN_SCROLL_SPEED: float = 0.2
 
+# Region background settings: start loading the next region's background this many points
+# before its minimum score, and keep at most this many bytes of backgrounds loaded (the
+# current and the next region are always kept)
+REGION_PREFETCH_SCORE_MARGIN: int = 150
+REGION_MEMORY_BUDGET: int = 3 * SCREEN_WIDTH * SCREEN_HEIGHT * 4
+
+# Gameplay recording: a directory with a session per run, each split into segments of at most
+# RECORDER_SEGMENT_BYTES of rows (before compression) compressed with "gzip" or "lzma" (a path
+# ending in ".csv" writes CSV instead), optionally echoing every frame to the console
+RECORDING_PATH: Path = BASE_DIR / "data" / "recording"
+RECORDER_SEGMENT_BYTES: int = 1024 * 1024
+RECORDER_COMPRESSION: str = "gzip"
+RECORDER_ECHO: bool = False
+
+# Recorded rows are written on a background thread (unless RECORDER_BACKGROUND is False) through a
+# ring buffer of RECORDER_QUEUE_ROWS rows. When it is full: "block" (wait at most RECORDER_BLOCK_TIMEOUT
+# seconds), "drop_oldest" or "sample"
+RECORDER_BACKGROUND: bool = True
+RECORDER_QUEUE_ROWS: int = 8192
+RECORDER_OVERFLOW_POLICY: str = "drop_oldest"
+RECORDER_BLOCK_TIMEOUT: float = 0.002
+
+# Frames the recorder keeps (see src/recording/policies.py): "every_frame", "every_nth" (every
+# RECORDER_EVERY_NTH frames), "on_change" (when a field moves more than its tolerance, at least every
+# RECORDER_CHANGE_MAX_INTERVAL_MS) or "events" (RECORDER_BURST_FRAMES before and after each shot, hit or pickup)
+RECORDER_POLICY: str = "every_frame"
+RECORDER_EVERY_NTH: int = 4
+RECORDER_CHANGE_TOLERANCES: dict[str, float] = {
+    "ship_x": 2, "ship_y": 2, "ship_angle": 0.05, "mouse_x": 4, "mouse_y": 4,
+    "nearest_alien_dx": 4, "nearest_alien_dy": 4, "nearest_alien_distance": 4,
+    "nearest_alien_vx": 5, "nearest_alien_vy": 5,
+}
+RECORDER_CHANGE_MAX_INTERVAL_MS: int = 1000
+RECORDER_BURST_FRAMES: tuple[int, int] = (30, 60)
+
+# World snapshots (every entity, every frame; see src/recording/snapshots.py), written like the recording
+SNAPSHOTS_ENABLED: bool = True
+SNAPSHOT_PATH: Path = BASE_DIR / "data" / "snapshots"
+
 
 class Settings:
     """A class to store all settings for Alien Invasion"""
@@ -2,11 +2,14 @@ import math
 
 import pygame
 
+from src.entity_store import TYPE_SHIP
 from src.resources.texture_atlas import TextureAtlas
 from . import input, settings
 
 
 class Ship(pygame.sprite.Sprite):
+    type_id: int = TYPE_SHIP
+
     def __init__(self, input: input.Input):
         """Initialize the ship and set its starting position."""
         self.screen: pygame.Surface = pygame.display.get_surface()
@@ -53,11 +56,11 @@ class Ship(pygame.sprite.Sprite):
         dy: float = mouse_pos[1] - self.center[1]
         self.angle: float = math.atan2(-dx, -dy)  # Calculate angle
 
-    def bltime(self) -> None:
+    def bltime(self) -> pygame.Rect:
         """Draw the ship at its current location."""
         rotated_image: pygame.Surface = pygame.transform.rotate(self.image, math.degrees(self.angle))
         rotated_rect: pygame.Rect = rotated_image.get_rect(center=self.center)
-        self.screen.blit(rotated_image, rotated_rect)
+        return self.screen.blit(rotated_image, rotated_rect)
 
     def center_ship(self) -> None:
         """Center the ship on the screen."""
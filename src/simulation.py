@@ -0,0 +1,207 @@
+"""Headless, fixed-timestep simulation of the game world.
+
+`Simulation` owns everything the main loop updates (ship, sprite groups, stats,
+health and the region manager) and advances it exactly like `run_game` does,
+minus event handling, drawing, presenting and the frame cap. Each step advances
+the simulated clock by one fixed frame (`1000 / fps` ms), so thousands of frames
+can be simulated per second, e.g. for AI evaluation or soak tests:
+
+    SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python -c "
+    from src.simulation import Simulation
+    sim = Simulation()
+    sim.reset()
+    print(sim.step(10_000))"
+"""
+
+from dataclasses import dataclass
+
+import pygame
+from pygame.sprite import Group
+
+from . import game_functions as gf
+from .bullet import alien_bullet_pool, ship_bullet_pool
+from .entities.ui.elements.scoreboard import Scoreboard
+from .entity_store import EntityGroup
+from .game_stats import GameStats
+from .health import Health
+from .input import Input
+from .region import RegionManager, init_regions
+from .resources.texture_atlas import TextureAtlas
+from .settings import ALIEN_BULLET_POOL_SIZE, SCREEN_HEIGHT, SCREEN_WIDTH, SHIP_BULLET_POOL_SIZE, Settings
+from .ship import Ship
+
+# Aliens fire / items spawn every SPAWN_INTERVAL_MS, a new alien every ALIEN_SPAWN_EVERY ticks.
+SPAWN_INTERVAL_MS: int = 100
+ALIEN_SPAWN_EVERY: int = 10
+
+# Textures looked up every frame, resolved once up front.
+PRELOADED_SPRITES: tuple[str, ...] = (
+    "ship/ship.png",
+    "misc/crosshair.png",
+    "bullet/golden_bullet.png",
+    "heart/full_heart.png",
+    "heart/empty_heart.png",
+    "shield/shield.png",
+    "alien/alien_l1.png",
+    "alien/alien_l2.png",
+    "alien/alien_cargo.png",
+)
+
+
+@dataclass(frozen=True)
+class SimulationState:
+    """Summary of the simulated world after a step."""
+
+    frame: int
+    time_ms: float
+    game_active: bool
+    score: int
+    health: int
+    ship_position: tuple[float, float]
+    aliens: int
+    cargoes: int
+    bullets: int
+    alien_bullets: int
+    hearts: int
+    shields: int
+    can_spawn: bool
+
+
+class Simulation:
+    """Steps the game world at a fixed timestep without a window, audio output or frame cap.
+
+    A display surface is still required by the sprites (`pygame.display.get_surface()`), so
+    one is created when missing; run with `SDL_VIDEODRIVER=dummy` to keep it off-screen.
+    """
+
+    def __init__(
+        self,
+        ai_settings: Settings | None = None,
+        input: Input | None = None,
+        region_manager: RegionManager | None = None,
+        start_ms: float = 0.0,
+    ) -> None:
+        self.ai_settings: Settings = ai_settings or Settings()
+
+        screen: pygame.Surface | None = pygame.display.get_surface()
+        if screen is None or screen.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
+            screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen: pygame.Surface = screen
+
+        TextureAtlas.initialize()
+        TextureAtlas.preload(PRELOADED_SPRITES)
+        ship_bullet_pool.preallocate(SHIP_BULLET_POOL_SIZE)
+        alien_bullet_pool.preallocate(ALIEN_BULLET_POOL_SIZE)
+
+        self.input: Input = input or Input()
+        self.region_manager: RegionManager = region_manager or init_regions(self.screen)
+
+        # Fixed timestep in milliseconds.
+        self.frame_ms: float = 1000.0 / self.ai_settings.fps
+        self.frame: int = 0
+        self.time_ms: float = start_ms
+
+        self.stats = GameStats()
+        self.sb = Scoreboard(self.screen, self.stats)
+
+        self.health = Health()
+        self.health.reset()
+
+        self.ship = Ship(self.input)
+        self.bullets = EntityGroup()
+        self.aliens = EntityGroup()
+        self.cargoes = EntityGroup()
+        self.alien_bullets = EntityGroup()
+        self.hearts = Group()
+        self.shields = Group()
+
+        self.__spawn_timer: float = start_ms
+        self.__spawn_counter: int = 0
+
+    def reset(self) -> None:
+        """Start a new game, the same way the play button does."""
+        gf.run_play_button(
+            self.ai_settings,
+            self.stats,
+            self.ship,
+            self.aliens,
+            self.cargoes,
+            self.bullets,
+            self.health,
+            self.region_manager,
+        )
+        self.alien_bullets.empty()
+        self.hearts.empty()
+        self.shields.empty()
+
+    def update_sprites(self) -> None:
+        """Move every sprite and resolve collisions for one frame."""
+        if not self.stats.game_active:
+            return
+
+        gf.update_game_sprites(
+            self.ai_settings,
+            self.screen,
+            self.stats,
+            self.sb,
+            self.ship,
+            self.aliens,
+            self.bullets,
+            self.cargoes,
+            self.alien_bullets,
+            self.health,
+            self.hearts,
+            self.shields,
+        )
+
+    def update_spawners(self, now_ms: float) -> None:
+        """Run the alien fire / item / alien spawn timer, or clear the world while a region fades in."""
+        if self.region_manager.can_spawn_objects():
+            if now_ms - self.__spawn_timer > SPAWN_INTERVAL_MS:
+                gf.alien_fire(self.ai_settings, self.stats, self.screen, self.aliens, self.alien_bullets, self.ship)
+
+                gf.generate_heart(self.stats, self.screen, self.hearts)
+                gf.generate_shields(self.screen, self.ai_settings, self.stats, self.shields)
+
+                if self.__spawn_counter % ALIEN_SPAWN_EVERY == 0:
+                    gf.spawn_random_alien(self.ai_settings, self.screen, self.aliens)
+
+                self.__spawn_counter += 1
+                self.__spawn_timer = now_ms
+        else:
+            self.bullets.empty()
+            self.aliens.empty()
+            self.alien_bullets.empty()
+            self.cargoes.empty()
+            self.hearts.empty()
+            self.shields.empty()
+
+    def step(self, frames: int = 1) -> SimulationState:
+        """Advance the simulation by `frames` fixed steps and return the resulting state."""
+        for _ in range(frames):
+            self.update_sprites()
+            self.region_manager.step(self.stats.score, self.ai_settings.delta_time)
+
+            self.frame += 1
+            self.time_ms += self.frame_ms
+            self.update_spawners(self.time_ms)
+
+        return self.state()
+
+    def state(self) -> SimulationState:
+        """Return a snapshot of the current world."""
+        return SimulationState(
+            frame=self.frame,
+            time_ms=self.time_ms,
+            game_active=self.stats.game_active,
+            score=self.stats.score,
+            health=self.health.current_hearts,
+            ship_position=(self.ship.center[0], self.ship.center[1]),
+            aliens=len(self.aliens),
+            cargoes=len(self.cargoes),
+            bullets=len(self.bullets),
+            alien_bullets=len(self.alien_bullets),
+            hearts=len(self.hearts),
+            shields=len(self.shields),
+            can_spawn=self.region_manager.can_spawn_objects(),
+        )
@@ -0,0 +1,170 @@
+"""Uniform-grid spatial hash used as the broad phase for large group collisions.
+
+`pygame.sprite.groupcollide` tests every pair of sprites, so its cost grows with the product
+of the group sizes. Here the group that is collided against gets a grid over the playfield;
+each sprite is filed under the cells its rect overlaps and a query only runs `colliderect` on
+the sprites sharing a cell with the queried rect. The grid is kept up to date incrementally: a
+sprite is only re-filed when the range of cells it covers changes, and sprites that left the
+group are dropped.
+
+Keeping the grid in sync still costs a few microseconds per sprite of Python, while pygame
+tests a pair in C in a fraction of that, so the grid only pays off once both groups are large:
+`groupcollide` uses it when there are more than `GRID_BREAK_EVEN` pairs per sprite and calls
+pygame otherwise (at the game's counts, at most `BULLETS_ALLOWED` bullets against the aliens,
+that is always). Single-sprite queries should use `pygame.sprite.spritecollideany` directly.
+
+`groupcollide` and `grid_groupcollide` are drop-in replacements for
+`pygame.sprite.groupcollide` (default rect collision only) and return exactly the same
+results, including the order of the collided sprites and the effect of `dokilla` / `dokillb`.
+"""
+
+from weakref import WeakKeyDictionary
+
+import pygame
+from pygame.sprite import Group, Sprite
+
+from .settings import SCREEN_HEIGHT, SCREEN_WIDTH
+
+CELL_SIZE: int = 64
+# Pairs per sprite (len(a) * len(b) / (len(a) + len(b))) from which the grid beats pygame's pairwise test,
+# measured with moving 50x50 sprites; e.g. about 150 sprites in each group.
+GRID_BREAK_EVEN: int = 75
+
+
+class SpatialHash:
+    """A grid of cell_size x cell_size buckets covering a width x height playfield.
+
+    Rects reaching outside the playfield are filed under the border cells, so every
+    overlapping pair still shares at least one cell.
+    """
+
+    def __init__(self, width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT, cell_size: int = CELL_SIZE) -> None:
+        self.cell_size: int = cell_size
+        self.columns: int = max(1, -(-width // cell_size))
+        self.rows: int = max(1, -(-height // cell_size))
+
+        self.__cells: dict[int, set[Sprite]] = {}
+        self.__spans: dict[Sprite, tuple[int, int, int, int]] = {}
+        self.__members: dict[Sprite, object] = {}
+        self.__order: dict[Sprite, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.__spans)
+
+    def __span(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        last_column = self.columns - 1
+        last_row = self.rows - 1
+        return (
+            min(max(rect.left // size, 0), last_column),
+            min(max(rect.top // size, 0), last_row),
+            min(max((rect.left + max(rect.width, 1) - 1) // size, 0), last_column),
+            min(max((rect.top + max(rect.height, 1) - 1) // size, 0), last_row),
+        )
+
+    def __cell_keys(self, span: tuple[int, int, int, int]):
+        left, top, right, bottom = span
+        columns = self.columns
+        for row in range(top, bottom + 1):
+            for column in range(left, right + 1):
+                yield row * columns + column
+
+    def __insert(self, sprite: Sprite, span: tuple[int, int, int, int]) -> None:
+        cells = self.__cells
+        for key in self.__cell_keys(span):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = {sprite}
+            else:
+                bucket.add(sprite)
+        self.__spans[sprite] = span
+
+    def discard(self, sprite: Sprite) -> None:
+        """Remove a sprite from the grid if present."""
+        span = self.__spans.pop(sprite, None)
+        if span is None:
+            return
+        cells = self.__cells
+        for key in self.__cell_keys(span):
+            bucket = cells[key]
+            bucket.discard(sprite)
+            if not bucket:
+                del cells[key]
+
+    def sync(self, group: Group) -> None:
+        """Bring the grid up to date with the group's members and rect positions."""
+        members = group.spritedict
+        spans = self.__spans
+        for sprite in spans.keys() - members.keys():
+            self.discard(sprite)
+
+        for sprite in members:
+            span = self.__span(sprite.rect)
+            previous = spans.get(sprite)
+            if previous != span:
+                if previous is not None:
+                    self.discard(sprite)
+                self.__insert(sprite, span)
+
+        # Group order, for sorting hits; only built when a query has more than one.
+        self.__members = members
+        self.__order = None
+
+    def query(self, rect: pygame.Rect) -> list[Sprite]:
+        """Return the filed sprites whose rect collides with `rect`, in group order."""
+        cells = self.__cells
+        candidates: set[Sprite] = set()
+        for key in self.__cell_keys(self.__span(rect)):
+            bucket = cells.get(key)
+            if bucket:
+                candidates.update(bucket)
+
+        colliderect = rect.colliderect
+        hits = [sprite for sprite in candidates if colliderect(sprite.rect)]
+        if len(hits) > 1:
+            if self.__order is None:
+                self.__order = {sprite: index for index, sprite in enumerate(self.__members)}
+            hits.sort(key=self.__order.__getitem__)
+        return hits
+
+
+_grids: "WeakKeyDictionary[Group, SpatialHash]" = WeakKeyDictionary()
+
+
+def grid_for(group: Group) -> SpatialHash:
+    """Return the group's spatial hash, synced with its current members."""
+    grid = _grids.get(group)
+    if grid is None:
+        grid = _grids[group] = SpatialHash()
+    grid.sync(group)
+    return grid
+
+
+def groupcollide(groupa: Group, groupb: Group, dokilla: bool, dokillb: bool) -> dict[Sprite, list[Sprite]]:
+    """Same as pygame.sprite.groupcollide(groupa, groupb, dokilla, dokillb), through the grid for large groups."""
+    count_a, count_b = len(groupa), len(groupb)
+    if count_a * count_b < GRID_BREAK_EVEN * (count_a + count_b):
+        return pygame.sprite.groupcollide(groupa, groupb, dokilla, dokillb)
+    return grid_groupcollide(groupa, groupb, dokilla, dokillb)
+
+
+def grid_groupcollide(groupa: Group, groupb: Group, dokilla: bool, dokillb: bool) -> dict[Sprite, list[Sprite]]:
+    """Same as pygame.sprite.groupcollide(groupa, groupb, dokilla, dokillb), always through groupb's grid."""
+    grid = grid_for(groupb)
+    crashed: dict[Sprite, list[Sprite]] = {}
+
+    for sprite in groupa.sprites():
+        collision = grid.query(sprite.rect)
+        if not collision:
+            continue
+
+        if dokillb:
+            # Killed sprites can't be hit again by the following sprites of groupa.
+            for hit in collision:
+                hit.kill()
+                grid.discard(hit)
+        crashed[sprite] = collision
+        if dokilla:
+            sprite.kill()
+
+    return crashed
@@ -0,0 +1,142 @@
+"""Where launch time goes.
+
+`StartupProfiler` times named startup phases (`with startup_profiler.phase("TextureAtlas.initialize"): ...`) and,
+once started, every module imported for the first time. Imports are timed by wrapping `builtins.__import__`, so
+an entry's time includes the modules it imports in turn; `depth` 0 marks imports made directly by the game.
+
+Started by `alien_invasion.py --profile-startup [JSON]` before its own imports and finished right before the main
+loop, it prints a breakdown sorted by time and, given a path, writes the same numbers as JSON. While not started
+`phase()` costs next to nothing, so the phases can stay in place.
+
+This module only uses the standard library, so importing it doesn't skew the numbers.
+"""
+
+import builtins
+import importlib.util
+import json
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class Timing:
+    """One timed phase or import, in milliseconds since the profiler started."""
+
+    name: str
+    start_ms: float
+    duration_ms: float
+    depth: int = 0
+
+
+class StartupProfiler:
+    """Times startup phases and first imports."""
+
+    def __init__(self, min_import_ms: float = 1.0, report_depth: int = 2) -> None:
+        # Imports faster than this aren't recorded, nested deeper than report_depth aren't printed.
+        self.min_import_ms: float = min_import_ms
+        self.report_depth: int = report_depth
+
+        self.running: bool = False
+        self.phases: list[Timing] = []
+        self.imports: list[Timing] = []
+        self.total_ms: float = 0.0
+
+        self.__start: float = 0.0
+        self.__import_depth: int = 0
+        self.__original_import = None
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self.running = True
+        self.__start = time.perf_counter()
+        self.__original_import = builtins.__import__
+        builtins.__import__ = self.__import
+
+    def finish(self) -> None:
+        """Stop timing; the phases and imports recorded so far are kept."""
+        if not self.running:
+            return
+        self.total_ms = self.__elapsed_ms()
+        builtins.__import__ = self.__original_import
+        self.running = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.running:
+            yield
+            return
+
+        start = self.__elapsed_ms()
+        try:
+            yield
+        finally:
+            self.phases.append(Timing(name, start, self.__elapsed_ms() - start))
+
+    def report(self) -> str:
+        """The phases and the imports, each sorted slowest first."""
+        lines = [f"Startup took {self.total_ms:.0f} ms", "Phases:"]
+        for timing in sorted(self.phases, key=lambda t: t.duration_ms, reverse=True):
+            lines.append(f"  {timing.duration_ms:8.1f} ms  {self.__share(timing):5.1%}  {timing.name}")
+
+        lines.append("Imports (nested imports indented, included in their parent):")
+        self.__report_imports(lines, 0, 0.0, self.total_ms)
+        return "\n".join(lines)
+
+    def __report_imports(self, lines: list[str], depth: int, start_ms: float, end_ms: float) -> None:
+        """Add the imports at `depth` made between start_ms and end_ms, and the ones they made."""
+        if depth > self.report_depth:
+            return
+        nested = [t for t in self.imports if t.depth == depth and start_ms <= t.start_ms <= end_ms]
+        for timing in sorted(nested, key=lambda t: t.duration_ms, reverse=True):
+            lines.append(f"  {timing.duration_ms:8.1f} ms  {self.__share(timing):5.1%}  {'  ' * depth}{timing.name}")
+            self.__report_imports(lines, depth + 1, timing.start_ms, timing.start_ms + timing.duration_ms)
+
+    def to_dict(self) -> dict:
+        return {
+            "total_ms": self.total_ms,
+            "phases": [asdict(timing) for timing in self.phases],
+            "imports": [asdict(timing) for timing in self.imports],
+        }
+
+    def write_json(self, path: Path | str) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+    def __share(self, timing: Timing) -> float:
+        return timing.duration_ms / self.total_ms if self.total_ms else 0.0
+
+    def __elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.__start) * 1000
+
+    def __import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        module = name
+        if level and name:
+            try:
+                module = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+            except (ImportError, ValueError):
+                module = ""
+
+        # Only the first import of a module does any work; `from . import x` has no name to time.
+        # Imports on background threads (sound decoding, prefetching, ...) aren't part of the launch.
+        if not module or module in sys.modules or threading.current_thread() is not threading.main_thread():
+            return self.__original_import(name, globals, locals, fromlist, level)
+
+        depth = self.__import_depth
+        start = self.__elapsed_ms()
+        self.__import_depth += 1
+        try:
+            return self.__original_import(name, globals, locals, fromlist, level)
+        finally:
+            self.__import_depth -= 1
+            duration = self.__elapsed_ms() - start
+            if duration >= self.min_import_ms:
+                self.imports.append(Timing(module, start, duration, depth))
+
+
+# Shared by alien_invasion.py and anything it wants to time.
+startup_profiler = StartupProfiler()
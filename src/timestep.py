@@ -0,0 +1,107 @@
+"""Fixed simulation steps driven by real frame time, with interpolated rendering.
+
+The game logic moves every sprite by `settings.DELTA_TIME` per update, which is one frame
+at `FPS`. Instead of running one update per rendered frame (and slowing the game down
+whenever a frame takes longer), the main loop measures how long the last frame really
+took (`clock.tick`) and `FixedTimestep` turns that into a number of fixed steps to run,
+carrying the remainder over to the next frame. A machine rendering 60 FPS then runs two
+steps per frame and the game plays at the same speed as at 120 FPS.
+
+Because the remainder is less than a step, the last simulated state is up to one step
+ahead of the real time. `RenderInterpolator` draws the sprites between the state before
+and after the last step of the frame, so motion stays smooth at any frame rate.
+"""
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from pygame.sprite import Sprite
+
+from . import settings
+
+
+class FixedTimestep:
+    """Accumulates real frame time and hands it out in fixed steps."""
+
+    def __init__(
+        self,
+        step_ms: float = 1000.0 / settings.FPS,
+        max_steps: int = settings.MAX_STEPS_PER_FRAME,
+    ) -> None:
+        self.step_ms: float = step_ms
+        self.max_steps: int = max_steps
+        self.accumulator: float = 0.0
+
+        # Steps dropped because a frame took longer than max_steps steps.
+        self.dropped_steps: int = 0
+
+    def advance(self, elapsed_ms: float) -> int:
+        """Add a frame's real duration and return how many fixed steps to run for it.
+
+        After a long stall (loading, a dragged window) at most max_steps are run and the rest
+        of the time is dropped, so the game slows down instead of trying to catch up forever.
+        """
+        self.accumulator += elapsed_ms
+        steps = int(self.accumulator // self.step_ms)
+        self.accumulator -= steps * self.step_ms
+
+        if steps > self.max_steps:
+            self.dropped_steps += steps - self.max_steps
+            steps = self.max_steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """How far the real time is into the next step, from 0 to 1."""
+        return self.accumulator / self.step_ms
+
+
+class RenderInterpolator:
+    """Draws sprites between their positions before and after the last fixed step."""
+
+    def __init__(self, max_distance: float = settings.MAX_INTERPOLATION_DISTANCE) -> None:
+        # Sprites moving further than this in one step were placed, not moved (respawn, recycled bullet).
+        self.max_distance: float = max_distance
+
+        self.__ship_center: tuple[float, float] | None = None
+        self.__positions: dict[Sprite, tuple[int, int]] = {}
+
+    def snapshot(self, ship, groups: Iterable[Iterable[Sprite]]) -> None:
+        """Remember where everything is; call right before the last step of a frame."""
+        self.__ship_center = (ship.center[0], ship.center[1])
+        self.__positions = {sprite: sprite.rect.topleft for group in groups for sprite in group}
+
+    def __lerp(self, previous: tuple[float, float], current: tuple[float, float], alpha: float):
+        dx = current[0] - previous[0]
+        dy = current[1] - previous[1]
+        if abs(dx) > self.max_distance or abs(dy) > self.max_distance:
+            return None
+        return previous[0] + dx * alpha, previous[1] + dy * alpha
+
+    @contextmanager
+    def apply(self, alpha: float, ship, groups: Iterable[Iterable[Sprite]]) -> Iterator[None]:
+        """Move the sprites to their interpolated positions while drawing, then put them back."""
+        moved: list[tuple[Sprite, tuple[int, int]]] = []
+        for group in groups:
+            for sprite in group:
+                previous = self.__positions.get(sprite)
+                if previous is None:
+                    continue
+                current = sprite.rect.topleft
+                position = self.__lerp(previous, current, alpha)
+                if position is not None:
+                    moved.append((sprite, current))
+                    sprite.rect.topleft = position
+
+        ship_center = (ship.center[0], ship.center[1])
+        if self.__ship_center is not None:
+            position = self.__lerp(self.__ship_center, ship_center, alpha)
+            if position is not None:
+                ship.center[0], ship.center[1] = position
+
+        try:
+            yield
+        finally:
+            for sprite, current in moved:
+                sprite.rect.topleft = current
+            ship.center[0], ship.center[1] = ship_center
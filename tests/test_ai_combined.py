@@ -109,5 +109,31 @@ def test_ml_fallback_to_heuristic(monkeypatch):
     assert inp.current_mouse_position is not None
 
 
+class AlwaysFire:
+    def predict(self, X):
+        return [1]
+
+
+def test_models_load_on_first_enable(tmp_path):
+    ai_module = importlib.import_module('src.ai_manager_combined')
+    joblib = pytest.importorskip('joblib')
+    joblib.dump(AlwaysFire(), tmp_path / 'logreg.joblib')
+
+    ai = ai_module.AIManager(models_dir=str(tmp_path))
+    assert ai.model_state == ai_module.ModelState.NOT_LOADED
+    assert not ai.models_ready
+
+    ai.set_enabled(True, auto=True)
+    assert ai.model_state in (ai_module.ModelState.LOADING, ai_module.ModelState.READY)
+    assert ai.wait_for_models(timeout=10)
+    assert isinstance(ai.models['logreg'], AlwaysFire)
+
+    # Without models the heuristic stays in charge.
+    empty = ai_module.AIManager(models_dir=str(tmp_path / 'missing'))
+    empty.set_enabled(True)
+    assert not empty.wait_for_models(timeout=10)
+    assert empty.model_state == ai_module.ModelState.UNAVAILABLE
+
+
 if __name__ == '__main__':
     pytest.main([os.path.abspath(__file__)])
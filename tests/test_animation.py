@@ -0,0 +1,115 @@
+import os
+import sys
+import time
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.display.init()
+
+from src.animation import Animation
+from src.resources.texture_atlas import TextureAtlas
+
+
+class CountingSound:
+    def __init__(self):
+        self.plays = 0
+
+    def play(self):
+        self.plays += 1
+
+
+def make_animation(monkeypatch, frame_count=4, latency=0.05, visibility=True):
+    monkeypatch.setattr(TextureAtlas, 'get_animation_frame', staticmethod(lambda path: pygame.Surface((40, 40))))
+    screen = pygame.Surface((200, 200))
+    return Animation('explosion', frame_count, screen, latency, 2, visibility)
+
+
+def test_play_never_blocks_or_presents(monkeypatch):
+    anim = make_animation(monkeypatch, visibility=False)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('animations must not present or sleep')
+
+    monkeypatch.setattr(pygame.display, 'update', fail)
+    monkeypatch.setattr(pygame.display, 'flip', fail)
+    monkeypatch.setattr(time, 'sleep', fail)
+
+    # A burst of hits: every one gets its own instance.
+    for i in range(25):
+        anim.set_position(i, i)
+        anim.play()
+    assert len(anim.instances) == 25
+
+    anim.update(10)
+    anim.draw()
+    assert all(instance.elapsed == 10 for instance in anim.instances)
+
+
+def test_instances_advance_on_game_time(monkeypatch):
+    anim = make_animation(monkeypatch, frame_count=4, latency=0.05, visibility=False)
+    assert anim.duration == 200
+
+    anim.play()
+    anim.update(120)
+    anim.play()  # starts later, so it runs 120 ms behind the first one
+    anim.update(60)
+    assert [instance.elapsed for instance in anim.instances] == [180, 60]
+
+    anim.update(30)
+    assert [instance.elapsed for instance in anim.instances] == [90]
+
+    anim.update(200)
+    assert anim.instances == []
+
+
+def test_visibility_timer_uses_game_time(monkeypatch):
+    anim = make_animation(monkeypatch, visibility=False)
+    sound = CountingSound()
+
+    anim.set_visibility(True, True, 1, sound)
+    for _ in range(9):
+        anim.update(100)
+    assert anim.animation_visibility
+    assert sound.plays == 0
+
+    anim.update(100)
+    assert not anim.animation_visibility
+    assert sound.plays == 1
+
+    # Hidden animations don't keep counting.
+    anim.update(5000)
+    assert sound.plays == 1
+
+
+def test_unplayed_animation_draws_nothing(monkeypatch):
+    # Like the hit explosion: visible by default, but only ever played as one-shots.
+    anim = make_animation(monkeypatch, visibility=True)
+    anim.set_position(50, 50)
+    for _ in range(20):
+        anim.update(100)
+        assert anim.draw() == []
+
+    anim.play()
+    anim.update(10)
+    assert len(anim.draw()) == 1
+    anim.update(anim.duration)
+    assert anim.draw() == []
+
+
+def test_loop_plays_while_visible(monkeypatch):
+    monkeypatch.setattr(TextureAtlas, 'get_animation_frame', staticmethod(lambda path: pygame.Surface((40, 40))))
+    anim = Animation('shield', 4, pygame.Surface((200, 200)), 0.05, 2, False, loop=True)
+    assert anim.draw() == []
+
+    anim.set_visibility(True)
+    for _ in range(20):
+        anim.update(100)
+        assert len(anim.draw()) == 1
+
+    anim.set_visibility(False)
+    assert anim.draw() == []
@@ -0,0 +1,31 @@
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.display.init()
+
+from src.resources.asset_loader import AssetLoader
+from src.settings import ASSETS_DIR
+
+
+def test_threaded_decode_matches_pygame_load():
+    files = sorted((ASSETS_DIR / "sprites").rglob("*.png"))
+    missing = ASSETS_DIR / "sprites" / "missing.png"
+    loader = AssetLoader(workers=4)
+
+    images = loader.load_images([*files, missing])
+
+    assert list(images) == files
+    for file in files:
+        expected = pygame.image.load(file)
+        assert images[file].get_size() == expected.get_size()
+        assert pygame.image.tobytes(images[file], "RGBA") == pygame.image.tobytes(expected, "RGBA")
+
+    assert loader.files == len(files) + 1
+    assert set(loader.timings) == {"read", "decode"}
@@ -0,0 +1,52 @@
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.display.init()
+
+import pytest
+
+from src.resources.asset_pack import ALIGNMENT, AssetPack
+
+
+def make_surface(size, color, flags=0):
+    surface = pygame.Surface(size, flags)
+    surface.fill(color)
+    surface.set_at((0, 0), (1, 2, 3, 4) if flags else (1, 2, 3))
+    return surface
+
+
+def test_entries_round_trip(tmp_path):
+    pygame.display.set_mode((64, 64))
+    sprite = make_surface((7, 5), (10, 20, 30, 40), pygame.SRCALPHA).convert_alpha()
+    background = make_surface((9, 3), (50, 60, 70))
+    path = tmp_path / 'assets.pack'
+
+    AssetPack.write(path, {'sprite': (sprite, 'BGRA'), 'background': (background, 'RGB')}, {'answer': 42})
+    pack = AssetPack(path)
+
+    assert pack.meta == {'answer': 42}
+    assert 'sprite' in pack and 'missing' not in pack
+    assert all(entry['offset'] % ALIGNMENT == 0 for entry in pack.entries.values())
+
+    loaded_sprite = pack.surface('sprite')
+    loaded_background = pack.surface('background')
+    assert pygame.image.tobytes(loaded_sprite, 'RGBA') == pygame.image.tobytes(sprite, 'RGBA')
+    assert pygame.image.tobytes(loaded_background, 'RGB') == pygame.image.tobytes(background, 'RGB')
+
+    # Atlas pages are wrapped in the layout convert_alpha() gives them.
+    assert loaded_sprite.get_masks() == sprite.get_masks()
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / 'assets.pack'
+    path.write_bytes(b'not a pack, just some bytes')
+
+    with pytest.raises(ValueError):
+        AssetPack(path)
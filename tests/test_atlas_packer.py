@@ -0,0 +1,69 @@
+import os
+import random
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pytest
+
+from src.resources.atlas_packer import PACKERS, ShelfPacker, SkylinePacker
+
+
+def random_sizes(seed, count=120):
+    rng = random.Random(seed)
+    return {f"t{i}.png": (rng.randint(1, 300), rng.randint(1, 300)) for i in range(count)}
+
+
+def assert_valid(result, sizes, max_width, max_height, padding):
+    assert set(result.placements) == set(sizes)
+
+    by_page = {}
+    for name, placement in result.placements.items():
+        width, height = sizes[name]
+        page_width, page_height = result.pages[placement.page]
+        assert placement.x >= 0 and placement.y >= 0
+        assert placement.x + width <= page_width <= max_width
+        assert placement.y + height <= page_height <= max_height
+        by_page.setdefault(placement.page, []).append((placement.x, placement.y, width, height))
+
+    # No two rects (grown by the padding) overlap.
+    for rects in by_page.values():
+        for i, (x1, y1, w1, h1) in enumerate(rects):
+            for x2, y2, w2, h2 in rects[i + 1:]:
+                assert (x1 + w1 + padding <= x2 or x2 + w2 + padding <= x1
+                        or y1 + h1 + padding <= y2 or y2 + h2 + padding <= y1)
+
+
+@pytest.mark.parametrize('name', sorted(PACKERS))
+@pytest.mark.parametrize('seed', range(5))
+def test_packers_place_every_rect_without_overlap(name, seed):
+    sizes = random_sizes(seed)
+    packer = PACKERS[name](1024, 1024, padding=2)
+
+    result = packer.pack(sizes)
+
+    assert_valid(result, sizes, 1024, 1024, 2)
+
+
+@pytest.mark.parametrize('name', sorted(PACKERS))
+def test_pages_split_at_max_size(name):
+    sizes = {f"f{i}.png": (640, 640) for i in range(10)}
+    result = PACKERS[name](2048, 2048).pack(sizes)
+
+    # Three 640px frames per row and per column fit on a 2048px page.
+    assert len(result.pages) == 2
+    assert sorted(p.page for p in result.placements.values()).count(0) == 9
+    assert_valid(result, sizes, 2048, 2048, 2)
+
+
+def test_oversized_rect_gets_its_own_page():
+    sizes = {"small.png": (10, 10), "huge.png": (5000, 20), "tiny.png": (5, 5)}
+    result = SkylinePacker(1024, 1024).pack(sizes)
+
+    huge = result.placements["huge.png"]
+    assert result.pages[huge.page] == (5000, 20)
+    assert all(p.page != huge.page for n, p in result.placements.items() if n != "huge.png")
+
@@ -0,0 +1,69 @@
+import math
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.display.init()
+
+from src import bullet, settings
+from src.bullet import ShipBullet
+from src.resources.rotation_cache import RotationCache
+from src.resources.texture_atlas import TextureAtlas
+
+
+class DummyShip:
+    def __init__(self, x, y, angle):
+        self.rect = pygame.Rect(0, 0, 10, 10)
+        self.rect.center = (x, y)
+        self.center = [float(x), float(y)]
+        self.angle = angle
+
+
+class RecordingScreen:
+    def __init__(self):
+        self.blits = []
+
+    def blit(self, surface, position):
+        self.blits.append((surface, position))
+        return pygame.Rect(position, surface.get_size())
+
+
+def setup_module():
+    pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    TextureAtlas.initialize()
+
+
+def test_bullet_rotates_once_and_draws_the_cached_surface(monkeypatch):
+    cache = RotationCache()
+    lookups = []
+    get = cache.get
+    monkeypatch.setattr(cache, 'get', lambda *args: lookups.append(args) or get(*args))
+    monkeypatch.setattr(bullet, 'rotation_cache', cache)
+
+    shot = ShipBullet(DummyShip(600, 400, math.radians(30)))
+    assert len(lookups) == 1 and cache.misses == 1
+    assert lookups[0][2] == math.degrees(shot.angle)
+
+    rotations = []
+    rotate = pygame.transform.rotate
+    monkeypatch.setattr(pygame.transform, 'rotate', lambda *args: rotations.append(args) or rotate(*args))
+    screen = RecordingScreen()
+    shot.screen = screen
+
+    for _ in range(5):
+        shot.update()
+        drawn = shot.draw()
+        # The cached rotated image, centered on the bullet's rect.
+        assert screen.blits[-1][0] is shot.rotated_image
+        assert drawn.size == shot.rotated_image.get_size()
+        assert abs(drawn.centerx - shot.rect.centerx) <= 1
+        assert abs(drawn.centery - shot.rect.centery) <= 1
+
+    assert rotations == []
+    assert len(lookups) == 1
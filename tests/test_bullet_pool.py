@@ -0,0 +1,84 @@
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.display.init()
+
+from src import entity_store, settings
+from src.bullet import AlienBullet, BulletPool, ShipBullet
+from src.entity_store import EntityGroup
+from src.resources.texture_atlas import TextureAtlas
+
+
+class DummySprite:
+    def __init__(self, x, y, angle=0.0):
+        self.rect = pygame.Rect(0, 0, 10, 10)
+        self.rect.center = (x, y)
+        self.center = [float(x), float(y)]
+        self.angle = angle
+
+
+def setup_module():
+    pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    TextureAtlas.initialize()
+
+
+def test_pooled_bullets_share_one_image():
+    pool = BulletPool(ShipBullet)
+    pool.preallocate(3)
+    ship = DummySprite(600, 400)
+
+    bullets = [pool.acquire(ship) for _ in range(3)]
+
+    assert pool.size == 3
+    assert len({id(bullet.image) for bullet in bullets}) == 1
+    assert all(bullet.rect.size == bullets[0].image.get_size() for bullet in bullets)
+
+
+def test_bullets_return_on_cull_and_hit():
+    pool = BulletPool(ShipBullet)
+    pool.preallocate(4)
+    group = EntityGroup()
+
+    # Two bullets fly off the top, two stay on screen.
+    for y in (20, 20, 400, 400):
+        group.add(pool.acquire(DummySprite(600, y)))
+    assert pool.in_use == pool.high_water == 4
+
+    for _ in range(10):
+        entity_store.move_bullets(group, settings.DELTA_TIME)
+    entity_store.remove_offscreen_bullets(group, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+    assert len(group) == 2
+    assert pool.in_use == 2
+
+    group.sprites()[0].kill()
+    assert pool.in_use == 1
+
+    group.empty()
+    assert pool.in_use == 0
+
+    # Recycled bullets are fired again without allocating.
+    for _ in range(4):
+        group.add(pool.acquire(DummySprite(600, 400)))
+    assert pool.size == 4
+    assert pool.high_water == 4
+
+
+def test_recycled_bullet_is_aimed_again():
+    pool = BulletPool(AlienBullet)
+    ship = DummySprite(600, 700)
+
+    first = pool.acquire(DummySprite(100, 100), ship)
+    first.kill()
+    second = pool.acquire(DummySprite(300, 200), ship)
+
+    fresh = AlienBullet(DummySprite(300, 200), ship)
+    assert second is first
+    assert pool.size == 1
+    assert (second.x, second.y, second.vx, second.vy) == (fresh.x, fresh.y, fresh.vx, fresh.vy)
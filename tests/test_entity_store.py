@@ -0,0 +1,121 @@
+import math
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.display.init()
+
+from pygame.sprite import Group
+
+from src import entity_store, settings
+from src.bullet import ShipBullet
+from src.entity_store import EntityGroup
+
+
+class DummyShip:
+    def __init__(self, x, y, angle):
+        self.rect = pygame.Rect(0, 0, 10, 10)
+        self.rect.center = (x, y)
+        self.center = [float(x), float(y)]
+        self.angle = angle
+
+
+def make_bullets(group):
+    for i in range(40):
+        ship = DummyShip(100 + i * 25, 50 + (i * 37) % 700, i * 0.4)
+        group.add(ShipBullet(ship))
+    return group
+
+
+def test_store_round_trips_sprite_attributes():
+    group = EntityGroup(capacity=1)
+    bullet = ShipBullet(DummyShip(400, 300, 0.5))
+    x, angle = bullet.x, bullet.angle
+
+    group.add(bullet)
+    assert bullet._store is group.store
+    assert bullet.x == x and bullet.angle == angle
+    bullet.x += 3.0
+    assert group.store.x[bullet._slot] == x + 3.0
+
+    bullet.kill()
+    assert bullet._store is None
+    assert bullet.x == x + 3.0
+    assert len(group.store) == 0
+
+
+def test_store_grows_and_reuses_slots():
+    group = make_bullets(EntityGroup(capacity=4))
+    assert len(group.store) == 40
+    assert group.store.capacity >= 40
+
+    first = group.sprites()[0]
+    slot = first._slot
+    first.kill()
+    replacement = ShipBullet(DummyShip(400, 300, 0.0))
+    group.add(replacement)
+    assert replacement._slot == slot
+
+
+def test_bulk_bullet_update_matches_per_sprite_update():
+    plain = make_bullets(Group())
+    bulk = make_bullets(EntityGroup())
+
+    for _ in range(30):
+        for group in (plain, bulk):
+            entity_store.move_bullets(group, settings.DELTA_TIME)
+            entity_store.remove_offscreen_bullets(group, settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+
+    assert [b.rect.topleft for b in plain] == [b.rect.topleft for b in bulk]
+    assert [b.x for b in plain] == [b.x for b in bulk]
+    assert 0 < len(bulk) < 40
+
+
+def test_bullet_velocity_follows_angle():
+    bullet = ShipBullet(DummyShip(400, 300, 0.0))
+    bullet.set_angle_override(math.pi / 2, DummyShip(400, 300, 0.0))
+    assert abs(bullet.vx + settings.BULLET_SPEED_FACTOR) < 1e-9
+    assert abs(bullet.vy) < 1e-9
+
+
+def make_aliens(group, monkeypatch):
+    from src.alien import AlienL1, AlienL2
+    from src.settings import Settings
+
+    monkeypatch.setattr('src.resources.texture_atlas.TextureAtlas.get_sprite_texture',
+                        lambda *a, **k: pygame.Surface((48, 40), pygame.SRCALPHA))
+    ai_settings = Settings()
+    screen = pygame.Surface((ai_settings.screen_width, ai_settings.screen_height))
+    positions = [(-50, 120), (1250, 400), (300, -50), (640, 850), (600, 400), (10, 790)]
+    for i, (x, y) in enumerate(positions):
+        alien = (AlienL2 if i % 2 else AlienL1)(ai_settings, screen)
+        alien.rect.topleft = (x, y)
+        alien.x, alien.y = float(x), float(y)
+        group.add(alien)
+    return ai_settings, group
+
+
+def test_vectorized_steering_matches_reference_update(monkeypatch):
+    from src.alien import steer_aliens
+
+    ai_settings, plain = make_aliens(Group(), monkeypatch)
+    _, bulk = make_aliens(EntityGroup(), monkeypatch)
+    ship = DummyShip(600, 672, 0.0)
+
+    for frame in range(200):
+        ship.rect.center = (600 + (frame * 7) % 300, 672 - frame)
+        steer_aliens(plain, ship, ai_settings)
+        steer_aliens(bulk, ship, ai_settings)
+
+    for reference, alien in zip(plain, bulk):
+        assert reference.rect == alien.rect
+        assert abs(reference.angle - alien.angle) < 1e-6
+        assert abs(reference.x - alien.x) < 1e-6 and abs(reference.y - alien.y) < 1e-6
+        assert abs(reference.vx - alien.vx) < 1e-9 and abs(reference.vy - alien.vy) < 1e-9
+        assert reference.image.get_size() == alien.image.get_size()
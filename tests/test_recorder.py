@@ -0,0 +1,188 @@
+import csv
+import json
+import math
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+
+from src.recorder import Recorder
+import pytest
+
+from src.recording.storage import RECORD_DTYPE, export_csv, read_recording, read_segment, select_segments
+from src.recording.writer_thread import BackgroundWriter, OverflowPolicy
+
+
+class FakeGroup:
+    def __init__(self, sprites):
+        self._sprites = sprites
+
+    def sprites(self):
+        return self._sprites
+
+
+class FakeInput:
+    def get_mouse_cursor_position(self):
+        return (5, 6)
+
+    def is_mouse_button_pressed(self, button):
+        return True
+
+
+def make_world(aliens):
+    stats = SimpleNamespace(score=10, ships_left=2)
+    ship = SimpleNamespace(center=(100.0, 200.0), angle=45.0, moving_left=True)
+    health = SimpleNamespace(current_hearts=3)
+    return stats, ship, FakeGroup(aliens), FakeGroup([]), health, FakeInput()
+
+
+def test_rows_are_written_in_segments(tmp_path):
+    pygame.init()
+    directory = tmp_path / 'recording'
+    recorder = Recorder(directory, echo=False, segment_bytes=4 * RECORD_DTYPE.itemsize, background=False)
+
+    alien = SimpleNamespace(rect=pygame.Rect(0, 0, 20, 20), vx=1.5, vy=-2.0)
+    alien.rect.center = (130, 240)
+    for _ in range(5):
+        recorder.record(*make_world([alien]))
+    recorder.record(*make_world([]))
+
+    # One full segment is on disk, the rest is still buffered.
+    assert len(json.loads((directory / 'manifest.json').read_text())['segments']) == 1
+    recorder.close()
+    assert recorder.rows_written == 6
+
+    rows = read_recording(directory)
+    assert list(rows.dtype.names) == Recorder.DEFAULT_FIELDS
+    assert len(rows) == 6
+    assert rows['score'][0] == 10 and rows['ship_x'][0] == 100 and rows['mouse_fire'][0] == 1
+    assert rows['moving_left'][0] and not rows['moving_right'][0]
+    assert rows['nearest_alien_dx'][0] == 30 and rows['nearest_alien_vy'][0] == -2.0
+    assert math.isnan(rows['nearest_alien_distance'][5])
+
+    # Reopening records a second session.
+    recorder = Recorder(directory, compression='lzma')
+    recorder.record(*make_world([]))
+    recorder.close()
+    assert len(read_recording(directory)) == 7
+
+    # The CSV export matches the format the recorder used to write.
+    csv_path = tmp_path / 'log.csv'
+    assert export_csv(directory, csv_path) == 7
+    with open(csv_path, newline='') as file:
+        exported = list(csv.DictReader(file))
+    assert exported[0]['moving_left'] == 'True' and exported[0]['mouse_fire'] == '1'
+    assert exported[5]['nearest_alien_dx'] == ''
+
+
+def test_csv_backend_and_field_subset(tmp_path):
+    pygame.init()
+    path = tmp_path / 'log.csv'
+    recorder = Recorder(path, fieldnames=['score', 'mouse_fire'])
+    recorder.record(*make_world([]))
+    recorder.close()
+
+    with open(path, newline='') as file:
+        assert list(csv.reader(file)) == [['score', 'mouse_fire'], ['10', '1']]
+
+
+
+def test_segments_are_indexed_per_session(tmp_path):
+    pygame.init()
+    directory = tmp_path / 'recording'
+    for score, compression in ((10, 'gzip'), (500, 'lzma')):
+        recorder = Recorder(directory, segment_bytes=2 * RECORD_DTYPE.itemsize, compression=compression,
+                            background=False)
+        stats, *world = make_world([])
+        for ticks in range(3):
+            stats.score = score + ticks
+            recorder.record(stats, *world)
+        recorder.close()
+
+    manifest = json.loads((directory / 'manifest.json').read_text())
+    first, second = sorted(manifest['sessions'])
+    assert manifest['schema_version'] == 1
+    assert [(segment['session'], segment['rows']) for segment in manifest['segments']] == \
+        [(first, 2), (first, 1), (second, 2), (second, 1)]
+    assert manifest['segments'][2]['file'].endswith('.npy.xz')
+    assert manifest['segments'][0]['stats']['score'] == {'min': 10, 'max': 11, 'mean': 10.5}
+    assert 'nearest_alien_dx' not in manifest['segments'][0]['stats']
+    assert manifest['segments'][0]['first_timestamp_ms'] <= manifest['segments'][0]['last_timestamp_ms']
+
+    assert select_segments(directory, last_sessions=1) == manifest['segments'][2:]
+    assert select_segments(directory, sessions=[first]) == manifest['segments'][:2]
+    high = select_segments(directory, where=lambda segment: segment['stats']['score']['max'] >= 500)
+    assert [read_segment(directory, segment)['score'].tolist() for segment in high] == [[500, 501], [502]]
+
+
+class SlowWriter:
+    """Collects rows, holding the writer thread until `release` is set."""
+
+    def __init__(self):
+        self.rows = []
+        self.release = threading.Event()
+        self.closed = False
+        self.rows_written = 0
+
+    def append(self, values):
+        self.release.wait()
+        self.rows.append(values)
+
+    def close(self):
+        self.closed = True
+
+
+def fill(writer, count):
+    # The writer thread takes the first row and stalls on it; the rest stay queued.
+    writer.append((0,))
+    deadline = time.monotonic() + 5
+    while writer.pending and time.monotonic() < deadline:
+        time.sleep(0.001)
+    for i in range(1, count):
+        writer.append((i,))
+
+
+@pytest.mark.parametrize('policy, kept', [
+    (OverflowPolicy.DROP_OLDEST, [0, 6, 7, 8, 9]),
+    (OverflowPolicy.BLOCK, [0, 1, 2, 3, 4]),
+    (OverflowPolicy.SAMPLE, [0, 1, 2, 6]),
+])
+def test_background_writer_overflow(policy, kept):
+    slow = SlowWriter()
+    writer = BackgroundWriter(slow, capacity=4, policy=policy, block_timeout=0.001, sample_every=4)
+    started = time.perf_counter()
+    fill(writer, 10)
+    assert time.perf_counter() - started < 1
+
+    slow.release.set()
+    writer.close()
+
+    assert [values[0] for values in slow.rows] == kept
+    assert slow.closed
+    assert writer.written == len(kept) and writer.dropped == 10 - len(kept)
+    assert writer.queued == (10 if policy is OverflowPolicy.DROP_OLDEST else len(kept))
+
+    # Rows recorded after closing are counted, not written.
+    writer.append((10,))
+    assert writer.dropped == 11 - len(kept)
+
+
+def test_background_recorder_drains_on_close(tmp_path):
+    pygame.init()
+    directory = tmp_path / 'recording'
+    recorder = Recorder(directory, segment_bytes=3 * RECORD_DTYPE.itemsize, background=True)
+    for _ in range(10):
+        recorder.record(*make_world([]))
+    recorder.close()
+
+    assert recorder.rows_written == 10
+    assert len(read_recording(directory)) == 10
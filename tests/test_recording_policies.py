@@ -0,0 +1,91 @@
+import math
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from src.recording.policies import EventBurst, EveryNth, OnChange, iter_dense_segments, policy_from_description
+from src.recording.storage import RECORD_DTYPE, SegmentWriter, read_manifest
+
+FRAME_MS = 10
+
+
+def row(frame, **fields):
+    values = dict.fromkeys(RECORD_DTYPE.names, 0)
+    values.update(timestamp_ms=frame * FRAME_MS, health=3, ships_left=2, ship_x=frame, nearest_alien_dx=math.nan)
+    values.update(fields)
+    return tuple(values[name] for name in RECORD_DTYPE.names)
+
+
+def run(policy, rows):
+    kept = [kept_row for values in rows for kept_row in policy.select(values)]
+    return np.array(kept, dtype=RECORD_DTYPE)
+
+
+def test_every_nth_keeps_shots_and_densifies():
+    frames = [row(frame, mouse_fire=int(frame == 5)) for frame in range(13)]
+    policy = EveryNth(4)
+    kept = run(policy, frames)
+    assert kept['timestamp_ms'].tolist() == [30, 50, 90]
+
+    dense = policy.densify(kept, FRAME_MS)
+    assert dense['timestamp_ms'].tolist() == list(range(30, 100, 10))
+    assert dense['ship_x'].tolist() == list(range(3, 10))
+    assert dense['mouse_fire'].tolist() == [0, 0, 1, 0, 0, 0, 0]
+    assert np.isnan(dense['nearest_alien_dx']).all()
+
+
+def test_on_change_respects_tolerances():
+    frames = [row(frame, ship_x=frame // 2, health=3 - (frame == 7)) for frame in range(10)]
+    policy = OnChange({'ship_x': 1}, max_interval_ms=1000)
+    kept = run(policy, frames)
+    assert kept['timestamp_ms'].tolist() == [0, 40, 70, 80]
+
+    dense = policy.densify(kept, FRAME_MS)
+    original = np.array(frames, dtype=RECORD_DTYPE)[:9]
+    assert len(dense) == len(original)
+    assert (np.abs(dense['ship_x'] - original['ship_x']) <= 1).all()
+    assert (dense['health'] == original['health']).all()
+
+
+def test_on_change_holds_fire_exactly():
+    # A tolerance on mouse_fire is ignored: its transitions are the training label.
+    frames = [row(frame, ship_x=0, mouse_fire=int(3 <= frame < 6)) for frame in range(10)]
+    policy = OnChange({'mouse_fire': 1}, max_interval_ms=1000)
+    kept = run(policy, frames)
+    assert kept['timestamp_ms'].tolist() == [0, 30, 60]
+
+    dense = policy.densify(kept, FRAME_MS)
+    assert dense['mouse_fire'].tolist() == [0, 0, 0, 1, 1, 1, 0]
+
+
+def test_event_bursts_keep_frames_around_events():
+    frames = [row(frame, mouse_fire=int(frame == 10), health=3 - (frame >= 30)) for frame in range(40)]
+    policy = EventBurst(before=2, after=3)
+    kept = run(policy, frames)
+    assert (kept['timestamp_ms'] // FRAME_MS).tolist() == [8, 9, 10, 11, 12, 13, 28, 29, 30, 31, 32, 33]
+
+    # Frames between bursts are not made up.
+    dense = policy.densify(kept, FRAME_MS)
+    assert (dense['timestamp_ms'] // FRAME_MS).tolist() == [8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 28, 29, 30, 31,
+                                                            32, 33]
+    assert dense['mouse_fire'].sum() == 1
+
+
+def test_sessions_densify_with_their_own_policy(tmp_path):
+    policy = EveryNth(2)
+    writer = SegmentWriter(tmp_path, session_info={'policy': policy.describe(), 'frame_ms': FRAME_MS})
+    for values in (row(frame) for frame in range(9)):
+        for kept in policy.select(values):
+            writer.append(kept)
+    writer.close()
+
+    session = next(iter(read_manifest(tmp_path)['sessions'].values()))
+    assert policy_from_description(session['policy']).describe() == {'name': 'every_nth', 'n': 2}
+    (dense,) = iter_dense_segments(tmp_path)
+    assert dense['ship_x'].tolist() == list(range(1, 8))
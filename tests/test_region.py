@@ -0,0 +1,73 @@
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.display.init()
+
+from src.region import Region, RegionManager, init_regions
+from src.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+def make_screen():
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def test_only_first_region_is_loaded_at_start():
+    region_manager = init_regions(make_screen())
+
+    assert [region.loaded for region in region_manager.regions] == [True] + [False] * (len(region_manager.regions) - 1)
+
+
+def test_next_region_is_prefetched_near_its_score():
+    region_manager = init_regions(make_screen())
+    second = region_manager.regions[1]
+
+    region_manager.step(second.min_score - region_manager.prefetch_margin - 1, 1.0)
+    assert not second.loaded
+    assert second.pending is None
+
+    region_manager.step(second.min_score - region_manager.prefetch_margin, 1.0)
+    # Decoded on the worker, without touching the lazily loading `background`.
+    assert second.pending is not None
+    assert second.pending.result(timeout=10).get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+    assert not second.loaded
+
+    assert second.background.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+    assert second.loaded
+    assert second.pending is None
+
+
+def test_old_regions_are_evicted_over_budget():
+    screen = make_screen()
+    size = screen.get_size()
+    regions = [Region(f"Starfield Stage - {i}", f"starfield/{i}.png", (i - 1) * 100, size) for i in range(1, 6)]
+    region_manager = RegionManager(size, *regions, memory_budget=2 * SCREEN_WIDTH * SCREEN_HEIGHT * 4)
+
+    for index, region in enumerate(regions):
+        # A new region is entered once the fade into the previous one is over.
+        for _ in range(1000):
+            region_manager.step(region.min_score, 10.0)
+            # Backgrounds on screen (fading or scrolling out) are never unloaded, so they stay counted.
+            assert all(any(region.loaded and region.background is background for region in regions)
+                       for background in region_manager.backgrounds)
+            if region_manager.current_region_index == index:
+                break
+        assert region_manager.current_region_index == index
+
+    # The last fade ends and the old backgrounds scroll out.
+    for _ in range(500):
+        region_manager.step(regions[-1].min_score, 10.0)
+
+    assert regions[-1].loaded
+    assert sum(region.loaded for region in regions) == 2
+    assert region_manager.resident_bytes() <= region_manager.memory_budget
+
+    # Going back to the start loads the first region again.
+    region_manager.reset()
+    assert regions[0].loaded
@@ -0,0 +1,90 @@
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.display.init()
+
+from src.region import Region, RegionManager
+from src.renderer import BackgroundMode, Renderer, RenderMode
+from src.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+class Presents:
+    def __init__(self, monkeypatch):
+        self.flips = 0
+        self.updates = []
+        monkeypatch.setattr(pygame.display, 'flip', self.flip)
+        monkeypatch.setattr(pygame.display, 'update', self.update)
+
+    def flip(self):
+        self.flips += 1
+
+    def update(self, rects=None):
+        self.updates.append(list(rects))
+
+
+def make_world():
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    size = screen.get_size()
+    region_manager = RegionManager(size, Region("Starfield Stage - 1", "starfield/1.png", 0, size))
+    return screen, region_manager
+
+
+def draw_frame(renderer, region_manager, rect):
+    region_manager.step(0, 1.0)
+    renderer.draw_background(region_manager)
+    renderer.mark(pygame.draw.rect(renderer.screen, (255, 0, 0), rect))
+    renderer.present()
+
+
+def test_full_mode_flips_every_frame(monkeypatch):
+    presents = Presents(monkeypatch)
+    screen, region_manager = make_world()
+    renderer = Renderer(screen, RenderMode.FULL, BackgroundMode.FROZEN)
+
+    for i in range(5):
+        draw_frame(renderer, region_manager, pygame.Rect(10 * i, 10, 20, 20))
+
+    assert presents.flips == 5
+    assert presents.updates == []
+
+
+def test_dirty_mode_presents_previous_and_current_rects(monkeypatch):
+    presents = Presents(monkeypatch)
+    screen, region_manager = make_world()
+    renderer = Renderer(screen, RenderMode.DIRTY, BackgroundMode.FROZEN)
+
+    draw_frame(renderer, region_manager, pygame.Rect(10, 10, 20, 20))
+    draw_frame(renderer, region_manager, pygame.Rect(40, 10, 20, 20))
+    draw_frame(renderer, region_manager, pygame.Rect(70, 10, 20, 20))
+
+    # The first frame has to show the background.
+    assert presents.flips == 1
+    assert presents.updates == [
+        [pygame.Rect(10, 10, 20, 20), pygame.Rect(40, 10, 20, 20)],
+        [pygame.Rect(40, 10, 20, 20), pygame.Rect(70, 10, 20, 20)],
+    ]
+
+    # Last frame's square was erased with the background.
+    assert screen.get_at((45, 15)) != pygame.Color(255, 0, 0)
+    assert screen.get_at((75, 15)) == pygame.Color(255, 0, 0)
+
+
+def test_quantized_background_redraws_after_scroll_step(monkeypatch):
+    presents = Presents(monkeypatch)
+    screen, region_manager = make_world()
+    renderer = Renderer(screen, RenderMode.DIRTY, BackgroundMode.QUANTIZED, scroll_step=8)
+
+    # The background scrolls 0.7px per unit of dt.
+    for _ in range(24):
+        draw_frame(renderer, region_manager, pygame.Rect(10, 10, 20, 20))
+
+    # First frame, then a full redraw every 12 frames (8.4px).
+    assert presents.flips == 2
+    assert len(presents.updates) == 22
@@ -0,0 +1,73 @@
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+
+from src.resources.rotation_cache import RotationCache
+
+
+def make_texture():
+    return pygame.Surface((20, 10), pygame.SRCALPHA)
+
+
+def test_angles_in_a_bucket_share_a_surface():
+    cache = RotationCache(bucket_degrees=5, max_bytes=10**7)
+    texture = make_texture()
+
+    first = cache.get("ship", texture, 10)
+    assert cache.get("ship", texture, 11.9) is first
+    assert cache.get("ship", texture, 8.1) is first
+    # Angles wrap around the circle.
+    assert cache.get("ship", texture, 370) is first
+
+    assert cache.get("ship", texture, 13) is not first
+    assert cache.get("other", texture, 10) is not first
+    assert len(cache) == 3
+
+    surface, offset = first
+    assert offset == (-(surface.get_width() // 2), -(surface.get_height() // 2))
+
+
+def test_least_recently_used_is_evicted_over_the_cap():
+    texture = make_texture()
+    # 90 degree rotations of a 20x10 texture are all 200 pixels of 4 bytes.
+    cache = RotationCache(bucket_degrees=90, max_bytes=3 * 800)
+
+    zero = cache.get("ship", texture, 0)
+    cache.get("ship", texture, 90)
+    cache.get("ship", texture, 180)
+    assert cache.bytes == 3 * 800
+
+    # Using 0 again makes 90 the least recently used one.
+    assert cache.get("ship", texture, 0) is zero
+    cache.get("ship", texture, 270)
+
+    assert len(cache) == 3
+    assert cache.bytes <= cache.max_bytes
+    misses = cache.misses
+    assert cache.get("ship", texture, 0) is zero
+    cache.get("ship", texture, 180)
+    assert cache.misses == misses
+    cache.get("ship", texture, 90)
+    assert cache.misses == misses + 1
+
+
+def test_hits_and_misses_are_counted():
+    cache = RotationCache(bucket_degrees=2, max_bytes=10**7)
+    texture = make_texture()
+    assert cache.hit_rate() == 0.0
+
+    for angle in (0, 0.5, 44, 44.4, -0.4, 90):
+        cache.get("ship", texture, angle)
+
+    assert (cache.misses, cache.hits) == (3, 3)
+    assert cache.hit_rate() == 0.5
+
+    cache.clear()
+    assert len(cache) == 0 and cache.bytes == 0
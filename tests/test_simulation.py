@@ -0,0 +1,43 @@
+import os
+import random
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Headless: no window, no audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+pygame.init()
+
+from src.simulation import Simulation
+
+
+def test_step_advances_fixed_timestep():
+    # Spawn positions are random; an alien spawning next to the ship could hit it and clear the field.
+    random.seed(1)
+    sim = Simulation()
+    sim.reset()
+
+    state = sim.step(120)
+
+    assert state.frame == 120
+    assert abs(state.time_ms - 1000.0) < 1e-6
+    assert state.game_active
+    # An alien spawns on the very first spawn tick.
+    assert state.aliens + state.score > 0
+
+
+def test_inactive_game_does_not_move_ship():
+    sim = Simulation()
+    before = sim.state().ship_position
+
+    state = sim.step(30)
+
+    assert not state.game_active
+    assert state.ship_position == before
+    assert state.bullets == 0 and state.alien_bullets == 0
@@ -0,0 +1,122 @@
+import math
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.display.init()
+
+import numpy as np
+from pygame.sprite import Group, Sprite
+
+from src import settings
+from src.bullet import ShipBullet
+from src.entity_store import (TYPE_ALIEN_L1, TYPE_HEART, TYPE_SHIP, TYPE_SHIP_BULLET, EntityGroup, StoreBacked,
+                              StoreField)
+from src.recording.snapshots import SnapshotRecorder, SnapshotWriter, capture, iter_frames, iter_snapshot_segments
+from src.recording.storage import read_manifest
+
+
+class DummyShip:
+    type_id = TYPE_SHIP
+
+    def __init__(self, x, y, angle):
+        self.rect = pygame.Rect(0, 0, 10, 10)
+        self.rect.center = (x, y)
+        self.center = [float(x), float(y)]
+        self.angle = angle
+        self.moving_left = self.moving_up = False
+        self.moving_right = self.moving_down = True
+
+
+class DummyAlien(StoreBacked, Sprite):
+    type_id = TYPE_ALIEN_L1
+    x = StoreField()
+    y = StoreField()
+    vx = StoreField()
+    vy = StoreField()
+    angle = StoreField()
+
+    def __init__(self, x, y):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, 20, 10)
+        self.x, self.y, self.vx, self.vy, self.angle = float(x), float(y), 1.5, -2.0, 90.0
+
+
+class DummyHeart(Sprite):
+    type_id = TYPE_HEART
+    vy = 4.0
+
+    def __init__(self, x, y):
+        super().__init__()
+        self.rect = pygame.Rect(0, 0, 25, 25)
+        self.rect.center = (x, y)
+
+
+def test_capture_reads_every_entity():
+    ship = DummyShip(400, 300, 0.5)
+    bullets = EntityGroup(ShipBullet(ship), ShipBullet(ship))
+    aliens = EntityGroup(DummyAlien(100, 50))
+    hearts = Group(DummyHeart(30, 40))
+
+    entities = capture(ship, (bullets, aliens, hearts, Group()))
+
+    assert entities['type'].tolist() == [TYPE_SHIP, TYPE_SHIP_BULLET, TYPE_SHIP_BULLET, TYPE_ALIEN_L1, TYPE_HEART]
+    ship_row, bullet_row, _, alien_row, heart_row = entities.tolist()
+    assert ship_row[1:] == (400, 300, settings.SHIP_SPEED_FACTOR_X, settings.SHIP_SPEED_FACTOR_Y, np.float32(0.5))
+    bullet = bullets.sprites()[0]
+    assert np.allclose(bullet_row[1:], (bullet.rect.centerx, bullet.rect.centery, bullet.vx, bullet.vy, 0.5),
+                       atol=0.5)
+    assert alien_row[1:] == (110, 55, 1.5, -2.0, np.float32(math.pi / 2))
+    assert heart_row[1:] == (30, 40, 0, 4.0, 0)
+
+
+def test_capture_uses_the_rect_not_the_stored_position():
+    # Like a cargo alien: the rect is placed (and moved) on its own, away from the spawn x/y.
+    cargo = DummyAlien(909, 428)
+    cargo.rect.topleft = (398, 920)
+    aliens = EntityGroup(cargo)
+    cargo.rect.y -= 3
+
+    entities = capture(None, (aliens,))
+
+    assert entities[['x', 'y']].tolist() == [(408, 922)]
+
+
+def test_frames_round_trip_through_segments(tmp_path):
+    frames = [(ticks * 8, capture(DummyShip(ticks, 0, 0), [Group(DummyHeart(0, 0)) for _ in range(ticks % 3)]))
+              for ticks in range(10)]
+    # Segments of at most 5 entities: frames are never split across segments.
+    writer = SnapshotWriter(tmp_path, segment_bytes=5 * 21, compression='lzma')
+    for frame in frames:
+        writer.append(frame)
+    writer.close()
+
+    manifest = read_manifest(tmp_path)
+    assert sum(segment['rows'] for segment in manifest['segments']) == 10
+    assert all(segment['entities'] <= 5 for segment in manifest['segments'])
+
+    read = list(iter_frames(tmp_path))
+    assert [timestamp for timestamp, _ in read] == [timestamp for timestamp, _ in frames]
+    for (_, entities), (_, expected) in zip(read, frames):
+        assert np.array_equal(entities, expected)
+
+    first = next(iter_snapshot_segments(tmp_path))
+    assert np.array_equal(first.frame(1), frames[1][1])
+
+
+def test_recorder_writes_in_the_background(tmp_path):
+    pygame.init()
+    recorder = SnapshotRecorder(tmp_path, background=True)
+    ship = DummyShip(10, 20, 0)
+    for _ in range(5):
+        recorder.record(ship, (EntityGroup(DummyAlien(0, 0)),))
+    recorder.close()
+
+    assert recorder.frames_written == 5
+    assert [len(entities) for _, entities in iter_frames(tmp_path)] == [2] * 5
@@ -0,0 +1,55 @@
+import os
+import sys
+import threading
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+import pygame
+
+from src import settings
+from src.resources.sound_bank import SoundBank
+
+
+def make_bank(enabled=True):
+    # The missing sound comes first: the ones after it must still load.
+    return SoundBank({
+        "missing": settings.SOUNDS_DIR / "missing.wav",
+        "damage": settings.SOUNDS_DIR / "damage.wav",
+    }, enabled)
+
+
+def test_importing_game_functions_touches_no_audio():
+    import src.game_functions as gf
+
+    assert not gf.sounds.ready("fire")
+    # Playing before the sounds are decoded is a no-op.
+    gf.sound_fire.play()
+
+
+def test_sounds_decode_in_the_background(monkeypatch):
+    errors = []
+    monkeypatch.setattr(threading, 'excepthook', errors.append)
+    bank = make_bank()
+    damage = bank.sound("damage")
+
+    bank.load()
+    assert bank.wait(timeout=10)
+
+    assert errors == []
+    assert bank.ready("damage")
+    assert not bank.ready("missing")
+    damage.play()
+
+
+def test_disabled_bank_never_loads():
+    bank = make_bank(enabled=False)
+
+    bank.load()
+
+    assert bank.wait(timeout=0)
+    assert not bank.ready("damage")
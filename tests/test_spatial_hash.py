@@ -0,0 +1,89 @@
+import os
+import random
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pygame
+from pygame.sprite import Group, Sprite
+
+from src import settings, spatial_hash
+
+
+class Box(Sprite):
+    def __init__(self, ident, rect):
+        super().__init__()
+        self.ident = ident
+        self.rect = pygame.Rect(rect)
+
+
+def random_rects(rng, count):
+    rects = []
+    for _ in range(count):
+        w, h = rng.randint(0, 90), rng.randint(0, 90)
+        rects.append((rng.randint(-100, 1250), rng.randint(-100, 850), w, h))
+    return rects
+
+
+def build(rects_a, rects_b):
+    a = Group(*[Box(i, r) for i, r in enumerate(rects_a)])
+    b = Group(*[Box(i, r) for i, r in enumerate(rects_b)])
+    return a, b
+
+
+def as_ids(result):
+    return [(sprite.ident, [hit.ident for hit in hits]) for sprite, hits in result.items()]
+
+
+def test_groupcollide_matches_pygame():
+    rng = random.Random(1234)
+    for trial in range(40):
+        rects_a = random_rects(rng, rng.randint(0, 60))
+        rects_b = random_rects(rng, rng.randint(0, 60))
+        dokilla, dokillb = bool(trial & 1), bool(trial & 2)
+
+        ref_a, ref_b = build(rects_a, rects_b)
+        hash_a, hash_b = build(rects_a, rects_b)
+        expected = pygame.sprite.groupcollide(ref_a, ref_b, dokilla, dokillb)
+        actual = spatial_hash.grid_groupcollide(hash_a, hash_b, dokilla, dokillb)
+
+        assert as_ids(actual) == as_ids(expected)
+        assert [s.ident for s in hash_a] == [s.ident for s in ref_a]
+        assert [s.ident for s in hash_b] == [s.ident for s in ref_b]
+
+
+def test_incremental_updates_track_moves_and_removals():
+    rng = random.Random(99)
+    group = Group(*[Box(i, r) for i, r in enumerate(random_rects(rng, 80))])
+    probes = [Box(-1, r) for r in random_rects(rng, 30)]
+
+    for _ in range(25):
+        for sprite in group.sprites():
+            sprite.rect.move_ip(rng.randint(-40, 40), rng.randint(-40, 40))
+            if rng.random() < 0.05:
+                sprite.kill()
+        group.add(Box(1000 + rng.randint(0, 10**6), random_rects(rng, 1)[0]))
+
+        grid = spatial_hash.grid_for(group)
+        for probe in probes:
+            assert grid.query(probe.rect) == pygame.sprite.spritecollide(probe, group, False)
+
+
+def test_groupcollide_uses_the_grid_only_for_large_groups(monkeypatch):
+    rng = random.Random(7)
+    # The game's counts: at most BULLETS_ALLOWED bullets against hundreds of aliens.
+    bullets, aliens = build(random_rects(rng, settings.BULLETS_ALLOWED), random_rects(rng, 300))
+    large_a, large_b = build(random_rects(rng, 200), random_rects(rng, 200))
+
+    synced = []
+    sync = spatial_hash.SpatialHash.sync
+    monkeypatch.setattr(spatial_hash.SpatialHash, 'sync', lambda grid, group: synced.append(group) or sync(grid, group))
+
+    spatial_hash.groupcollide(bullets, aliens, False, False)
+    assert synced == []
+
+    spatial_hash.groupcollide(large_a, large_b, False, False)
+    assert synced == [large_b]
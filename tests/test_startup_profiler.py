@@ -0,0 +1,44 @@
+import builtins
+import json
+import os
+import sys
+import time
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from src.startup_profiler import StartupProfiler
+
+
+def test_phases_and_first_imports_are_timed(tmp_path):
+    original_import = builtins.__import__
+    sys.modules.pop('colorsys', None)
+    profiler = StartupProfiler(min_import_ms=0)
+
+    with profiler.phase('before start'):
+        pass
+    profiler.start()
+    with profiler.phase('slow'):
+        time.sleep(0.02)
+    with profiler.phase('fast'):
+        import colorsys  # noqa: F401
+        import json  # noqa: F401  (already imported, so not timed)
+    profiler.finish()
+
+    assert builtins.__import__ is original_import
+    assert [phase.name for phase in profiler.phases] == ['slow', 'fast']
+    assert profiler.phases[0].duration_ms >= 20
+    assert [timing.name for timing in profiler.imports] == ['colorsys']
+    assert profiler.total_ms >= profiler.phases[0].duration_ms
+
+    report = profiler.report()
+    assert report.index('slow') < report.index('fast')
+    assert 'colorsys' in report
+
+    path = tmp_path / 'startup.json'
+    profiler.write_json(path)
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert [phase['name'] for phase in data['phases']] == ['slow', 'fast']
+    assert data['imports'][0]['name'] == 'colorsys'
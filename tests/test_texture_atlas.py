@@ -0,0 +1,98 @@
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.display.init()
+
+from src import settings
+from src.resources.texture_atlas import TextureAtlas
+
+
+def setup_module():
+    pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    TextureAtlas.initialize()
+
+
+def test_lookups_resolve_once():
+    TextureAtlas.preload(["misc/crosshair.png"], ["explosion4/f1.png"])
+    hits, misses = TextureAtlas.hits, TextureAtlas.misses
+
+    first = TextureAtlas.get_sprite_texture("misc/crosshair.png")
+    second = TextureAtlas.get_sprite_texture("misc/crosshair.png")
+    frame = TextureAtlas.get_animation_frame("explosion4/f1.png")
+
+    assert first is second
+    assert frame is TextureAtlas.get_animation_handle("explosion4/f1.png").surface
+    assert (TextureAtlas.hits - hits, TextureAtlas.misses - misses) == (4, 0)
+
+
+def test_handle_describes_the_texture():
+    handle = TextureAtlas.get_sprite_handle("ship/ship")
+
+    assert handle is TextureAtlas.get_sprite_handle("ship/ship.png")
+    assert handle.path == "ship/ship.png"
+    assert handle.atlas == "sprites"
+    assert handle.size == handle.surface.get_size()
+    assert handle.surface.get_abs_offset() == handle.rect[:2]
+
+
+def test_missing_texture():
+    assert TextureAtlas.get_sprite_texture("nope/missing.png") is None
+    assert TextureAtlas.get_sprite_handle("nope/missing.png") is None
+
+
+def cache_in(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, 'TEXTURE_ATLAS_CACHE', True)
+    monkeypatch.setattr(TextureAtlas, '_TextureAtlas__cache_folder', tmp_path)
+    return TextureAtlas._TextureAtlas__read_cache, TextureAtlas._TextureAtlas__write_cache
+
+
+def test_atlas_cache_round_trip(monkeypatch, tmp_path):
+    read_cache, write_cache = cache_in(monkeypatch, tmp_path)
+    key, pages, mappings = TextureAtlas.pack_sections()['sprites']
+
+    write_cache('sprites', key, pages, mappings)
+    cached_pages, cached_mappings = read_cache('sprites', key)
+
+    assert cached_mappings == mappings
+    assert [page.get_size() for page in cached_pages] == [page.get_size() for page in pages]
+    for cached, page in zip(cached_pages, pages):
+        assert pygame.image.tobytes(cached, 'RGBA') == pygame.image.tobytes(page, 'RGBA')
+
+
+def test_stale_atlas_cache_is_ignored(monkeypatch, tmp_path):
+    read_cache, write_cache = cache_in(monkeypatch, tmp_path)
+    key, pages, mappings = TextureAtlas.pack_sections()['sprites']
+
+    write_cache('sprites', key, pages, mappings)
+
+    assert read_cache('sprites', 'another key') is None
+    assert read_cache('animations', key) is None
+
+
+def test_corrupt_atlas_cache_falls_back_to_decoding(monkeypatch, tmp_path):
+    read_cache, write_cache = cache_in(monkeypatch, tmp_path)
+    key, pages, mappings = TextureAtlas.pack_sections()['sprites']
+
+    # Truncated pixels
+    write_cache('sprites', key, pages, mappings)
+    pixels = tmp_path / 'sprites.0.rgba'
+    pixels.write_bytes(pixels.read_bytes()[:1000])
+    assert read_cache('sprites', key) is None
+
+    # A missing page
+    write_cache('sprites', key, pages, mappings)
+    pixels.unlink()
+    assert read_cache('sprites', key) is None
+
+    # A truncated header
+    write_cache('sprites', key, pages, mappings)
+    header = tmp_path / 'sprites.json'
+    header.write_text(header.read_text(encoding='utf-8')[:50], encoding='utf-8')
+    assert read_cache('sprites', key) is None
@@ -0,0 +1,64 @@
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.display.init()
+
+from src import settings
+from src.resources.texture_atlas import TextureAtlas
+from src.resources.texture_cache import TextureVariantCache
+
+
+def setup_module():
+    pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    TextureAtlas.initialize()
+
+
+def test_variants_are_built_once():
+    cache = TextureVariantCache()
+
+    first = cache.get("heart/full_heart.png", (20, 20))
+    second = cache.get("heart/full_heart.png", (20.5, 20.9))
+    rotated = cache.get("alien/alien_l2.png", (60, 57), rotation=180)
+
+    assert first is second
+    assert first.get_size() == (20, 20)
+    assert rotated.get_size() == (60, 57)
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert cache.hit_rate() == 1 / 3
+    assert cache.get("heart/missing.png", (20, 20)) is None
+
+
+def test_alpha_leaves_the_atlas_untouched():
+    cache = TextureVariantCache()
+
+    faded = cache.get("heart/full_heart.png", alpha=100)
+
+    assert faded.get_alpha() == 100
+    assert faded is not TextureAtlas.get_sprite_texture("heart/full_heart.png")
+    assert TextureAtlas.get_sprite_texture("heart/full_heart.png").get_alpha() != 100
+
+
+def test_least_recently_used_are_evicted_over_budget():
+    heart = TextureAtlas.get_sprite_texture("heart/full_heart.png")
+    cache = TextureVariantCache(max_bytes=2 * 20 * 20 * heart.get_bytesize())
+
+    cache.get("heart/full_heart.png", (20, 20), alpha=50)
+    cache.get("heart/full_heart.png", (20, 20), alpha=100)
+    cache.get("heart/full_heart.png", (20, 20), alpha=50)
+    cache.get("heart/full_heart.png", (20, 20), alpha=150)
+
+    assert len(cache) == 2
+    assert cache.bytes <= cache.max_bytes
+
+    misses = cache.misses
+    cache.get("heart/full_heart.png", (20, 20), alpha=50)
+    assert cache.misses == misses
+    cache.get("heart/full_heart.png", (20, 20), alpha=100)
+    assert cache.misses == misses + 1
@@ -0,0 +1,78 @@
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+pygame.display.init()
+
+from pygame.sprite import Group, Sprite
+
+from src.timestep import FixedTimestep, RenderInterpolator
+
+
+class DummyShip:
+    def __init__(self):
+        self.center = [100.0, 100.0]
+
+
+def make_sprite(x, y):
+    sprite = Sprite()
+    sprite.rect = pygame.Rect(x, y, 10, 10)
+    return sprite
+
+
+def test_slow_frames_run_more_steps():
+    fast = FixedTimestep(step_ms=1000 / 120)
+    slow = FixedTimestep(step_ms=1000 / 120)
+
+    fast_steps = sum(fast.advance(1000 / 120) for _ in range(120))
+    slow_steps = sum(slow.advance(1000 / 40) for _ in range(40))
+
+    # One second of real time is the same amount of game time at any frame rate.
+    assert abs(fast_steps - 120) <= 1
+    assert abs(slow_steps - 120) <= 1
+
+
+def test_remainder_carries_over():
+    timestep = FixedTimestep(step_ms=10, max_steps=8)
+
+    assert timestep.advance(15) == 1
+    assert timestep.alpha == 0.5
+    assert timestep.advance(4) == 0
+    assert timestep.advance(1) == 1
+    assert timestep.alpha == 0.0
+
+
+def test_long_stall_is_capped():
+    timestep = FixedTimestep(step_ms=10, max_steps=8)
+
+    assert timestep.advance(1000) == 8
+    assert timestep.dropped_steps == 92
+
+
+def test_interpolation_is_undone_after_drawing():
+    interpolator = RenderInterpolator(max_distance=32)
+    ship = DummyShip()
+    moving, placed = make_sprite(0, 0), make_sprite(0, 0)
+    group = Group(moving, placed)
+
+    interpolator.snapshot(ship, [group])
+    moving.rect.topleft = (10, 20)
+    placed.rect.topleft = (500, 0)
+    ship.center = [110.0, 100.0]
+    added = make_sprite(300, 300)
+    group.add(added)
+
+    with interpolator.apply(0.5, ship, [group]):
+        assert moving.rect.topleft == (5, 10)
+        assert placed.rect.topleft == (500, 0)
+        assert added.rect.topleft == (300, 300)
+        assert ship.center == [105.0, 100.0]
+
+    assert moving.rect.topleft == (10, 20)
+    assert ship.center == [110.0, 100.0]
@@ -0,0 +1,93 @@
+import os
+import sys
+
+# Ensure repo root is on path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Headless: no window, no audio device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+pygame.init()
+
+import src.game_functions as gf
+from src.alien import AlienL1
+from src.simulation import Simulation
+
+
+class StubRenderer:
+    """Collects the marked rects instead of presenting them."""
+
+    def __init__(self):
+        self.rects = []
+
+    def draw_background(self, region_manager):
+        pass
+
+    def mark(self, *rects):
+        self.rects.extend(rect for rect in rects if rect is not None)
+
+    def present(self):
+        pass
+
+
+class StubButton:
+    def update(self):
+        return None
+
+
+class StubAnimation:
+    def __init__(self):
+        self.updates = []
+
+    def set_position(self, x, y):
+        pass
+
+    def update(self, dt):
+        self.updates.append(dt)
+
+    def draw(self):
+        return []
+
+
+def draw(sim, **kwargs):
+    gf.update_screen(
+        sim.region_manager, sim.ai_settings, sim.screen, sim.stats, sim.sb, sim.ship, sim.aliens, sim.bullets,
+        StubButton(), StubButton(), StubButton(), sim.cargoes, sim.alien_bullets, sim.health, sim.hearts,
+        sim.shields, **kwargs,
+    )
+
+
+def test_animations_advance_by_simulated_time(monkeypatch):
+    sim = Simulation()
+    animations = [StubAnimation(), StubAnimation()]
+    monkeypatch.setattr(gf, 'renderer', StubRenderer())
+    monkeypatch.setattr(gf, 'animations', animations)
+
+    # A frame that ran no step, then one that ran three.
+    draw(sim, elapsed_ms=0)
+    draw(sim, elapsed_ms=3 * sim.frame_ms)
+
+    assert animations[0].updates == [0, 3 * sim.frame_ms]
+    assert animations[1].updates == [0, 3 * sim.frame_ms]
+
+
+def test_marks_the_rotated_alien_images(monkeypatch):
+    sim = Simulation()
+    renderer = StubRenderer()
+    monkeypatch.setattr(gf, 'renderer', renderer)
+    monkeypatch.setattr(gf, 'animations', [])
+
+    alien = AlienL1(sim.ai_settings, sim.screen)
+    alien.rect.topleft = (300, 200)
+    alien.image = pygame.transform.rotate(alien.image, 45)
+    sim.aliens.add(alien)
+    assert alien.image.get_width() > alien.rect.width
+
+    draw(sim)
+
+    drawn = pygame.Rect(alien.rect.topleft, alien.image.get_size())
+    assert any(rect.contains(drawn) for rect in renderer.rects)
@@ -0,0 +1,63 @@
+"""Bake the texture atlases and the backgrounds into the asset pack.
+
+The sprites and animation frames are packed into atlas pages exactly like `TextureAtlas` does at startup, and
+every background is scaled to the screen size like `Region` does; the raw pixels of both are written to
+`settings.ASSET_PACK` (see `src/resources/asset_pack.py` for the format). The game then maps that file instead
+of decoding PNGs. Run it again after changing any image; a stale pack is ignored (per atlas / backgrounds) and
+the game falls back to the PNGs.
+
+Usage: python tools/build_asset_pack.py [--output PATH]
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from src import settings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--output', type=str, default=str(settings.ASSET_PACK))
+    args = parser.parse_args()
+
+    # Build from the PNGs (or the atlas cache), never from the pack being replaced.
+    settings.ASSET_PACK_ENABLED = False
+
+    from src.region import DIR as BACKGROUND_DIR, background_fingerprint
+    from src.resources.asset_pack import AssetPack
+    from src.resources.texture_atlas import TextureAtlas
+
+    pygame.display.set_mode((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    TextureAtlas.initialize()
+
+    surfaces: dict[str, tuple[pygame.Surface, str]] = {}
+    meta: dict = {}
+
+    # Atlas pages in the byte order of convert_alpha() surfaces, so they are used as they are.
+    for name, (key, pages, mappings) in TextureAtlas.pack_sections().items():
+        page_names = []
+        for index, page in enumerate(pages):
+            page_names.append(f"{name}/{index}")
+            surfaces[page_names[-1]] = (page, "BGRA")
+        meta[name] = {"key": key, "pages": page_names, "mappings": mappings}
+
+    size = (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+    for file in sorted(BACKGROUND_DIR.rglob("*.png")):
+        background = pygame.transform.scale(pygame.image.load(file), size)
+        surfaces[f"background/{file.relative_to(BACKGROUND_DIR).as_posix()}"] = (background, "RGB")
+    meta["backgrounds"] = {"key": background_fingerprint(size)}
+
+    AssetPack.write(args.output, surfaces, meta)
+    print(f"Wrote {len(surfaces)} entries to {args.output} ({Path(args.output).stat().st_size / 2 ** 20:.1f} MiB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""Export a gameplay recording (see src/recording/storage.py), or some of its sessions, as CSV.
+
+Usage: python tools/export_recording.py [--recording DIR] [--output CSV] [--sessions ID ...] [--last-sessions N]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src import settings
+from src.recording.storage import export_csv, select_segments
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--recording', type=str, default=str(settings.RECORDING_PATH))
+    parser.add_argument('--output', type=str, default=str(settings.BASE_DIR / "data" / "gameplay_log.csv"))
+    parser.add_argument('--sessions', nargs='+')
+    parser.add_argument('--last-sessions', type=int)
+    args = parser.parse_args()
+
+    segments = select_segments(args.recording, args.sessions, args.last_sessions)
+    rows = export_csv(args.recording, args.output, segments)
+    print(f"Wrote {rows} rows to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,8 @@
 """Train simple imitation models on recorded gameplay data.
 
-This script expects `data/gameplay_log.csv` to exist and will train models
-to predict `mouse_fire` (binary) from low-dim features.
+This script expects a recording (`data/recording/`, written by the game's
+recorder) or a CSV log to exist and will train models to predict
+`mouse_fire` (binary) from low-dim features.
 
 Outputs:
  - prints classification metrics
@@ -9,6 +10,7 @@ Outputs:
 """
 from pathlib import Path
 import argparse
+import sys
 import joblib
 import numpy as np
 import pandas as pd
@@ -22,30 +24,64 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import classification_report, confusion_matrix, roc_auc_score
 
 
-DATA_PATH = Path(__file__).parent.parent / "data" / "gameplay_log.csv"
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.recording.policies import iter_dense_segments
+from src.recording.storage import iter_segments, select_segments
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "recording"
 MODELS_DIR = Path(__file__).parent.parent / "models"
 MODELS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def load_and_preprocess(path: Path):
+NUMERIC_COLS = [
+    'score', 'ships_left', 'health', 'ship_x', 'ship_y', 'ship_angle',
+    'moving_left', 'moving_right', 'moving_up', 'moving_down',
+    'mouse_x', 'mouse_y', 'bullets_count', 'aliens_count',
+    'nearest_alien_dx', 'nearest_alien_dy', 'nearest_alien_distance'
+]
+
+
+def load_recording(path: Path, sessions=None, last_sessions=None, min_score=None, sparse=False):
+    """Stream the selected segments of a recording into feature and label arrays.
+
+    Frames skipped by the recording policy are rebuilt unless `sparse`.
+    """
+    where = None if min_score is None else lambda segment: segment['stats'].get('score', {}).get('max', 0) >= min_score
+    segments = select_segments(path, sessions, last_sessions, where)
+    print(f"Reading {len(segments)} segments ({sum(segment['rows'] for segment in segments)} rows)")
+
+    X_parts, y_parts = [], []
+    features = None
+    for rows in (iter_segments if sparse else iter_dense_segments)(path, segments):
+        features = [c for c in NUMERIC_COLS if c in rows.dtype.names]
+        # Same cleanup as for CSV logs: missing values (NaN) become 0
+        X_parts.append(np.nan_to_num(np.column_stack([rows[c].astype(np.float64) for c in features])))
+        y_parts.append(rows['mouse_fire'].astype(int))
+
+    if not X_parts:
+        return np.zeros((0, len(NUMERIC_COLS))), np.zeros(0, dtype=int), NUMERIC_COLS
+    return np.concatenate(X_parts), np.concatenate(y_parts), features
+
+
+def load_and_preprocess(path: Path, **selection):
+    # A recording directory (see src/recording/storage.py), or a CSV log
+    if path.is_dir():
+        return load_recording(path, **selection)
     df = pd.read_csv(path)
 
     # Basic cleanup: drop rows with no label
     df = df[df['mouse_fire'].notna()]
 
     # Fill NA for numeric with 0
-    numeric_cols = [
-        'score', 'ships_left', 'health', 'ship_x', 'ship_y', 'ship_angle',
-        'moving_left', 'moving_right', 'moving_up', 'moving_down',
-        'mouse_x', 'mouse_y', 'bullets_count', 'aliens_count',
-        'nearest_alien_dx', 'nearest_alien_dy', 'nearest_alien_distance'
-    ]
-    for c in numeric_cols:
+    for c in NUMERIC_COLS:
         if c in df.columns:
             df[c] = pd.to_numeric(df[c], errors='coerce').fillna(0)
 
     # Features
-    features = [c for c in numeric_cols if c in df.columns]
+    features = [c for c in NUMERIC_COLS if c in df.columns]
 
     X = df[features].values
     y = df['mouse_fire'].astype(int).values
@@ -91,13 +127,22 @@ def train_and_eval(X, y):
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--data', type=str, default=str(DATA_PATH))
+    # Segment selection, for recordings
+    parser.add_argument('--sessions', nargs='+', help='only these sessions')
+    parser.add_argument('--last-sessions', type=int, help='only the N most recent sessions')
+    parser.add_argument('--min-score', type=int, help='only segments reaching this score')
+    parser.add_argument('--sparse', action='store_true', help="don't rebuild frames skipped by the recording policy")
     args = parser.parse_args()
 
     if not Path(args.data).exists():
         print(f"Data file not found: {args.data}")
         return
 
-    X, y, features = load_and_preprocess(Path(args.data))
+    selection = {}
+    if Path(args.data).is_dir():
+        selection = {'sessions': args.sessions, 'last_sessions': args.last_sessions, 'min_score': args.min_score,
+                     'sparse': args.sparse}
+    X, y, features = load_and_preprocess(Path(args.data), **selection)
     print(f"Loaded data. Features: {features}. Samples: {len(y)}")
 
     train_and_eval(X, y)